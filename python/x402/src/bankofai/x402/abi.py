@@ -5,6 +5,11 @@ Shared ABI definitions for smart contracts
 import json
 from typing import Any, List
 
+try:
+    from Crypto.Hash import keccak as _keccak
+except ImportError:
+    _keccak = None  # type: ignore[assignment]
+
 # EIP-712 Primary Type for PaymentPermit
 PAYMENT_PERMIT_PRIMARY_TYPE = "PaymentPermitDetails"
 
@@ -132,8 +137,43 @@ PAYMENT_PERMIT_ABI: List[dict[str, Any]] = [
 ]
 
 
+# EIP-712 type definitions for PaymentPermit, see get_payment_permit_eip712_types
+_PAYMENT_PERMIT_EIP712_TYPES: dict[str, Any] = {
+    "PermitMeta": [
+        {"name": "kind", "type": "uint8"},
+        {"name": "paymentId", "type": "bytes16"},
+        {"name": "nonce", "type": "uint256"},
+        {"name": "validAfter", "type": "uint256"},
+        {"name": "validBefore", "type": "uint256"},
+    ],
+    "Payment": [
+        {"name": "payToken", "type": "address"},
+        {"name": "payAmount", "type": "uint256"},
+        {"name": "payTo", "type": "address"},
+    ],
+    "Fee": [
+        {"name": "feeTo", "type": "address"},
+        {"name": "feeAmount", "type": "uint256"},
+    ],
+    "PaymentPermitDetails": [
+        {"name": "meta", "type": "PermitMeta"},
+        {"name": "buyer", "type": "address"},
+        {"name": "caller", "type": "address"},
+        {"name": "payment", "type": "Payment"},
+        {"name": "fee", "type": "Fee"},
+    ],
+}
+
+
 def get_abi_json(abi: List[dict[str, Any]]) -> str:
-    """Convert ABI list to JSON string"""
+    """Convert ABI list to JSON string
+
+    ABIs defined in this module are serialized once at import time; the same
+    string object is returned on every call.
+    """
+    cached = _ABI_JSON.get(id(abi))
+    if cached is not None:
+        return cached
     return json.dumps(abi)
 
 
@@ -151,37 +191,65 @@ def get_payment_permit_eip712_types() -> dict[str, Any]:
       "address caller,Payment payment,Fee fee)..."
 
     Note: The primary type name is "PaymentPermitDetails" to match the contract's typehash.
+
+    Each call returns a fresh copy, so callers may modify it freely.
     """
     return {
-        "PermitMeta": [
-            {"name": "kind", "type": "uint8"},
-            {"name": "paymentId", "type": "bytes16"},
-            {"name": "nonce", "type": "uint256"},
-            {"name": "validAfter", "type": "uint256"},
-            {"name": "validBefore", "type": "uint256"},
-        ],
-        "Payment": [
-            {"name": "payToken", "type": "address"},
-            {"name": "payAmount", "type": "uint256"},
-            {"name": "payTo", "type": "address"},
-        ],
-        "Fee": [
-            {"name": "feeTo", "type": "address"},
-            {"name": "feeAmount", "type": "uint256"},
-        ],
-        "PaymentPermitDetails": [
-            {"name": "meta", "type": "PermitMeta"},
-            {"name": "buyer", "type": "address"},
-            {"name": "caller", "type": "address"},
-            {"name": "payment", "type": "Payment"},
-            {"name": "fee", "type": "Fee"},
-        ],
+        name: [dict(field) for field in fields]
+        for name, fields in _PAYMENT_PERMIT_EIP712_TYPES.items()
     }
 
 
+def _find_function_abi(abi: List[dict[str, Any]], method_name: str) -> dict[str, Any]:
+    """Find a function definition in an ABI list.
+
+    Raises:
+        ValueError: If function not found in ABI
+    """
+    for item in abi:
+        if item.get("type") == "function" and item.get("name") == method_name:
+            return item
+    raise ValueError(f"Function '{method_name}' not found in ABI")
+
+
+def _get_type_string(param: dict[str, Any]) -> str:
+    """Recursively build parameter type string"""
+    param_type = param["type"]
+    if param_type == "tuple":
+        # For tuple, recursively build its components
+        components = param.get("components", [])
+        if not components:
+            return "tuple"
+        component_types = [_get_type_string(c) for c in components]
+        return f"({','.join(component_types)})"
+    return param_type
+
+
+def _signature_of(func_abi: dict[str, Any]) -> str:
+    """Build the canonical signature of a function ABI entry"""
+    input_types = [_get_type_string(inp) for inp in func_abi.get("inputs", [])]
+    return f"{func_abi['name']}({','.join(input_types)})"
+
+
+def _build_function_signature(abi: List[dict[str, Any]], method_name: str) -> str:
+    return _signature_of(_find_function_abi(abi, method_name))
+
+
+def _keccak_method_id(function_signature: str) -> str:
+    if _keccak is None:
+        raise ImportError("pycryptodome is required to calculate method IDs")
+
+    # Method ID is the first 4 bytes of Keccak256
+    k = _keccak.new(digest_bits=256)
+    k.update(function_signature.encode())
+    return k.hexdigest()[:8]
+
+
 def calculate_method_id(abi: List[dict[str, Any]], method_name: str) -> str:
     """Calculate Method ID from ABI dynamically.
 
+    Method IDs of the ABIs defined in this module are precomputed at import.
+
     Args:
         abi: Contract ABI definition list
         method_name: Function name
@@ -196,48 +264,17 @@ def calculate_method_id(abi: List[dict[str, Any]], method_name: str) -> str:
         >>> method_id = calculate_method_id(PAYMENT_PERMIT_ABI, "permitTransferFrom")
         >>> print(method_id)  # "c13f2d68"
     """
-    from Crypto.Hash import keccak
-
-    # Find function definition in ABI
-    func_abi = None
-    for item in abi:
-        if item.get("type") == "function" and item.get("name") == method_name:
-            func_abi = item
-            break
-
-    if not func_abi:
-        raise ValueError(f"Function '{method_name}' not found in ABI")
-
-    # Build function signature
-    def get_type_string(param: dict[str, Any]) -> str:
-        """Recursively build parameter type string"""
-        param_type = param["type"]
-
-        if param_type == "tuple":
-            # For tuple, recursively build its components
-            components = param.get("components", [])
-            if not components:
-                return "tuple"
-            component_types = [get_type_string(c) for c in components]
-            return f"({','.join(component_types)})"
-        else:
-            return param_type
-
-    # Build complete function signature
-    input_types = [get_type_string(inp) for inp in func_abi.get("inputs", [])]
-    function_signature = f"{method_name}({','.join(input_types)})"
-
-    # Calculate Method ID (first 4 bytes of Keccak256)
-    k = keccak.new(digest_bits=256)
-    k.update(function_signature.encode())
-    method_id = k.hexdigest()[:8]
-
-    return method_id
+    method_id = _METHOD_IDS.get(id(abi), {}).get(method_name)
+    if method_id is not None:
+        return method_id
+    return _keccak_method_id(_build_function_signature(abi, method_name))
 
 
 def get_function_signature(abi: List[dict[str, Any]], method_name: str) -> str:
     """Get complete function signature string.
 
+    Signatures of the ABIs defined in this module are precomputed at import.
+
     Args:
         abi: Contract ABI definition list
         method_name: Function name
@@ -250,29 +287,10 @@ def get_function_signature(abi: List[dict[str, Any]], method_name: str) -> str:
         >>> sig = get_function_signature(PAYMENT_PERMIT_ABI, "permitTransferFrom")
         >>> print(sig)
     """
-
-    func_abi = None
-    for item in abi:
-        if item.get("type") == "function" and item.get("name") == method_name:
-            func_abi = item
-            break
-
-    if not func_abi:
-        raise ValueError(f"Function '{method_name}' not found in ABI")
-
-    def get_type_string(param: dict[str, Any]) -> str:
-        param_type = param["type"]
-        if param_type == "tuple":
-            components = param.get("components", [])
-            if not components:
-                return "tuple"
-            component_types = [get_type_string(c) for c in components]
-            return f"({','.join(component_types)})"
-        else:
-            return param_type
-
-    input_types = [get_type_string(inp) for inp in func_abi.get("inputs", [])]
-    return f"{method_name}({','.join(input_types)})"
+    signature = _SIGNATURES.get(id(abi), {}).get(method_name)
+    if signature is not None:
+        return signature
+    return _build_function_signature(abi, method_name)
 
 
 def get_all_method_ids(abi: List[dict[str, Any]]) -> dict[str, str]:
@@ -294,13 +312,50 @@ def get_all_method_ids(abi: List[dict[str, Any]]) -> dict[str, str]:
             'nonceUsed': '1647795e'
         }
     """
-    result = {}
+    precomputed = _METHOD_IDS.get(id(abi))
+    if precomputed is not None:
+        return dict(precomputed)
+
+    return {
+        name: _keccak_method_id(signature) for name, signature in _function_signatures(abi).items()
+    }
+
+
+def _function_signatures(abi: List[dict[str, Any]]) -> dict[str, str]:
+    """Signatures of all functions in an ABI, built in a single pass.
+
+    Like _find_function_abi, the first definition of an overloaded name wins.
+    Malformed entries are skipped.
+    """
+    signatures: dict[str, str] = {}
     for item in abi:
-        if item.get("type") == "function":
-            method_name = item.get("name")
-            if method_name:
-                try:
-                    result[method_name] = calculate_method_id(abi, method_name)
-                except Exception:
-                    pass
-    return result
+        name = item.get("name")
+        if item.get("type") == "function" and name and name not in signatures:
+            try:
+                signatures[name] = _signature_of(item)
+            except Exception:
+                pass
+    return signatures
+
+
+# Precomputed tables for the module-level ABIs, keyed by id() of the list.
+# These lists live for the whole process and are treated as constants.
+_SIGNATURES: dict[int, dict[str, str]] = {
+    id(ERC20_ABI): _function_signatures(ERC20_ABI),
+    id(PAYMENT_PERMIT_ABI): _function_signatures(PAYMENT_PERMIT_ABI),
+}
+_METHOD_IDS: dict[int, dict[str, str]] = {}
+try:
+    _METHOD_IDS.update(
+        {
+            abi_id: {name: _keccak_method_id(sig) for name, sig in signatures.items()}
+            for abi_id, signatures in _SIGNATURES.items()
+        }
+    )
+except ImportError:
+    # pycryptodome is optional; method IDs are computed on demand instead
+    pass
+_ABI_JSON: dict[int, str] = {
+    id(ERC20_ABI): json.dumps(ERC20_ABI),
+    id(PAYMENT_PERMIT_ABI): json.dumps(PAYMENT_PERMIT_ABI),
+}
@@ -11,6 +11,10 @@ from bankofai.x402.utils.address import normalize_tron_address, tron_address_to_
 class AddressConverter(ABC):
     """Abstract base class for address converters"""
 
+    # True when convert_message_addresses returns the message unchanged, so
+    # callers can skip the call
+    IS_NOOP: bool = False
+
     @abstractmethod
     def normalize(self, address: str) -> str:
         """Normalize address format"""
@@ -28,11 +32,17 @@ class AddressConverter(ABC):
 
     def convert_message_addresses(self, message: dict[str, Any]) -> dict[str, Any]:
         """Convert all addresses in message to EVM format (for EIP-712 signing)"""
-        message["buyer"] = self.to_evm_format(message["buyer"])
-        message["caller"] = self.to_evm_format(message["caller"])
-        message["payment"]["payToken"] = self.to_evm_format(message["payment"]["payToken"])
-        message["payment"]["payTo"] = self.to_evm_format(message["payment"]["payTo"])
-        message["fee"]["feeTo"] = self.to_evm_format(message["fee"]["feeTo"])
+        to_evm_format = self.to_evm_format
+        payment = message["payment"]
+        fee = message["fee"]
+        for container, key in (
+            (message, "buyer"),
+            (message, "caller"),
+            (payment, "payToken"),
+            (payment, "payTo"),
+            (fee, "feeTo"),
+        ):
+            container[key] = to_evm_format(container[key])
         return message
 
 
@@ -40,6 +50,7 @@ class EvmAddressConverter(AddressConverter):
     """EVM address converter"""
 
     ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+    IS_NOOP = True
 
     def normalize(self, address: str) -> str:
         """EVM addresses do not need normalization"""
@@ -61,6 +72,7 @@ class TronAddressConverter(AddressConverter):
     """TRON address converter"""
 
     ZERO_ADDRESS = "T9yD14Nj9j7xAB4dbGeiX9h8unkKHxuWwb"
+    IS_NOOP = False
 
     def normalize(self, address: str) -> str:
         """Normalize TRON address"""
@@ -1,16 +1,32 @@
 """
 x402 Client SDK
+
+Exports are resolved lazily (PEP 562) so importing this package does not load
+the HTTP client stack until one of the classes is first used.
 """
 
-# Classes
-from bankofai.x402.clients.policies import SufficientBalancePolicy
-from bankofai.x402.clients.token_selection import (
-    CheapestTokenSelectionStrategy,
-    DefaultTokenSelectionStrategy,
-    TokenSelectionStrategy,
-)
-from bankofai.x402.clients.x402_client import PaymentPolicy, X402Client
-from bankofai.x402.clients.x402_http_client import X402HttpClient
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from bankofai.x402.clients.policies import SufficientBalancePolicy
+    from bankofai.x402.clients.token_selection import (
+        CheapestTokenSelectionStrategy,
+        DefaultTokenSelectionStrategy,
+        TokenSelectionStrategy,
+    )
+    from bankofai.x402.clients.x402_client import PaymentPolicy, X402Client
+    from bankofai.x402.clients.x402_http_client import X402HttpClient
+
+# Export name -> defining module
+_EXPORTS = {
+    "CheapestTokenSelectionStrategy": "bankofai.x402.clients.token_selection",
+    "DefaultTokenSelectionStrategy": "bankofai.x402.clients.token_selection",
+    "PaymentPolicy": "bankofai.x402.clients.x402_client",
+    "SufficientBalancePolicy": "bankofai.x402.clients.policies",
+    "TokenSelectionStrategy": "bankofai.x402.clients.token_selection",
+    "X402Client": "bankofai.x402.clients.x402_client",
+    "X402HttpClient": "bankofai.x402.clients.x402_http_client",
+}
 
 __all__ = [
     "CheapestTokenSelectionStrategy",
@@ -21,3 +37,19 @@ __all__ = [
     "X402Client",
     "X402HttpClient",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,8 +4,10 @@ Payment policies for filtering or reordering payment requirements.
 Policies are applied in order after mechanism filtering and before token selection.
 """
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any
 
 from bankofai.x402.tokens import TokenRegistry
 from bankofai.x402.types import PaymentRequirements
@@ -15,11 +17,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-
-def _get_decimals(req: PaymentRequirements) -> int:
-    """Look up token decimals from the registry, default to 6."""
-    token = TokenRegistry.find_by_address(req.network, req.asset)
-    return token.decimals if token else 6
+# How long (seconds) an observed balance is reused across policy invocations
+BALANCE_CACHE_TTL = 2.0
 
 
 class SufficientBalancePolicy:
@@ -45,34 +44,34 @@ class SufficientBalancePolicy:
 
     def __init__(self, client: "X402Client") -> None:
         self._client = client
+        # Recently observed balances: (signer, network, token) -> (balance, monotonic time)
+        self._balance_cache: dict[tuple[Any, str, str], tuple[int, float]] = {}
 
     async def apply(
         self,
         requirements: list[PaymentRequirements],
     ) -> list[PaymentRequirements]:
-        affordable: list[PaymentRequirements] = []
-        for req in requirements:
-            signer = self._client.resolve_signer(req.scheme, req.network)
-            if signer is None:
-                # No signer for this network — keep the requirement so
-                # mechanism matching can still select it.
-                affordable.append(req)
-                continue
+        # Query each distinct balance once, all concurrently; total latency is
+        # the slowest RPC
+        keys = [self._balance_key(req) for req in requirements]
+        unique = list(dict.fromkeys(key for key in keys if key is not None))
+        results = await asyncio.gather(*(self._check_balance(*key) for key in unique))
+        by_key = dict(zip(unique, results))
+        balances = [None if key is None else by_key[key] for key in keys]
 
-            try:
-                balance = await signer.check_balance(req.asset, req.network)
-            except Exception:
-                # Signer cannot query this network; keep the requirement.
+        affordable: list[PaymentRequirements] = []
+        for req, balance in zip(requirements, balances):
+            if balance is None:
                 affordable.append(req)
                 continue
 
-            needed = int(req.amount)
-            if hasattr(req, "extra") and req.extra and hasattr(req.extra, "fee"):
-                fee = req.extra.fee
-                if fee and hasattr(fee, "fee_amount"):
-                    needed += int(fee.fee_amount)
-            decimals = _get_decimals(req)
+            extra = req.extra
+            fee = extra.fee if extra else None
+            fee_amount = int(fee.fee_amount) if fee else 0
+            needed = int(req.amount) + fee_amount
+            # One registry lookup serves both decimals and symbol
             token_info = TokenRegistry.find_by_address(req.network, req.asset)
+            decimals = token_info.decimals if token_info else 6
             symbol = token_info.symbol if token_info else req.asset[:8]
             divisor = 10**decimals
             h_balance = balance / divisor
@@ -98,3 +97,30 @@ class SufficientBalancePolicy:
         if not affordable:
             logger.error("All payment requirements filtered: insufficient balance")
         return affordable
+
+    def _balance_key(self, req: PaymentRequirements) -> tuple[Any, str, str] | None:
+        """Return the balance lookup key for a requirement.
+
+        Returns None when there is no signer for its network, so the
+        requirement is kept unchecked and mechanism matching can still select it.
+        """
+        signer = self._client.resolve_signer(req.scheme, req.network)
+        if signer is None:
+            return None
+        return (signer, req.network, req.asset)
+
+    async def _check_balance(self, signer: Any, network: str, asset: str) -> int | None:
+        """Return the signer's balance of a token, reusing a recent observation.
+
+        Returns None (keep unchecked) when the signer cannot query the network.
+        """
+        key = (signer, network, asset)
+        cached = self._balance_cache.get(key)
+        if cached is not None and time.monotonic() - cached[1] < BALANCE_CACHE_TTL:
+            return cached[0]
+        try:
+            balance: int = await signer.check_balance(asset, network)
+        except Exception:
+            return None
+        self._balance_cache[key] = (balance, time.monotonic())
+        return balance
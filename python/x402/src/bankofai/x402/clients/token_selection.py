@@ -6,6 +6,7 @@ All tokens are assumed to be stablecoins, so selection normalizes raw amounts
 by token decimals to compare real value (lower is better for the payer).
 """
 
+import functools
 import logging
 from decimal import Decimal
 from typing import Protocol, runtime_checkable
@@ -49,14 +50,21 @@ def _get_decimals(req: PaymentRequirements) -> int:
     return token.decimals if token else 6
 
 
-def _normalized_cost(req: PaymentRequirements) -> Decimal:
+@functools.lru_cache(maxsize=64)
+def _pow10(decimals: int) -> Decimal:
+    """Return Decimal(10) ** decimals, computed once per precision."""
+    return Decimal(10) ** decimals
+
+
+def _normalized_cost(req: PaymentRequirements, decimals: int | None = None) -> Decimal:
     """Calculate total cost normalized to human-readable units.
 
     e.g. 1_000_000 raw with 6 decimals  -> 1.0
          1_000_000_000_000_000_000 raw with 18 decimals -> 1.0
     """
-    decimals = _get_decimals(req)
-    return Decimal(str(req.amount)) / Decimal(10) ** decimals
+    if decimals is None:
+        decimals = _get_decimals(req)
+    return Decimal(req.amount) / _pow10(decimals)
 
 
 class CheapestTokenSelectionStrategy:
@@ -73,12 +81,31 @@ class CheapestTokenSelectionStrategy:
         if not accepts:
             raise ValueError("No payment options available")
 
-        selected = min(accepts, key=_normalized_cost)
+        decimals = [_get_decimals(req) for req in accepts]
+
+        # Strict "<" keeps the first option on ties.
+        if len(set(decimals)) == 1:
+            # Same precision everywhere: raw amounts already rank correctly
+            selected = accepts[0]
+            amount = int(selected.amount)
+            for req in accepts[1:]:
+                req_amount = int(req.amount)
+                if req_amount < amount:
+                    amount, selected = req_amount, req
+            cost = _normalized_cost(selected, decimals[0])
+        else:
+            # Cost each option once; the winner's cost is reused for logging
+            selected = accepts[0]
+            cost = _normalized_cost(selected, decimals[0])
+            for req, req_decimals in zip(accepts[1:], decimals[1:]):
+                req_cost = _normalized_cost(req, req_decimals)
+                if req_cost < cost:
+                    cost, selected = req_cost, req
         logger.info(
             "Selected token %s on %s (normalized_cost=%.6f)",
             selected.asset,
             selected.network,
-            _normalized_cost(selected),
+            cost,
         )
         return selected
 
@@ -75,6 +75,10 @@ class MechanismEntry:
         self.pattern = pattern
         self.mechanism = mechanism
         self.priority = priority
+        self.scheme = mechanism.scheme()
+        # Wildcard patterns ("eip155:*") are parsed once here, not per lookup
+        self.is_prefix = pattern.endswith(":*")
+        self.prefix = pattern[:-1] if self.is_prefix else pattern
 
 
 class X402Client:
@@ -95,7 +99,11 @@ class X402Client:
             token_strategy: Strategy for selecting which token to pay with.
                             If None, uses first available option.
         """
-        self._mechanisms: list[MechanismEntry] = []
+        # Mechanisms registered for an exact network, keyed by (network, scheme);
+        # the first registration wins
+        self._exact_mechanisms: dict[tuple[str, str], ClientMechanism] = {}
+        # Wildcard ("eip155:*") entries in registration order
+        self._prefix_mechanisms: list[MechanismEntry] = []
         self._policies: list[PaymentPolicy] = []
         self._token_strategy = token_strategy
 
@@ -137,8 +145,11 @@ class X402Client:
         logger.info(
             f"Registering mechanism for pattern '{network_pattern}' with priority {priority}"
         )
-        self._mechanisms.append(MechanismEntry(network_pattern, mechanism, priority))
-        self._mechanisms.sort(key=lambda e: e.priority, reverse=True)
+        entry = MechanismEntry(network_pattern, mechanism, priority)
+        if entry.is_prefix:
+            self._prefix_mechanisms.append(entry)
+        else:
+            self._exact_mechanisms.setdefault((network_pattern, entry.scheme), mechanism)
         return self
 
     async def select_payment_requirements(
@@ -163,32 +174,32 @@ class X402Client:
             ValueError: No supported payment requirements found
         """
         logger.info(f"Selecting payment requirements from {len(accepts)} options")
-        logger.debug(f"Available payment requirements: {[r.model_dump() for r in accepts]}")
-
-        candidates = list(accepts)
-
-        if filters:
-            if hasattr(filters, "scheme") and filters.scheme:
-                candidates = [r for r in candidates if r.scheme == filters.scheme]
-                logger.debug(f"After scheme filter: {len(candidates)} candidates")
-            if hasattr(filters, "network") and filters.network:
-                candidates = [r for r in candidates if r.network == filters.network]
-                logger.debug(f"After network filter: {len(candidates)} candidates")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available payment requirements: %s", [r.model_dump() for r in accepts])
 
+        want_scheme = getattr(filters, "scheme", None) if filters else None
+        want_network = getattr(filters, "network", None) if filters else None
         candidates = [
-            r for r in candidates if self._find_mechanism(r.scheme, r.network) is not None
+            r
+            for r in accepts
+            if (not want_scheme or r.scheme == want_scheme)
+            and (not want_network or r.network == want_network)
+            and self._is_supported(r.scheme, r.network)
         ]
-        logger.debug(f"After mechanism filter: {len(candidates)} candidates")
+        logger.debug("After scheme/network/mechanism filters: %d candidates", len(candidates))
 
         for policy in self._policies:
             candidates = await policy.apply(candidates)
-            logger.debug(f"After policy: {len(candidates)} candidates")
+            logger.debug("After policy: %d candidates", len(candidates))
 
         if not candidates:
             logger.error("No supported payment requirements found")
             raise UnsupportedNetworkError("No supported payment requirements found")
 
-        if self._token_strategy:
+        if len(candidates) == 1:
+            # Nothing to choose between; skip the strategy
+            selected = candidates[0]
+        elif self._token_strategy:
             selected = await self._token_strategy.select(candidates)
         else:
             from bankofai.x402.clients.token_selection import DefaultTokenSelectionStrategy
@@ -235,7 +246,7 @@ class X402Client:
                 f"network={requirements.network}"
             )
 
-        logger.debug(f"Using mechanism: {mechanism.__class__.__name__}")
+        logger.debug("Using mechanism: %s", mechanism.__class__.__name__)
         payload = await mechanism.create_payment_payload(requirements, resource, extensions)
         logger.info("Payment payload created successfully")
         return payload
@@ -268,19 +279,24 @@ class X402Client:
 
     def _find_mechanism(self, scheme: str, network: str) -> ClientMechanism | None:
         """Find mechanism for scheme and network"""
-        for entry in self._mechanisms:
-            if entry.mechanism.scheme() == scheme and self._match_pattern(entry.pattern, network):
+        # Exact patterns always outrank wildcards, so check them first
+        mechanism = self._exact_mechanisms.get((network, scheme))
+        if mechanism is not None:
+            return mechanism
+        for entry in self._prefix_mechanisms:
+            if entry.scheme == scheme and self._match_pattern(entry, network):
                 return entry.mechanism
         return None
 
-    def _match_pattern(self, pattern: str, network: str) -> bool:
-        """Match network against pattern"""
-        if pattern == network:
-            return True
-        if pattern.endswith(":*"):
-            prefix = pattern[:-1]
-            return network.startswith(prefix)
-        return False
+    def _is_supported(self, scheme: str, network: str) -> bool:
+        """Whether any registered mechanism handles scheme on network"""
+        return self._find_mechanism(scheme, network) is not None
+
+    def _match_pattern(self, entry: MechanismEntry, network: str) -> bool:
+        """Match network against an entry's pattern"""
+        if entry.is_prefix:
+            return network.startswith(entry.prefix)
+        return entry.pattern == network
 
     def _calculate_priority(self, pattern: str) -> int:
         """Calculate priority for pattern (more specific = higher priority)"""
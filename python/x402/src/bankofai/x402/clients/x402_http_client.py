@@ -76,13 +76,12 @@ class X402HttpClient:
             return response
 
         logger.info("Received 402 Payment Required, processing payment...")
-        logger.debug(f"Response headers: {dict(response.headers)}")
-
-        try:
-            response_text = response.text
-            logger.debug(f"Response body: {response_text[:500]}")  # Log first 500 chars
-        except Exception as e:
-            logger.warning(f"Could not read response body: {e}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response headers: %s", dict(response.headers))
+            try:
+                logger.debug("Response body: %s", response.text[:500])  # Log first 500 chars
+            except Exception as e:
+                logger.warning(f"Could not read response body: {e}")
 
         payment_required = self._parse_payment_required(response)
         if payment_required is None:
@@ -94,7 +93,7 @@ class X402HttpClient:
         extensions_dict = None
         if payment_required.extensions:
             extensions_dict = payment_required.extensions.model_dump(by_alias=True)
-            logger.debug(f"Payment extensions: {extensions_dict}")
+            logger.debug("Payment extensions: %s", extensions_dict)
 
         try:
             payment_payload = await self._x402_client.handle_payment(
@@ -132,7 +131,7 @@ class X402HttpClient:
 
         header_value = response.headers.get(PAYMENT_REQUIRED_HEADER)
         if header_value:
-            logger.debug(f"Found {PAYMENT_REQUIRED_HEADER} header, attempting to decode")
+            logger.debug("Found %s header, attempting to decode", PAYMENT_REQUIRED_HEADER)
             try:
                 payment_required = decode_payment_payload(header_value, PaymentRequired)
                 logger.info("Successfully parsed PaymentRequired from header")
@@ -166,7 +165,7 @@ class X402HttpClient:
         """Retry request with payment payload"""
         logger.info("Retrying request with payment signature")
         encoded_payload = encode_payment_payload(payment_payload)
-        logger.debug(f"Encoded payment payload length: {len(encoded_payload)} chars")
+        logger.debug("Encoded payment payload length: %d chars", len(encoded_payload))
 
         headers = dict(kwargs.get("headers", {}))
         headers[PAYMENT_SIGNATURE_HEADER] = encoded_payload
@@ -3,10 +3,35 @@ X402 Network Configuration
 Centralized configuration for contract addresses and network settings
 """
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping
 
 from bankofai.x402.exceptions import UnsupportedNetworkError
 
+# Read-only lookup tables shared by NetworkConfig; module-level so the hot
+# lookups below avoid a class attribute hop
+_CHAIN_IDS: Mapping[str, int] = MappingProxyType(
+    {
+        "tron:mainnet": 728126428,  # 0x2b6653dc
+        "tron:shasta": 2494104990,  # 0x94a9059e
+        "tron:nile": 3448148188,  # 0xcd8690dc
+        "eip155:1": 1,
+        "eip155:11155111": 11155111,
+        "eip155:56": 56,
+        "eip155:97": 97,
+    }
+)
+
+_PAYMENT_PERMIT_ADDRESSES: Mapping[str, str] = MappingProxyType(
+    {
+        "tron:mainnet": "TT8rEWbCoNX7vpEUauxb7rWJsTgs8vDLAn",
+        "tron:shasta": "TR2XninQ3jsvRRLGTifFyUHTBysffooUjt",
+        "tron:nile": "TFxDcGvS7zfQrS1YzcCMp673ta2NHHzsiH",
+        "eip155:97": "0x1825bB32db3443dEc2cc7508b2D818fc13EaD878",
+        "eip155:56": "0x1825bB32db3443dEc2cc7508b2D818fc13EaD878",
+    }
+)
+
 
 class NetworkConfig:
     """Network configuration for contract addresses and chain IDs"""
@@ -23,24 +48,10 @@ class NetworkConfig:
     BSC_TESTNET = "eip155:97"
 
     # TRON Chain IDs
-    CHAIN_IDS: Dict[str, int] = {
-        "tron:mainnet": 728126428,  # 0x2b6653dc
-        "tron:shasta": 2494104990,  # 0x94a9059e
-        "tron:nile": 3448148188,  # 0xcd8690dc
-        "eip155:1": 1,
-        "eip155:11155111": 11155111,
-        "eip155:56": 56,
-        "eip155:97": 97,
-    }
+    CHAIN_IDS: Mapping[str, int] = _CHAIN_IDS
 
     # PaymentPermit contract addresses
-    PAYMENT_PERMIT_ADDRESSES: Dict[str, str] = {
-        "tron:mainnet": "TT8rEWbCoNX7vpEUauxb7rWJsTgs8vDLAn",
-        "tron:shasta": "TR2XninQ3jsvRRLGTifFyUHTBysffooUjt",
-        "tron:nile": "TFxDcGvS7zfQrS1YzcCMp673ta2NHHzsiH",
-        "eip155:97": "0x1825bB32db3443dEc2cc7508b2D818fc13EaD878",
-        "eip155:56": "0x1825bB32db3443dEc2cc7508b2D818fc13EaD878",
-    }
+    PAYMENT_PERMIT_ADDRESSES: Mapping[str, str] = _PAYMENT_PERMIT_ADDRESSES
 
     # RPC URLs for EVM networks
     RPC_URLS: Dict[str, str] = {
@@ -61,8 +72,8 @@ class NetworkConfig:
         """
         return cls.RPC_URLS.get(network)
 
-    @classmethod
-    def get_chain_id(cls, network: str) -> int:
+    @staticmethod
+    def get_chain_id(network: str) -> int:
         """Get chain ID for network
 
         Args:
@@ -81,13 +92,13 @@ class NetworkConfig:
             except (ValueError, IndexError):
                 raise UnsupportedNetworkError(f"Invalid EVM network: {network}")
 
-        chain_id = cls.CHAIN_IDS.get(network)
+        chain_id = _CHAIN_IDS.get(network)
         if chain_id is None:
             raise UnsupportedNetworkError(f"Unsupported network: {network}")
         return chain_id
 
-    @classmethod
-    def get_payment_permit_address(cls, network: str) -> str:
+    @staticmethod
+    def get_payment_permit_address(network: str) -> str:
         """Get PaymentPermit contract address for network
 
         Args:
@@ -96,7 +107,7 @@ class NetworkConfig:
         Returns:
             Contract address (Base58 for TRON, 0x-hex for EVM)
         """
-        addr = cls.PAYMENT_PERMIT_ADDRESSES.get(network)
+        addr = _PAYMENT_PERMIT_ADDRESSES.get(network)
         if addr is not None:
             return addr
         # EVM fallback: zero address
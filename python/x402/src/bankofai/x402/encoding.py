@@ -6,6 +6,8 @@ import base64
 import json
 from typing import Any, TypeVar
 
+from pydantic import TypeAdapter
+
 T = TypeVar("T")
 
 
@@ -35,8 +37,24 @@ def encode_payment_payload(payload: Any) -> str:
     return encode_base64(json_str)
 
 
+# Validators per pydantic model class, built on first use
+_type_adapters: dict[type[Any], TypeAdapter[Any]] = {}
+
+
+def _type_adapter(model_class: type[Any]) -> TypeAdapter[Any]:
+    """Build the validator for a pydantic model once and reuse it."""
+    adapter = _type_adapters.get(model_class)
+    if adapter is None:
+        adapter = _type_adapters[model_class] = TypeAdapter(model_class)
+    return adapter
+
+
 def decode_payment_payload(encoded: str, model_class: type[T] | None = None) -> T | dict[str, Any]:
     """Decode payment payload from base64 HTTP header"""
+    if model_class is not None and hasattr(model_class, "model_validate_json"):
+        # Validate straight from the JSON bytes, skipping the intermediate dict
+        model: T = _type_adapter(model_class).validate_json(decode_base64_bytes(encoded))
+        return model
     json_str = decode_base64(encoded)
     data = json.loads(json_str)
     if model_class is not None:
@@ -55,7 +55,7 @@ class X402Facilitator:
     """
 
     def __init__(self) -> None:
-        self._mechanisms: dict[str, dict[str, FacilitatorMechanism]] = {}
+        self._mechanisms: dict[tuple[str, str], FacilitatorMechanism] = {}
 
     def register(
         self,
@@ -74,9 +74,7 @@ class X402Facilitator:
         """
         scheme = mechanism.scheme()
         for network in networks:
-            if network not in self._mechanisms:
-                self._mechanisms[network] = {}
-            self._mechanisms[network][scheme] = mechanism
+            self._mechanisms[(network, scheme)] = mechanism
         return self
 
     def supported(self, pricing: str = "flat") -> SupportedResponse:
@@ -90,15 +88,14 @@ class X402Facilitator:
             SupportedResponse with all supported capabilities
         """
         kinds: list[SupportedKind] = []
-        for network, schemes in self._mechanisms.items():
-            for scheme in schemes:
-                kinds.append(
-                    SupportedKind(
-                        x402Version=2,
-                        scheme=scheme,
-                        network=network,
-                    )
+        for network, scheme in self._mechanisms:
+            kinds.append(
+                SupportedKind(
+                    x402Version=2,
+                    scheme=scheme,
+                    network=network,
                 )
+            )
 
         return SupportedResponse(kinds=kinds)
 
@@ -182,7 +179,4 @@ class X402Facilitator:
 
     def _find_mechanism(self, network: str, scheme: str) -> FacilitatorMechanism | None:
         """Find mechanism for network and scheme"""
-        network_mechanisms = self._mechanisms.get(network)
-        if network_mechanisms is None:
-            return None
-        return network_mechanisms.get(scheme)
+        return self._mechanisms.get((network, scheme))
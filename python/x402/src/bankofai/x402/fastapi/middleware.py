@@ -2,24 +2,113 @@
 FastAPI middleware for x402 payment processing
 """
 
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable
+from typing import Any, Callable
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 
-from bankofai.x402.encoding import decode_payment_payload, encode_payment_payload
+from bankofai.x402.encoding import decode_payment_payload, encode_base64, encode_payment_payload
 from bankofai.x402.server import ResourceConfig, X402Server
+from bankofai.x402.tokens import TokenRegistry
 from bankofai.x402.types import PaymentPayload, PaymentRequirements
+from bankofai.x402.utils.tx_verification import (
+    TransactionVerificationResult,
+    get_verifier_for_network,
+)
 
-if TYPE_CHECKING:
-    from bankofai.x402.utils.tx_verification import TransactionVerificationResult
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
 
 PAYMENT_SIGNATURE_HEADER = "PAYMENT-SIGNATURE"
 PAYMENT_REQUIRED_HEADER = "PAYMENT-REQUIRED"
 PAYMENT_RESPONSE_HEADER = "PAYMENT-RESPONSE"
 
 
+async def _await_shared(future: "asyncio.Future[Any]") -> Any:
+    """Await a build shared between requests.
+
+    Finished builds are read directly, which also works across event loops.
+    Pending ones are shielded so a cancelled request does not cancel them.
+    """
+    if future.done():
+        return future.result()
+    return await asyncio.shield(future)
+
+
+def _quote_expired(future: "asyncio.Future[_RequirementsBuild]") -> bool:
+    """Whether a finished requirements build holds an expired fee quote"""
+    if not future.done() or future.cancelled() or future.exception() is not None:
+        return False
+    expires_at = future.result()[1]
+    return expires_at is not None and time.time() >= expires_at
+
+
+class _PaymentJSONResponse(JSONResponse):
+    """JSONResponse for the middleware's own 402/error bodies.
+
+    Serialized with orjson when it is installed. Endpoint results keep the
+    standard JSONResponse so their encoding rules do not change.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if _orjson is None:
+            return super().render(content)
+        return _orjson.dumps(content)
+
+
+# Decoded PAYMENT-SIGNATURE headers, keyed by a digest of the raw header.
+# Replayed headers (verify then settle, client retries) skip base64/JSON/model
+# parsing. Cached payloads are shared and must be treated as read-only.
+PAYLOAD_CACHE_SIZE = 4096
+_payload_cache: OrderedDict[bytes, PaymentPayload] = OrderedDict()
+_payload_cache_lock = threading.Lock()
+
+# How long (seconds) payment requirements built for a protected endpoint,
+# including facilitator fee quotes, are reused before being rebuilt. A build
+# is rebuilt sooner if one of its fee quotes expires first.
+REQUIREMENTS_CACHE_TTL = 60.0
+
+# Per-endpoint requirements cache: id(config) -> (shared build, start time).
+# A build yields the requirements and their earliest fee quote expiry.
+_RequirementsBuild = tuple[list[PaymentRequirements], int | None]
+_RequirementsCache = dict[int, tuple["asyncio.Future[_RequirementsBuild]", float]]
+
+# Successful on-chain transaction verifications, keyed by (network, tx_hash).
+# A settled transaction stays settled, so retries of the same payment skip
+# the RPC round trip. Failures are never cached. The cache itself is per
+# middleware instance (X402Middleware._tx_verify_cache).
+TX_VERIFY_CACHE_SIZE = 16384
+TX_VERIFY_CACHE_TTL = 600.0
+
+
+def _decode_payment_payload_cached(payment_header: str) -> PaymentPayload:
+    """Decode a PAYMENT-SIGNATURE header, reusing a previous decode if seen"""
+    key = hashlib.blake2b(payment_header.encode(), digest_size=16).digest()
+    with _payload_cache_lock:
+        payload = _payload_cache.get(key)
+        if payload is not None:
+            _payload_cache.move_to_end(key)
+            return payload
+
+    payload = decode_payment_payload(payment_header, PaymentPayload)
+    with _payload_cache_lock:
+        _payload_cache[key] = payload
+        if len(_payload_cache) > PAYLOAD_CACHE_SIZE:
+            _payload_cache.popitem(last=False)
+    return payload
+
+
 class X402Middleware:
     """
     FastAPI middleware for automatic 402 payment handling.
@@ -40,6 +129,9 @@ class X402Middleware:
 
     def __init__(self, server: X402Server) -> None:
         self._server = server
+        self._tx_verify_cache: OrderedDict[
+            tuple[str, str], tuple[TransactionVerificationResult, float]
+        ] = OrderedDict()
 
     def protect(
         self,
@@ -92,8 +184,6 @@ class X402Middleware:
         scheme_list = schemes
 
         # Validate all token symbols at startup
-        from bankofai.x402.tokens import TokenRegistry
-
         for p in price_list:
             TokenRegistry.parse_price(p, network)
 
@@ -108,6 +198,9 @@ class X402Middleware:
             )
             for p, s in zip(price_list, scheme_list)
         ]
+        config_index = self._index_configs(configs)
+        # id(config) -> (in-flight or finished build, monotonic start time)
+        requirements_cache: _RequirementsCache = {}
 
         def decorator(func: Callable) -> Callable:
             @wraps(func)
@@ -115,41 +208,40 @@ class X402Middleware:
                 payment_header = request.headers.get(PAYMENT_SIGNATURE_HEADER)
 
                 if not payment_header:
-                    return await self._return_payment_required(request, configs)
+                    return await self._return_payment_required(
+                        request, configs, requirements_cache=requirements_cache
+                    )
 
                 try:
-                    payload = decode_payment_payload(payment_header, PaymentPayload)
+                    payload = _decode_payment_payload_cached(payment_header)
                 except Exception as e:
-                    import logging
-
-                    logger = logging.getLogger(__name__)
-                    logger.error(f"Failed to decode payment payload: {e}", exc_info=True)
-                    logger.error(
-                        f"Payment header content (first 200 chars): {payment_header[:200]}"
+                    logger.error("Failed to decode payment payload: %s", e, exc_info=True)
+                    logger.debug(
+                        "Payment header content (first 200 chars): %s", payment_header[:200]
                     )
-                    return JSONResponse(
+                    return _PaymentJSONResponse(
                         content={"error": f"Invalid payment payload: {str(e)}"}, status_code=400
                     )
 
                 # Match payload to the correct config
-                config = self._match_config(
-                    configs, payload.accepted.network, payload.accepted.asset
+                config = config_index.get(
+                    (payload.accepted.network, payload.accepted.asset.lower())
                 )
                 if config is None:
-                    return JSONResponse(
+                    return _PaymentJSONResponse(
                         content={"error": "Unsupported payment token or network"},
                         status_code=400,
                     )
 
-                requirements = (await self._server.build_payment_requirements([config]))[0]
+                requirements = (await self._build_requirements([config], requirements_cache))[0]
 
                 settle_result = await self._server.settle_payment(payload, requirements)
                 if not settle_result.success:
-                    import logging
-
-                    logger = logging.getLogger(__name__)
-                    logger.error(f"Payment settlement failed: {settle_result.error_reason}")
-                    logger.error(f"Settlement result: {settle_result.model_dump(by_alias=True)}")
+                    logger.error("Payment settlement failed: %s", settle_result.error_reason)
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.error(
+                            "Settlement result: %s", settle_result.model_dump_json(by_alias=True)
+                        )
                     error_content: dict[str, Any] = {
                         "error": f"Settlement failed: {settle_result.error_reason}",
                     }
@@ -157,7 +249,7 @@ class X402Middleware:
                         error_content["txHash"] = settle_result.transaction
                     if settle_result.network:
                         error_content["network"] = settle_result.network
-                    return JSONResponse(content=error_content, status_code=500)
+                    return _PaymentJSONResponse(content=error_content, status_code=500)
 
                 # Verify transaction on-chain (required)
                 if settle_result.transaction:
@@ -168,7 +260,7 @@ class X402Middleware:
                         network=requirements.network,
                     )
                     if not tx_verify_result.success:
-                        return JSONResponse(
+                        return _PaymentJSONResponse(
                             content={
                                 "error": (
                                     "Transaction verification failed: "
@@ -179,24 +271,34 @@ class X402Middleware:
                             status_code=500,
                         )
 
-                response = await func(request, *args, **kwargs)
+                result = await func(request, *args, **kwargs)
+                response = result if isinstance(result, Response) else JSONResponse(content=result)
 
-                if isinstance(response, Response):
-                    response.headers[PAYMENT_RESPONSE_HEADER] = encode_payment_payload(
-                        settle_result.model_dump(by_alias=True)
-                    )
-                    return response
-
-                json_response = JSONResponse(content=response)
-                json_response.headers[PAYMENT_RESPONSE_HEADER] = encode_payment_payload(
+                response.headers[PAYMENT_RESPONSE_HEADER] = encode_payment_payload(
                     settle_result.model_dump(by_alias=True)
                 )
-                return json_response
+                return response
 
             return wrapper
 
         return decorator
 
+    @staticmethod
+    def _index_configs(
+        configs: list[ResourceConfig],
+    ) -> dict[tuple[str, str], ResourceConfig]:
+        """Map (network, lowercased asset address) to the first matching config."""
+        index: dict[tuple[str, str], ResourceConfig] = {}
+        for cfg in configs:
+            # Parse the price to get the expected asset address
+            parts = cfg.price.strip().split()
+            if len(parts) != 2:
+                continue
+            token = TokenRegistry.get_token(cfg.network, parts[1])
+            if token:
+                index.setdefault((cfg.network, token.address.lower()), cfg)
+        return index
+
     @staticmethod
     def _match_config(
         configs: list[ResourceConfig],
@@ -204,20 +306,54 @@ class X402Middleware:
         asset: str,
     ) -> ResourceConfig | None:
         """Find the config matching the payment's network and asset."""
-        from bankofai.x402.tokens import TokenRegistry
+        return X402Middleware._index_configs(configs).get((network, asset.lower()))
 
-        for cfg in configs:
-            if cfg.network != network:
-                continue
-            # Parse the price to get the expected asset address
-            parts = cfg.price.strip().split()
-            if len(parts) != 2:
-                continue
-            symbol = parts[1]
-            token = TokenRegistry.get_token(cfg.network, symbol)
-            if token and token.address.lower() == asset.lower():
-                return cfg
-        return None
+    async def _build_requirements(
+        self,
+        configs: list[ResourceConfig],
+        cache: _RequirementsCache,
+    ) -> list[PaymentRequirements]:
+        """Build payment requirements, reusing recent builds per config.
+
+        Builds are reused for REQUIREMENTS_CACHE_TTL or until their earliest
+        fee quote expires, whichever comes first. Concurrent requests share
+        one in-flight build. Failed builds are not cached. The returned
+        requirements are shared and must not be mutated.
+        """
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+        builds = []
+        for config in configs:
+            entry = cache.get(id(config))
+            if (
+                entry is None
+                or now - entry[1] >= REQUIREMENTS_CACHE_TTL
+                or _quote_expired(entry[0])
+                # An unfinished build started on another event loop cannot be awaited here
+                or (not entry[0].done() and entry[0].get_loop() is not loop)
+            ):
+                future = asyncio.ensure_future(
+                    self._server.build_payment_requirements_with_expiry([config])
+                )
+                entry = (future, now)
+                cache[id(config)] = entry
+            builds.append((config, entry))
+
+        results = await asyncio.gather(
+            *(_await_shared(entry[0]) for _, entry in builds), return_exceptions=True
+        )
+        requirements: list[PaymentRequirements] = []
+        error: BaseException | None = None
+        for (config, entry), result in zip(builds, results):
+            if isinstance(result, BaseException):
+                if cache.get(id(config)) is entry:
+                    del cache[id(config)]
+                error = error or result
+            else:
+                requirements.extend(result[0])
+        if error is not None:
+            raise error
+        return requirements
 
     async def _verify_transaction_on_chain(
         self,
@@ -225,7 +361,7 @@ class X402Middleware:
         payload: PaymentPayload,
         requirements: PaymentRequirements,
         network: str,
-    ) -> "TransactionVerificationResult":
+    ) -> TransactionVerificationResult:
         """
         Verify transaction on-chain to ensure transfers match expectations.
 
@@ -238,36 +374,53 @@ class X402Middleware:
         Returns:
             TransactionVerificationResult
         """
-        from bankofai.x402.utils.tx_verification import (
-            TransactionVerificationResult,
-            get_verifier_for_network,
-        )
+        key = (network, tx_hash)
+        cached = self._tx_verify_cache.get(key)
+        if cached is not None:
+            result, expires_at = cached
+            if time.monotonic() < expires_at:
+                self._tx_verify_cache.move_to_end(key)
+                return result
+            del self._tx_verify_cache[key]
 
         try:
             verifier = get_verifier_for_network(network)
-            return await verifier.verify_transaction(tx_hash, payload, requirements)
+            result = await verifier.verify_transaction(tx_hash, payload, requirements)
         except ValueError as e:
             # No verifier available for this network, skip verification
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Transaction verification skipped: {e}")
+            logger.warning("Transaction verification skipped: %s", e)
             return TransactionVerificationResult(
                 success=True,
                 tx_hash=tx_hash,
                 status_verified=True,
             )
 
+        # Only successes are cached so transient RPC errors are retried
+        if result.success:
+            self._tx_verify_cache[key] = (result, time.monotonic() + TX_VERIFY_CACHE_TTL)
+            if len(self._tx_verify_cache) > TX_VERIFY_CACHE_SIZE:
+                self._tx_verify_cache.popitem(last=False)
+        return result
+
     async def _return_payment_required(
         self,
         request: Request,
         configs: list[ResourceConfig],
         error: str | None = None,
+        requirements_cache: _RequirementsCache | None = None,
     ) -> JSONResponse:
-        """Return 402 payment required response"""
-        requirements_list = await self._server.build_payment_requirements(configs)
+        """Return 402 payment required response.
+
+        The body carries a fresh paymentId, nonce and validity window for each
+        request, so it is rebuilt every time rather than cached; only the
+        requirements themselves are reused.
+        """
+        if requirements_cache is None:
+            requirements_list = await self._server.build_payment_requirements(configs)
+        else:
+            requirements_list = await self._build_requirements(configs, requirements_cache)
         if not requirements_list:
-            return JSONResponse(
+            return _PaymentJSONResponse(
                 content={"error": "No supported payment options available"},
                 status_code=500,
             )
@@ -281,8 +434,9 @@ class X402Middleware:
         if error:
             response_data["error"] = error
 
-        response = JSONResponse(content=response_data, status_code=402)
-        response.headers[PAYMENT_REQUIRED_HEADER] = encode_payment_payload(response_data)
+        response = _PaymentJSONResponse(content=response_data, status_code=402)
+        # The header is the base64 of the already-rendered body; no second JSON pass
+        response.headers[PAYMENT_REQUIRED_HEADER] = encode_base64(bytes(response.body))
 
         return response
 
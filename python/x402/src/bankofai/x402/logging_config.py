@@ -5,24 +5,31 @@ Logging configuration for X402
 import logging
 import sys
 
+# Shared formatter with timestamp, file and line number
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s - %(levelname)-8s %(name)s %(filename)s:%(lineno)d %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
 
 def setup_logging(level: int = logging.INFO) -> None:
     """
     Configure logging with timestamp, file and line number information
 
+    Safe to call repeatedly: later calls only update the level.
+
     Args:
         level: Logging level (default: INFO)
     """
-    # Create formatter with timestamp, file and line number
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(levelname)-8s %(name)s %(filename)s:%(lineno)d %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
+    for handler in root_logger.handlers:
+        if getattr(handler, "_x402", False):
+            handler.setLevel(level)
+            return
+
     # Remove existing handlers to avoid duplicates
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
@@ -30,7 +37,8 @@ def setup_logging(level: int = logging.INFO) -> None:
     # Add console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
+    console_handler._x402 = True  # type: ignore[attr-defined]
     root_logger.addHandler(console_handler)
 
 
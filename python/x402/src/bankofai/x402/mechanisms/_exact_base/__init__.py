@@ -15,6 +15,7 @@ from bankofai.x402.mechanisms._exact_base.types import (
     build_eip712_domain,
     build_eip712_message,
     create_nonce,
+    create_nonces,
     create_validity_window,
     get_transfer_with_authorization_abi_json,
 )
@@ -30,6 +31,7 @@ __all__ = [
     "build_eip712_domain",
     "build_eip712_message",
     "create_nonce",
+    "create_nonces",
     "create_validity_window",
     "get_transfer_with_authorization_abi_json",
 ]
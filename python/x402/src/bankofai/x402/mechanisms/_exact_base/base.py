@@ -113,15 +113,14 @@ class ExactBaseClientMechanism(ClientMechanism):
         valid_after, valid_before = create_validity_window()
         nonce = create_nonce()
 
-        authorization = TransferAuthorization(
-            **{
-                "from": from_addr,
-                "to": to_addr,
-                "value": value,
-                "validAfter": str(valid_after),
-                "validBefore": str(valid_before),
-                "nonce": nonce,
-            }
+        # Every field is a string built just above, so skip model validation
+        authorization = TransferAuthorization.model_construct(
+            from_address=from_addr,
+            to=to_addr,
+            value=str(value),
+            valid_after=str(valid_after),
+            valid_before=str(valid_before),
+            nonce=nonce,
         )
 
         # Build EIP-712 domain and message
@@ -266,18 +265,16 @@ class ExactBaseFacilitatorMechanism(FacilitatorMechanism):
         if v < 27:
             v += 27
 
-        nonce_bytes = bytes.fromhex(auth.nonce[2:] if auth.nonce.startswith("0x") else auth.nonce)
-
         adapter = self._adapter
         token_address = requirements.asset
 
         args = [
             adapter.to_signing_address(auth.from_address),
             adapter.to_signing_address(auth.to),
-            int(auth.value),
-            int(auth.valid_after),
-            int(auth.valid_before),
-            nonce_bytes,
+            auth.value_int,
+            auth.valid_after_int,
+            auth.valid_before_int,
+            auth.nonce_bytes,
             v,
             r,
             s,
@@ -349,7 +346,7 @@ class ExactBaseFacilitatorMechanism(FacilitatorMechanism):
                 return "token_not_allowed"
 
         # Amount check
-        if int(auth.value) < int(requirements.amount):
+        if auth.value_int < int(requirements.amount):
             return "amount_mismatch"
 
         # Recipient check
@@ -358,9 +355,9 @@ class ExactBaseFacilitatorMechanism(FacilitatorMechanism):
 
         # Time window
         now = int(time.time())
-        if int(auth.valid_before) < now:
+        if auth.valid_before_int < now:
             return "expired"
-        if int(auth.valid_after) > now:
+        if auth.valid_after_int > now:
             return "not_yet_valid"
 
         return None
@@ -3,7 +3,7 @@ Types, ABI, and EIP-712 definitions for exact mechanism.
 """
 
 import json
-import secrets
+import os
 import time
 from typing import Any, List
 
@@ -33,6 +33,24 @@ class TransferAuthorization(BaseModel):
     class Config:
         populate_by_name = True
 
+    # Decoded forms used by signing, signature verification and validation.
+    # Computed on access, not cached, so they always match the string fields.
+    @property
+    def nonce_bytes(self) -> bytes:
+        return bytes.fromhex(self.nonce.removeprefix("0x"))
+
+    @property
+    def value_int(self) -> int:
+        return int(self.value)
+
+    @property
+    def valid_after_int(self) -> int:
+        return int(self.valid_after)
+
+    @property
+    def valid_before_int(self) -> int:
+        return int(self.valid_before)
+
 
 # ---------------------------------------------------------------------------
 # EIP-712 type definitions for TransferWithAuthorization
@@ -97,8 +115,13 @@ AUTHORIZATION_STATE_ABI: List[dict[str, Any]] = [
 ]
 
 
+_TRANSFER_WITH_AUTHORIZATION_ABI_JSON = json.dumps(
+    TRANSFER_WITH_AUTHORIZATION_ABI, separators=(",", ":")
+)
+
+
 def get_transfer_with_authorization_abi_json() -> str:
-    return json.dumps(TRANSFER_WITH_AUTHORIZATION_ABI)
+    return _TRANSFER_WITH_AUTHORIZATION_ABI_JSON
 
 
 def build_eip712_message(
@@ -108,10 +131,10 @@ def build_eip712_message(
     return {
         "from": auth.from_address,
         "to": auth.to,
-        "value": int(auth.value),
-        "validAfter": int(auth.valid_after),
-        "validBefore": int(auth.valid_before),
-        "nonce": bytes.fromhex(auth.nonce[2:] if auth.nonce.startswith("0x") else auth.nonce),
+        "value": auth.value_int,
+        "validAfter": auth.valid_after_int,
+        "validBefore": auth.valid_before_int,
+        "nonce": auth.nonce_bytes,
     }
 
 
@@ -137,7 +160,13 @@ def build_eip712_domain(
 
 def create_nonce() -> str:
     """Generate a random 32-byte nonce (0x-prefixed hex)."""
-    return "0x" + secrets.token_hex(32)
+    return "0x" + os.urandom(32).hex()
+
+
+def create_nonces(count: int) -> list[str]:
+    """Generate *count* random 32-byte nonces from a single urandom read."""
+    raw = os.urandom(32 * count)
+    return ["0x" + raw[i : i + 32].hex() for i in range(0, len(raw), 32)]
 
 
 def create_validity_window(
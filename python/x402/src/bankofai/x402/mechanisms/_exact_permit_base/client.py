@@ -29,6 +29,8 @@ from bankofai.x402.utils import convert_permit_to_eip712_message
 if TYPE_CHECKING:
     from bankofai.x402.signers.client import ClientSigner
 
+_BANNER = "=" * 60
+
 
 class BaseExactPermitClientMechanism(ClientMechanism):
     """Base class for exact_permit payment scheme client mechanisms.
@@ -39,6 +41,8 @@ class BaseExactPermitClientMechanism(ClientMechanism):
     def __init__(self, signer: "ClientSigner") -> None:
         self._signer = signer
         self._address_converter = self._get_address_converter()
+        # EIP-712 domain per network; the permit contract and chain id are fixed
+        self._domains: dict[str, dict[str, Any]] = {}
         self._logger = logging.getLogger(self.__class__.__name__)
 
     @abstractmethod
@@ -59,34 +63,15 @@ class BaseExactPermitClientMechanism(ClientMechanism):
         extensions: dict[str, Any] | None = None,
     ) -> PaymentPayload:
         """Create payment payload with EIP-712 signature"""
-        self._logger.info("=" * 60)
-        self._logger.info(f"Creating payment payload for: {resource}")
-
-        # Log payment details
-        self._logger.info(f"[PAYMENT] Token: {requirements.asset}")
-        self._logger.info(f"[PAYMENT] From: {self._signer.get_address()}")
-        self._logger.info(f"[PAYMENT] To: {requirements.pay_to}")
-        self._logger.info(f"[PAYMENT] Amount: {requirements.amount}")
-
-        # Log fee details
-        if requirements.extra and requirements.extra.fee:
-            fee = requirements.extra.fee
-            self._logger.info(f"[FEE] To: {fee.fee_to}")
-            self._logger.info(f"[FEE] Amount: {fee.fee_amount}")
-            total = int(requirements.amount) + int(fee.fee_amount)
-            self._logger.info(
-                f"[TOTAL] {total} = {requirements.amount} (payment) + {fee.fee_amount} (fee)"
-            )
-        else:
-            self._logger.info("[FEE] None")
-            self._logger.info(f"[TOTAL] {requirements.amount}")
+        if self._logger.isEnabledFor(logging.INFO):
+            self._log_payment_details(requirements, resource)
 
         context = extensions.get("paymentPermitContext") if extensions else None
         if context is None:
             raise PermitValidationError("missing_context", "paymentPermitContext is required")
 
         permit = self._build_permit(requirements, context)
-        self._logger.debug(f"Buyer address: {permit.buyer}, paymentId: {permit.meta.payment_id}")
+        self._logger.debug("Buyer address: %s, paymentId: %s", permit.buyer, permit.meta.payment_id)
 
         await self._ensure_allowance(permit, requirements.network)
 
@@ -94,7 +79,7 @@ class BaseExactPermitClientMechanism(ClientMechanism):
         signature = await self._sign_permit(permit, requirements.network)
 
         self._logger.info("Payment payload created successfully")
-        self._logger.info("=" * 60)
+        self._logger.info(_BANNER)
         return PaymentPayload(
             x402Version=2,
             resource=ResourceInfo(url=resource),
@@ -106,6 +91,30 @@ class BaseExactPermitClientMechanism(ClientMechanism):
             extensions={},
         )
 
+    def _log_payment_details(self, requirements: PaymentRequirements, resource: str) -> None:
+        """Log payment, fee and total amounts (INFO)"""
+        logger = self._logger
+        logger.info(_BANNER)
+        logger.info("Creating payment payload for: %s", resource)
+
+        logger.info("[PAYMENT] Token: %s", requirements.asset)
+        logger.info("[PAYMENT] From: %s", self._signer.get_address())
+        logger.info("[PAYMENT] To: %s", requirements.pay_to)
+        logger.info("[PAYMENT] Amount: %s", requirements.amount)
+
+        extra = requirements.extra
+        fee = extra.fee if extra else None
+        if fee:
+            logger.info("[FEE] To: %s", fee.fee_to)
+            logger.info("[FEE] Amount: %s", fee.fee_amount)
+            total = int(requirements.amount) + int(fee.fee_amount)
+            logger.info(
+                "[TOTAL] %s = %s (payment) + %s (fee)", total, requirements.amount, fee.fee_amount
+            )
+        else:
+            logger.info("[FEE] None")
+            logger.info("[TOTAL] %s", requirements.amount)
+
     def _build_permit(
         self,
         requirements: PaymentRequirements,
@@ -116,13 +125,16 @@ class BaseExactPermitClientMechanism(ClientMechanism):
         meta = context.get("meta", {})
         converter = self._address_converter
 
-        fee_to = converter.get_zero_address()
-        fee_amount = "0"
-        caller = converter.get_zero_address()
-        if requirements.extra and requirements.extra.fee:
-            fee_to = requirements.extra.fee.fee_to
-            fee_amount = requirements.extra.fee.fee_amount
-            caller = requirements.extra.fee.caller or converter.get_zero_address()
+        zero_address = converter.get_zero_address()
+        extra = requirements.extra
+        fee = extra.fee if extra else None
+        if fee:
+            fee_to = fee.fee_to
+            fee_amount = fee.fee_amount
+            caller = fee.caller or zero_address
+        else:
+            fee_to = caller = zero_address
+            fee_amount = "0"
 
         # Normalize addresses (required for TRON, EVM returns as-is)
         return PaymentPermit(
@@ -150,8 +162,10 @@ class BaseExactPermitClientMechanism(ClientMechanism):
         """Ensure token allowance is sufficient for payment + fee"""
         total_amount = int(permit.payment.pay_amount) + int(permit.fee.fee_amount)
         self._logger.info(
-            f"Total amount (payment + fee): {total_amount} = "
-            f"{permit.payment.pay_amount} + {permit.fee.fee_amount}"
+            "Total amount (payment + fee): %s = %s + %s",
+            total_amount,
+            permit.payment.pay_amount,
+            permit.fee.fee_amount,
         )
 
         await self._signer.ensure_allowance(
@@ -160,23 +174,31 @@ class BaseExactPermitClientMechanism(ClientMechanism):
             network,
         )
 
+    def _get_domain(self, network: str) -> dict[str, Any]:
+        """Get the PaymentPermit EIP-712 domain for a network, built once per network"""
+        domain = self._domains.get(network)
+        if domain is None:
+            permit_address = NetworkConfig.get_payment_permit_address(network)
+            domain = {
+                "name": "PaymentPermit",
+                "chainId": NetworkConfig.get_chain_id(network),
+                "verifyingContract": self._address_converter.to_evm_format(permit_address),
+            }
+            self._domains[network] = domain
+        return domain
+
     async def _sign_permit(self, permit: PaymentPermit, network: str) -> str:
         """Sign permit with EIP-712"""
-        permit_address = NetworkConfig.get_payment_permit_address(network)
-        chain_id = NetworkConfig.get_chain_id(network)
         converter = self._address_converter
 
         # Convert permit to EIP-712 message format
         message = convert_permit_to_eip712_message(permit)
         # Convert addresses to EVM format (required for TRON, EVM returns as-is)
-        message = converter.convert_message_addresses(message)
+        if not converter.IS_NOOP:
+            message = converter.convert_message_addresses(message)
 
         return await self._signer.sign_typed_data(
-            domain={
-                "name": "PaymentPermit",
-                "chainId": chain_id,
-                "verifyingContract": converter.to_evm_format(permit_address),
-            },
+            domain=self._get_domain(network),
             types=get_payment_permit_eip712_types(),
             message=message,
         )
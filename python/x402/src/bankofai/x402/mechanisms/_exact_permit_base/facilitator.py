@@ -311,7 +311,8 @@ class BaseExactPermitFacilitatorMechanism(FacilitatorMechanism):
         converter = self._address_converter
 
         message = convert_permit_to_eip712_message(permit)
-        message = converter.convert_message_addresses(message)
+        if not converter.IS_NOOP:
+            message = converter.convert_message_addresses(message)
 
         # Debug: log exact message being verified
         import logging
@@ -4,6 +4,7 @@ BaseExactPermitServerMechanism - Base class for "exact_permit" payment scheme se
 Extracts common logic from EVM and TRON implementations.
 """
 
+import asyncio
 import logging
 from abc import abstractmethod
 from typing import Any
@@ -18,6 +19,20 @@ from bankofai.x402.mechanisms._base.server import ServerMechanism
 from bankofai.x402.tokens import TokenRegistry
 from bankofai.x402.types import KIND_MAP, PaymentRequirements, PaymentRequirementsExtra
 
+try:
+    from eth_account import Account as _Account
+    from eth_account.messages import encode_typed_data as _encode_typed_data
+except ImportError:
+    _Account = None  # type: ignore[assignment,misc]
+    _encode_typed_data = None  # type: ignore[assignment]
+
+
+def _recover_typed_data_signer(typed_data: dict[str, Any], signature: str) -> str:
+    """Encode EIP-712 typed data and recover its signer (CPU-bound)."""
+    signable = _encode_typed_data(full_message=typed_data)
+    sig_bytes = bytes.fromhex(signature[2:] if signature.startswith("0x") else signature)
+    return str(_Account.recover_message(signable, signature=sig_bytes))
+
 
 class BaseExactPermitServerMechanism(ServerMechanism):
     """Base class for exact_permit payment scheme server mechanisms.
@@ -51,7 +66,7 @@ class BaseExactPermitServerMechanism(ServerMechanism):
         Returns:
             Dict containing amount, asset, decimals, etc.
         """
-        self._logger.debug(f"Parsing price: {price} on network {network}")
+        self._logger.debug("Parsing price: %s on network %s", price, network)
         return TokenRegistry.parse_price(price, network)
 
     async def enhance_payment_requirements(
@@ -115,8 +130,8 @@ class BaseExactPermitServerMechanism(ServerMechanism):
             True if signature is valid
         """
         try:
-            from eth_account import Account
-            from eth_account.messages import encode_typed_data
+            if _Account is None:
+                raise ImportError("eth_account is required for signature verification")
 
             permit_address = NetworkConfig.get_payment_permit_address(network)
             chain_id = NetworkConfig.get_chain_id(network)
@@ -156,10 +171,9 @@ class BaseExactPermitServerMechanism(ServerMechanism):
                 "message": message,
             }
 
-            # Encode and verify signature
-            signable = encode_typed_data(full_message=typed_data)
-            sig_bytes = bytes.fromhex(signature[2:] if signature.startswith("0x") else signature)
-            recovered = Account.recover_message(signable, signature=sig_bytes)
+            # Encode and recover in a worker thread so ECDSA recovery does not
+            # stall the event loop
+            recovered = await asyncio.to_thread(_recover_typed_data_signer, typed_data, signature)
 
             # Get expected signer address
             expected_address = self._get_expected_signer(permit.buyer)
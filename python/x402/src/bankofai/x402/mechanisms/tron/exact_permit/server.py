@@ -6,6 +6,7 @@ from typing import Any
 
 from bankofai.x402.mechanisms._exact_permit_base.server import BaseExactPermitServerMechanism
 from bankofai.x402.types import KIND_MAP
+from bankofai.x402.utils.address import tron_address_to_evm
 
 
 class ExactPermitTronServerMechanism(BaseExactPermitServerMechanism):
@@ -18,22 +19,16 @@ class ExactPermitTronServerMechanism(BaseExactPermitServerMechanism):
 
     def _get_verifying_contract(self, permit_address: str) -> str:
         """Convert TRON address to EVM format for EIP-712 verification"""
-        from bankofai.x402.utils.address import tron_address_to_evm
-
         return tron_address_to_evm(permit_address)
 
     def _get_expected_signer(self, buyer_address: str) -> str:
         """Convert TRON buyer address to EVM format for comparison"""
-        from bankofai.x402.utils.address import tron_address_to_evm
-
         return tron_address_to_evm(buyer_address)
 
     def _convert_permit_to_message(self, permit: Any) -> dict[str, Any]:
         """
         Convert permit to EIP-712 message format with TRON addresses converted to EVM format.
         """
-        from bankofai.x402.utils.address import tron_address_to_evm
-
         message = permit.model_dump(by_alias=True)
 
         # Convert kind string to numeric value
@@ -2,7 +2,9 @@
 X402Server - Core payment server for x402 protocol
 """
 
+import asyncio
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Protocol
 
@@ -23,6 +25,9 @@ from bankofai.x402.types import (
 if TYPE_CHECKING:
     from bankofai.x402.facilitator.facilitator_client import FacilitatorClient
 
+# Number of recently verified (permit, signature) pairs remembered per server
+SIGNATURE_CACHE_SIZE = 8192
+
 
 class ServerMechanism(Protocol):
     """Server mechanism interface"""
@@ -77,6 +82,10 @@ class X402Server:
         self._logger = logging.getLogger(self.__class__.__name__)
         self._mechanisms: dict[str, dict[str, ServerMechanism]] = {}
         self._facilitator: "FacilitatorClient | None" = None
+        # Keys of permit signatures that passed local verification. Only the
+        # pure signature check is cached; the facilitator still verifies
+        # on-chain state for every payment.
+        self._verified_signatures: OrderedDict[tuple[str, str, str, str], None] = OrderedDict()
 
         if auto_register_tron:
             self._register_default_tron_mechanisms()
@@ -131,6 +140,23 @@ class X402Server:
         Returns:
             List of PaymentRequirements with fee info attached
         """
+        requirements, _ = await self.build_payment_requirements_with_expiry(configs)
+        return requirements
+
+    async def build_payment_requirements_with_expiry(
+        self,
+        configs: list[ResourceConfig],
+    ) -> tuple[list[PaymentRequirements], int | None]:
+        """Build payment requirements and report when their fee quotes expire.
+
+        Args:
+            configs: List of resource configurations
+
+        Returns:
+            Tuple of (PaymentRequirements with fee info attached, earliest
+            fee quote expiry as a unix timestamp or None if none expires)
+        """
+        expires_at: int | None = None
         requirements_list: list[PaymentRequirements] = []
         for config in configs:
             mechanism = self._find_mechanism(config.network, config.scheme)
@@ -193,10 +219,14 @@ class X402Server:
                     fee_quote.fee.facilitator_id = facilitator.facilitator_id
                     req.extra.fee = fee_quote.fee
                     supported.append(req)
+                    if fee_quote.expires_at is not None and (
+                        expires_at is None or fee_quote.expires_at < expires_at
+                    ):
+                        expires_at = fee_quote.expires_at
         else:
             raise ValueError("Facilitator is not set")
 
-        return supported
+        return supported, expires_at
 
     def create_payment_required_response(
         self,
@@ -270,16 +300,44 @@ class X402Server:
         if mechanism is not None:
             permit = payload.payload.payment_permit
             signature = payload.payload.signature
-
-            is_valid = await mechanism.verify_signature(permit, signature, requirements.network)
-            if not is_valid:
-                return VerifyResponse(isValid=False, invalidReason="invalid_signature_server")
+            if permit is None:
+                return VerifyResponse(isValid=False, invalidReason="payload_mismatch")
+
+            key = (requirements.network, requirements.scheme, signature, permit.model_dump_json())
+            if key in self._verified_signatures:
+                self._verified_signatures.move_to_end(key)
+            else:
+                is_valid = await mechanism.verify_signature(permit, signature, requirements.network)
+                if not is_valid:
+                    return VerifyResponse(isValid=False, invalidReason="invalid_signature_server")
+                self._verified_signatures[key] = None
+                if len(self._verified_signatures) > SIGNATURE_CACHE_SIZE:
+                    self._verified_signatures.popitem(last=False)
 
         if self._facilitator is None:
             return VerifyResponse(isValid=False, invalidReason="no_facilitator")
 
         return await self._facilitator.verify(payload, requirements)
 
+    async def verify_payments(
+        self,
+        items: list[tuple[PaymentPayload, PaymentRequirements]],
+    ) -> list[VerifyResponse]:
+        """
+        Verify several payments concurrently.
+
+        Args:
+            items: (payload, requirements) pairs
+
+        Returns:
+            VerifyResponse for each pair, in input order
+        """
+        return list(
+            await asyncio.gather(
+                *(self.verify_payment(payload, requirements) for payload, requirements in items)
+            )
+        )
+
     async def settle_payment(
         self,
         payload: PaymentPayload,
@@ -2,9 +2,13 @@
 Client signer base interface
 """
 
+import time
 from abc import ABC, abstractmethod
 from typing import Any
 
+# How long (seconds) an observed token allowance is trusted before re-checking
+ALLOWANCE_CACHE_TTL = 30.0
+
 
 class ClientSigner(ABC):
     """
@@ -13,6 +17,10 @@ class ClientSigner(ABC):
     Responsible for signing messages and managing token allowances.
     """
 
+    def __init__(self) -> None:
+        # Recently observed allowances: (network, token) -> (allowance, monotonic time)
+        self._allowance_cache: dict[tuple[str, str], tuple[int, float]] = {}
+
     @abstractmethod
     def get_address(self) -> str:
         """Get the signer's account address"""
@@ -112,3 +120,27 @@ class ClientSigner(ABC):
             True if allowance is sufficient
         """
         pass
+
+    def _remember_allowance(self, token: str, allowance: int, network: str) -> None:
+        """Record an allowance observed on chain (or just approved)"""
+        self._allowance_cache[(network, token)] = (allowance, time.monotonic())
+
+    def _reserve_cached_allowance(self, token: str, amount: int, network: str) -> bool:
+        """Consume *amount* from a recently observed allowance, if it covers it.
+
+        The cached value is decremented, so back-to-back payments cannot spend
+        past what was last seen on chain. Entries expire after
+        ALLOWANCE_CACHE_TTL seconds.
+
+        Returns:
+            True if the cached allowance covers the amount
+        """
+        key = (network, token)
+        cached = self._allowance_cache.get(key)
+        if cached is None:
+            return False
+        allowance, checked_at = cached
+        if time.monotonic() - checked_at >= ALLOWANCE_CACHE_TTL or allowance < amount:
+            return False
+        self._allowance_cache[key] = (allowance - amount, checked_at)
+        return True
@@ -9,7 +9,20 @@ from bankofai.x402.abi import ERC20_ABI, PAYMENT_PERMIT_PRIMARY_TYPE
 from bankofai.x402.config import NetworkConfig
 from bankofai.x402.exceptions import InsufficientAllowanceError, SignatureCreationError
 from bankofai.x402.signers.client.base import ClientSigner
-from bankofai.x402.signers.utils import _eip712_domain_type_from_keys, resolve_provider_uri
+from bankofai.x402.signers.utils import (
+    _eip712_domain_type_from_keys,
+    encode_payment_permit,
+    get_async_web3_client,
+)
+
+try:
+    from eth_account import Account as _Account
+    from eth_account.messages import encode_defunct as _encode_defunct
+    from eth_account.messages import encode_typed_data as _encode_typed_data
+except ImportError:
+    _Account = None  # type: ignore[assignment,misc]
+    _encode_defunct = None  # type: ignore[assignment]
+    _encode_typed_data = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +31,7 @@ class EvmClientSigner(ClientSigner):
     """EVM client signer implementation using web3.py"""
 
     def __init__(self, private_key: str) -> None:
+        super().__init__()
         if not private_key.startswith("0x"):
             private_key = "0x" + private_key
         self._private_key = private_key
@@ -33,9 +47,9 @@ class EvmClientSigner(ClientSigner):
     @staticmethod
     def _derive_address(private_key: str) -> str:
         """Derive EVM address from private key"""
-        from eth_account import Account
-
-        return Account.from_key(private_key).address
+        if _Account is None:
+            raise ImportError("eth_account is required for EVM signers")
+        return _Account.from_key(private_key).address
 
     def get_address(self) -> str:
         return self._address
@@ -43,24 +57,15 @@ class EvmClientSigner(ClientSigner):
     def _ensure_async_web3_client(self, network: str) -> Any:
         """Lazy initialize async web3 client for the given network."""
         if network not in self._async_web3_clients:
-            from web3 import AsyncHTTPProvider, AsyncWeb3
-            from web3.middleware import ExtraDataToPOAMiddleware
-
-            provider_uri = resolve_provider_uri(network)
-            w3 = AsyncWeb3(AsyncHTTPProvider(provider_uri))
-            w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-            self._async_web3_clients[network] = w3
+            self._async_web3_clients[network] = get_async_web3_client(network)
 
         return self._async_web3_clients[network]
 
     async def sign_message(self, message: bytes) -> str:
         """Sign raw message using ECDSA (EIP-191)"""
         try:
-            from eth_account import Account
-            from eth_account.messages import encode_defunct
-
-            signable = encode_defunct(primitive=message)
-            signed = Account.sign_message(signable, private_key=self._private_key)
+            signable = _encode_defunct(primitive=message)
+            signed = _Account.sign_message(signable, private_key=self._private_key)
             return signed.signature.hex()
         except Exception as e:
             raise SignatureCreationError(f"Failed to sign message: {e}")
@@ -73,9 +78,6 @@ class EvmClientSigner(ClientSigner):
     ) -> str:
         """Sign EIP-712 typed data."""
         try:
-            from eth_account import Account
-            from eth_account.messages import encode_typed_data
-
             # TODO: Refactor ClientSigner interface to accept primary_type explicitly
             primary_type = (
                 PAYMENT_PERMIT_PRIMARY_TYPE
@@ -94,8 +96,11 @@ class EvmClientSigner(ClientSigner):
                 "message": message,
             }
 
-            encoded = encode_typed_data(full_message=full_data)
-            signed = Account.sign_message(encoded, private_key=self._private_key)
+            # Fast path for the fixed PaymentPermit layout; generic encoder otherwise
+            encoded = encode_payment_permit(domain, types, message)
+            if encoded is None:
+                encoded = _encode_typed_data(full_message=full_data)
+            signed = _Account.sign_message(encoded, private_key=self._private_key)
             return signed.signature.hex()
         except Exception as e:
             raise SignatureCreationError(f"Failed to sign typed data: {e}")
@@ -144,8 +149,12 @@ class EvmClientSigner(ClientSigner):
         if mode == "skip":
             return True
 
+        if self._reserve_cached_allowance(token, amount, network):
+            return True
+
         current = await self.check_allowance(token, amount, network)
         if current >= amount:
+            self._remember_allowance(token, current - amount, network)
             return True
 
         if mode == "interactive":
@@ -159,11 +168,13 @@ class EvmClientSigner(ClientSigner):
             spender = self._get_spender_address(network)
             contract = w3.eth.contract(address=token, abi=ERC20_ABI)
 
+            # The chain id is encoded in the network identifier, so only the
+            # nonce needs an RPC round trip
             tx = await contract.functions.approve(spender, 2**256 - 1).build_transaction(
                 {
                     "from": self._address,
                     "nonce": await w3.eth.get_transaction_count(self._address),
-                    "chainId": await w3.eth.chain_id,
+                    "chainId": NetworkConfig.get_chain_id(network),
                 }
             )
 
@@ -173,6 +184,7 @@ class EvmClientSigner(ClientSigner):
 
             success = receipt.status == 1
             if success:
+                self._remember_allowance(token, 2**256 - 1 - amount, network)
                 logger.info(
                     "ERC20 approval successful",
                     extra={"token": token, "tx_hash": tx_hash.hex()},
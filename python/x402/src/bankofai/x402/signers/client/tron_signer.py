@@ -6,10 +6,44 @@ import json
 import logging
 from typing import Any
 
-from bankofai.x402.abi import EIP712_DOMAIN_TYPE, ERC20_ABI, PAYMENT_PERMIT_PRIMARY_TYPE
+from bankofai.x402.abi import (
+    EIP712_DOMAIN_TYPE,
+    ERC20_ABI,
+    PAYMENT_PERMIT_PRIMARY_TYPE,
+    calculate_method_id,
+    get_function_signature,
+)
 from bankofai.x402.config import NetworkConfig
 from bankofai.x402.exceptions import InsufficientAllowanceError, SignatureCreationError
 from bankofai.x402.signers.client.base import ClientSigner
+from bankofai.x402.signers.utils import encode_payment_permit
+from bankofai.x402.utils.address import tron_address_to_evm
+
+# TRC20 allowance/approve signatures and selector, resolved from ERC20_ABI once at import
+_ALLOWANCE_SIGNATURE = get_function_signature(ERC20_ABI, "allowance")
+_ALLOWANCE_INPUT_TYPES = _ALLOWANCE_SIGNATURE[len("allowance(") : -1].split(",")
+_APPROVE_SIGNATURE = get_function_signature(ERC20_ABI, "approve")
+_APPROVE_INPUT_TYPES = _APPROVE_SIGNATURE[len("approve(") : -1].split(",")
+_APPROVE_METHOD_ID = calculate_method_id(ERC20_ABI, "approve")
+
+try:
+    from eth_abi.abi import encode as _abi_encode
+except ImportError:
+    _abi_encode = None  # type: ignore[assignment]
+
+try:
+    from tronpy.keys import PrivateKey as _PrivateKey
+    from tronpy.keys import to_hex_address as _to_hex_address
+except ImportError:
+    _PrivateKey = None
+    _to_hex_address = None
+
+try:
+    from eth_account import Account as _Account
+    from eth_account.messages import encode_typed_data as _encode_typed_data
+except ImportError:
+    _Account = None  # type: ignore[assignment,misc]
+    _encode_typed_data = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -18,10 +52,17 @@ class TronClientSigner(ClientSigner):
     """TRON client signer implementation"""
 
     def __init__(self, private_key: str) -> None:
+        super().__init__()
         clean_key = private_key[2:] if private_key.startswith("0x") else private_key
         self._private_key = clean_key
-        self._address = self._derive_address(clean_key)
+        self._pk_bytes: bytes = bytes.fromhex(clean_key)
+        self._pk: Any = _PrivateKey(self._pk_bytes) if _PrivateKey is not None else None
+        if self._pk is not None:
+            self._address: str = self._pk.public_key.to_base58check_address()
+        else:
+            self._address = self._derive_address(clean_key)
         self._async_tron_clients: dict[str, Any] = {}
+        self._contract_cache: dict[tuple[str, str], Any] = {}
         logger.info(f"TronClientSigner initialized: address={self._address}")
 
     @classmethod
@@ -47,37 +88,49 @@ class TronClientSigner(ClientSigner):
         """
         if network not in self._async_tron_clients:
             try:
-                from bankofai.x402.utils.tron_client import create_async_tron_client
+                from bankofai.x402.utils.tron_client import get_async_tron_client
 
-                self._async_tron_clients[network] = create_async_tron_client(network)
+                self._async_tron_clients[network] = get_async_tron_client(network)
             except ImportError:
                 return None
         return self._async_tron_clients[network]
 
+    async def _get_cached_contract(self, client: Any, token: str, network: str) -> Any:
+        """Get the TRC20 contract for a token, fetching it once per network.
+
+        Args:
+            client: AsyncTron client for the network
+            token: Token contract address
+            network: Network identifier
+
+        Returns:
+            tronpy AsyncContract with ERC20_ABI applied
+        """
+        key = (network, token)
+        contract = self._contract_cache.get(key)
+        if contract is None:
+            contract = await client.get_contract(token)
+            contract.abi = ERC20_ABI
+            self._contract_cache[key] = contract
+        return contract
+
     @staticmethod
     def _derive_address(private_key: str) -> str:
         """Derive TRON address from private key"""
-        try:
-            from tronpy.keys import PrivateKey
-
-            pk = PrivateKey(bytes.fromhex(private_key))
-            return pk.public_key.to_base58check_address()
-        except ImportError:
+        if _PrivateKey is None:
             return f"T{private_key[:33]}"
+        pk = _PrivateKey(bytes.fromhex(private_key))
+        return pk.public_key.to_base58check_address()
 
     def get_address(self) -> str:
         return self._address
 
     async def sign_message(self, message: bytes) -> str:
         """Sign raw message using ECDSA"""
-        try:
-            from tronpy.keys import PrivateKey
-
-            pk = PrivateKey(bytes.fromhex(self._private_key))
-            signature = pk.sign_msg(message)
-            return signature.hex()
-        except ImportError:
+        if self._pk is None:
             raise SignatureCreationError("tronpy is required for signing")
+        signature = self._pk.sign_msg(message)
+        return signature.hex()
 
     async def sign_typed_data(
         self,
@@ -102,28 +155,28 @@ class TronClientSigner(ClientSigner):
         logger.info(
             f"Signing EIP-712 typed data: domain={domain.get('name')}, primaryType={primary_type}"
         )
-        try:
-            from eth_account import Account
-            from eth_account.messages import encode_typed_data
-
-            # Note: PaymentPermit contract uses EIP712Domain WITHOUT version field
-            # Contract:
-            # keccak256("EIP712Domain(string name,uint256 chainId,address verifyingContract)")
-            full_types = {
-                "EIP712Domain": EIP712_DOMAIN_TYPE,
-                **types,
-            }
-
-            typed_data = {
-                "types": full_types,
-                "primaryType": primary_type,
-                "domain": domain,
-                "message": message,
-            }
-
-            # Log domain and message in same format as TypeScript client
-            import json as json_module
+        if _Account is None:
+            logger.warning("eth_account not available, using fallback signing")
+            data_str = json.dumps({"domain": domain, "types": types, "message": message})
+            return await self.sign_message(data_str.encode())
 
+        # Note: PaymentPermit contract uses EIP712Domain WITHOUT version field
+        # Contract:
+        # keccak256("EIP712Domain(string name,uint256 chainId,address verifyingContract)")
+        full_types = {
+            "EIP712Domain": EIP712_DOMAIN_TYPE,
+            **types,
+        }
+
+        typed_data = {
+            "types": full_types,
+            "primaryType": primary_type,
+            "domain": domain,
+            "message": message,
+        }
+
+        # Log domain and message in same format as TypeScript client
+        if logger.isEnabledFor(logging.INFO):
             # Convert bytes to hex for logging
             message_for_log = dict(message)
             if "meta" in message_for_log and "paymentId" in message_for_log["meta"]:
@@ -132,21 +185,18 @@ class TronClientSigner(ClientSigner):
                     message_for_log["meta"] = dict(message_for_log["meta"])
                     message_for_log["meta"]["paymentId"] = "0x" + pid.hex()
 
-            logger.info(f"[SIGN] Domain: {json_module.dumps(domain)}")
-            logger.info(f"[SIGN] Message: {json_module.dumps(message_for_log)}")
+            logger.info("[SIGN] Domain: %s", json.dumps(domain))
+            logger.info("[SIGN] Message: %s", json.dumps(message_for_log))
 
-            signable = encode_typed_data(full_message=typed_data)
-            # Convert hex private key to bytes for eth_account
-            private_key_bytes = bytes.fromhex(self._private_key)
-            signed_message = Account.sign_message(signable, private_key_bytes)
+        # Fast path for the fixed PaymentPermit layout; generic encoder otherwise
+        signable = encode_payment_permit(domain, types, message)
+        if signable is None:
+            signable = _encode_typed_data(full_message=typed_data)
+        signed_message = _Account.sign_message(signable, self._pk_bytes)
 
-            signature = signed_message.signature.hex()
-            logger.info(f"[SIGN] Signature: 0x{signature}")
-            return signature
-        except ImportError:
-            logger.warning("eth_account not available, using fallback signing")
-            data_str = json.dumps({"domain": domain, "types": types, "message": message})
-            return await self.sign_message(data_str.encode())
+        signature = signed_message.signature.hex()
+        logger.info(f"[SIGN] Signature: 0x{signature}")
+        return signature
 
     async def check_balance(
         self,
@@ -160,8 +210,7 @@ class TronClientSigner(ClientSigner):
             return 0
 
         try:
-            contract = await client.get_contract(token)
-            contract.abi = ERC20_ABI
+            contract = await self._get_cached_contract(client, token, network)
             balance = await contract.functions.balanceOf(self._address)
             balance_int = int(balance)
             from bankofai.x402.tokens import TokenRegistry
@@ -206,13 +255,18 @@ class TronClientSigner(ClientSigner):
             return 0
 
         try:
-            contract = await client.get_contract(token)
-            contract.abi = ERC20_ABI
-            allowance = await contract.functions.allowance(
+            # Constant call with a precomputed selector; skips fetching the contract ABI
+            parameter = _abi_encode(
+                _ALLOWANCE_INPUT_TYPES,
+                [tron_address_to_evm(self._address), tron_address_to_evm(spender)],
+            )
+            result = await client.trigger_const_smart_contract_function(
                 self._address,
-                spender,
+                token,
+                _ALLOWANCE_SIGNATURE,
+                parameter.hex(),
             )
-            allowance_int = int(allowance)
+            allowance_int = int(result, 16)
             logger.info(f"Current allowance: {allowance_int}")
             return allowance_int
         except Exception as e:
@@ -234,9 +288,14 @@ class TronClientSigner(ClientSigner):
             logger.info("Skipping allowance check (mode=skip)")
             return True
 
+        if self._reserve_cached_allowance(token, amount, network):
+            logger.info(f"Sufficient allowance known from recent check: amount={amount}")
+            return True
+
         current = await self.check_allowance(token, amount, network)
         if current >= amount:
             logger.info(f"Sufficient allowance already exists: {current} >= {amount}")
+            self._remember_allowance(token, current - amount, network)
             return True
 
         if mode == "interactive":
@@ -248,19 +307,30 @@ class TronClientSigner(ClientSigner):
             raise InsufficientAllowanceError("AsyncTron client required for approval")
 
         try:
-            from tronpy.keys import PrivateKey
-
             spender = self._get_spender_address(network)
             # Use maxUint160 (2^160 - 1) to avoid repeated approvals
             max_uint160 = (2**160) - 1
             logger.info(f"Approving spender={spender} for amount={max_uint160} (maxUint160)")
-            contract = await client.get_contract(token)
-            contract.abi = ERC20_ABI
-            # AsyncTron: contract.functions.approve() returns a coroutine, need to await it first
-            txn_builder = await contract.functions.approve(spender, max_uint160)
-            txn_builder = txn_builder.with_owner(self._address).fee_limit(100_000_000)
+            # Build approve calldata directly from the precomputed method ID.
+            # trx._build_transaction is the entry point tronpy's own contract
+            # calls use; going through it skips fetching and resolving the ABI.
+            parameter = _abi_encode(
+                _APPROVE_INPUT_TYPES, [tron_address_to_evm(spender), max_uint160]
+            )
+            txn_builder = client.trx._build_transaction(
+                "TriggerSmartContract",
+                {
+                    "owner_address": _to_hex_address(self._address),
+                    "contract_address": _to_hex_address(token),
+                    "data": _APPROVE_METHOD_ID + parameter.hex(),
+                    "call_token_value": 0,
+                    "call_value": 0,
+                    "token_id": 0,
+                },
+            )
+            txn_builder = txn_builder.fee_limit(100_000_000)
             txn = await txn_builder.build()
-            txn = txn.sign(PrivateKey(bytes.fromhex(self._private_key)))
+            txn = txn.sign(self._pk)
             logger.info("Broadcasting approval transaction...")
             result = await txn.broadcast()
             result = await result.wait()
@@ -270,6 +340,7 @@ class TronClientSigner(ClientSigner):
             success = receipt_result == "SUCCESS"
             if success:
                 logger.info(f"Approval successful: txid={result.get('id')}")
+                self._remember_allowance(token, max_uint160 - amount, network)
             else:
                 logger.warning(f"Approval failed: {result}")
             return success
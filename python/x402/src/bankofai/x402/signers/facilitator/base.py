@@ -42,6 +42,25 @@ class FacilitatorSigner(ABC):
         """
         pass
 
+    async def verify_typed_data_batch(
+        self,
+        items: list[tuple[str, dict[str, Any], dict[str, Any], dict[str, Any], str]],
+    ) -> list[bool]:
+        """
+        Verify a batch of EIP-712 typed data signatures.
+
+        The default implementation verifies items one by one; signers may
+        override it to amortize hashing and recovery across the batch.
+
+        Args:
+            items: ``(address, domain, types, message, signature)`` tuples,
+                with the same meaning as the verify_typed_data arguments
+
+        Returns:
+            One validity flag per item, in input order
+        """
+        return [await self.verify_typed_data(*item) for item in items]
+
     @abstractmethod
     async def write_contract(
         self,
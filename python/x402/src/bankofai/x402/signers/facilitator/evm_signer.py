@@ -2,12 +2,26 @@
 EvmFacilitatorSigner - EVM facilitator signer implementation
 """
 
+import json
 import logging
 from typing import Any
 
 from bankofai.x402.abi import PAYMENT_PERMIT_PRIMARY_TYPE
 from bankofai.x402.signers.facilitator.base import FacilitatorSigner
-from bankofai.x402.signers.utils import _eip712_domain_type_from_keys, resolve_provider_uri
+from bankofai.x402.signers.utils import (
+    _eip712_domain_type_from_keys,
+    _payment_id_hex_to_bytes,
+    encode_payment_permit,
+    get_async_web3_client,
+    recover_typed_data_batch_async,
+)
+
+try:
+    from eth_account import Account as _Account
+    from eth_account.messages import encode_typed_data as _encode_typed_data
+except ImportError:
+    _Account = None  # type: ignore[assignment,misc]
+    _encode_typed_data = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -31,9 +45,9 @@ class EvmFacilitatorSigner(FacilitatorSigner):
     @staticmethod
     def _derive_address(private_key: str) -> str:
         """Derive EVM address from private key"""
-        from eth_account import Account
-
-        return Account.from_key(private_key).address
+        if _Account is None:
+            raise ImportError("eth_account is required for EVM signers")
+        return _Account.from_key(private_key).address
 
     def get_address(self) -> str:
         return self._address
@@ -41,13 +55,7 @@ class EvmFacilitatorSigner(FacilitatorSigner):
     def _ensure_async_web3_client(self, network: str) -> Any:
         """Lazy initialize async web3 client for the given network."""
         if network not in self._async_web3_clients:
-            from web3 import AsyncHTTPProvider, AsyncWeb3
-            from web3.middleware import ExtraDataToPOAMiddleware
-
-            provider_uri = resolve_provider_uri(network)
-            w3 = AsyncWeb3(AsyncHTTPProvider(provider_uri))
-            w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-            self._async_web3_clients[network] = w3
+            self._async_web3_clients[network] = get_async_web3_client(network)
 
         return self._async_web3_clients[network]
 
@@ -61,9 +69,6 @@ class EvmFacilitatorSigner(FacilitatorSigner):
     ) -> bool:
         """Verify EIP-712 signature"""
         try:
-            from eth_account import Account
-            from eth_account.messages import encode_typed_data
-
             # TODO: Refactor FacilitatorSigner interface to accept primary_type explicitly
             primary_type = (
                 PAYMENT_PERMIT_PRIMARY_TYPE
@@ -72,12 +77,7 @@ class EvmFacilitatorSigner(FacilitatorSigner):
             )
 
             # Convert paymentId from hex string to bytes for eth_account compatibility
-            message_copy = dict(message)
-            if "meta" in message_copy and "paymentId" in message_copy["meta"]:
-                payment_id = message_copy["meta"]["paymentId"]
-                if isinstance(payment_id, str) and payment_id.startswith("0x"):
-                    message_copy["meta"] = dict(message_copy["meta"])
-                    message_copy["meta"]["paymentId"] = bytes.fromhex(payment_id[2:])
+            message_copy = _payment_id_hex_to_bytes(message)
 
             # Build EIP712Domain type dynamically from domain keys
             domain_type = _eip712_domain_type_from_keys(domain)
@@ -89,15 +89,33 @@ class EvmFacilitatorSigner(FacilitatorSigner):
                 "message": message_copy,
             }
 
-            signable = encode_typed_data(full_message=typed_data)
+            # Fast path for the fixed PaymentPermit layout; generic encoder otherwise
+            signable = encode_payment_permit(domain, types, message_copy)
+            if signable is None:
+                signable = _encode_typed_data(full_message=typed_data)
             sig_bytes = bytes.fromhex(signature[2:] if signature.startswith("0x") else signature)
-            recovered = Account.recover_message(signable, signature=sig_bytes)
+            recovered = _Account.recover_message(signable, signature=sig_bytes)
 
             return recovered.lower() == address.lower()
         except Exception as e:
             logger.error("Signature verification failed", extra={"error": str(e)})
             return False
 
+    async def verify_typed_data_batch(
+        self,
+        items: list[tuple[str, dict[str, Any], dict[str, Any], dict[str, Any], str]],
+    ) -> list[bool]:
+        """Verify a batch of EIP-712 signatures with shared domain hashing"""
+        prepared = [
+            (domain, types, _payment_id_hex_to_bytes(message), signature)
+            for _, domain, types, message, signature in items
+        ]
+        recovered = await recover_typed_data_batch_async(prepared)
+        return [
+            signer is not None and signer.lower() == item[0].lower()
+            for signer, item in zip(recovered, items)
+        ]
+
     async def write_contract(
         self,
         contract_address: str,
@@ -112,8 +130,6 @@ class EvmFacilitatorSigner(FacilitatorSigner):
             return None
 
         try:
-            import json
-
             abi_list = json.loads(abi) if isinstance(abi, str) else abi
             contract = w3.eth.contract(address=contract_address, abi=abi_list)
             func = getattr(contract.functions, method)
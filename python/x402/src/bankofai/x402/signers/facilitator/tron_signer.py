@@ -3,11 +3,98 @@ TronFacilitatorSigner - TRON facilitator signer implementation
 """
 
 import asyncio
-import time
+import functools
+import json
+import logging
 from typing import Any
 
 from bankofai.x402.abi import EIP712_DOMAIN_TYPE, PAYMENT_PERMIT_PRIMARY_TYPE
 from bankofai.x402.signers.facilitator.base import FacilitatorSigner
+from bankofai.x402.signers.utils import (
+    _payment_id_hex_to_bytes,
+    encode_payment_permit,
+    recover_typed_data_batch_async,
+)
+from bankofai.x402.utils.address import tron_address_to_evm
+
+try:
+    from tronpy.keys import PrivateKey as _PrivateKey
+    from tronpy.keys import to_base58check_address as _to_base58check_address
+except ImportError:
+    _PrivateKey = None
+    _to_base58check_address = None
+
+try:
+    from eth_account import Account as _Account
+    from eth_account.messages import encode_typed_data as _encode_typed_data
+except ImportError:
+    _Account = None  # type: ignore[assignment,misc]
+    _encode_typed_data = None  # type: ignore[assignment]
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+def _serialize_contract_args(args: list[Any]) -> list[Any]:
+    """Convert contract call arguments to a JSON-serializable structure.
+
+    Nested tuples, lists and dicts are walked with an explicit stack rather
+    than recursion. Bytes become 0x-hex and ints are shown as decimal and hex.
+    """
+    result: list[Any] = [None] * len(args)
+    stack: list[tuple[Any, Any, Any]] = [(arg, result, i) for i, arg in enumerate(args)]
+    while stack:
+        value, parent, key = stack.pop()
+        if isinstance(value, bytes):
+            parent[key] = f"0x{value.hex()}"
+        elif isinstance(value, (tuple, list)):
+            items: list[Any] = [None] * len(value)
+            parent[key] = items
+            stack.extend((item, items, i) for i, item in enumerate(value))
+        elif isinstance(value, dict):
+            mapping = dict.fromkeys(value)
+            parent[key] = mapping
+            stack.extend((item, mapping, k) for k, item in value.items())
+        elif isinstance(value, int):
+            parent[key] = {"decimal": value, "hex": f"0x{value:x}"}
+        elif isinstance(value, str):
+            parent[key] = value
+        else:
+            parent[key] = str(value)
+    return result
+
+
+@functools.lru_cache(maxsize=1024)
+def _evm_to_tron_cached(evm_address_lower: str) -> str:
+    """Convert a lowercase 0x-prefixed EVM address to TRON Base58Check.
+
+    Memoized: the same facilitator, buyer and contract addresses recur, and
+    each conversion costs a double SHA-256 plus Base58 encoding.
+    """
+    return _to_base58check_address("41" + evm_address_lower[2:])
+
+
+@functools.lru_cache(maxsize=1024)
+def _expected_signer_bytes(address: str) -> bytes:
+    """Return the 20-byte EVM form of an expected signer address.
+
+    Accepts TRON Base58, TRON hex or EVM hex. Memoized per address, so repeat
+    buyers skip the Base58 decode. Unparseable addresses map to b"", which
+    never matches a recovered signer.
+    """
+    try:
+        return bytes.fromhex(tron_address_to_evm(address)[2:])
+    except ValueError:
+        return b""
+
+
+# Receipt polling backoff (seconds)
+RECEIPT_POLL_INITIAL_DELAY = 0.5
+RECEIPT_POLL_MAX_DELAY = 3.0
 
 
 class TronFacilitatorSigner(FacilitatorSigner):
@@ -16,8 +103,15 @@ class TronFacilitatorSigner(FacilitatorSigner):
     def __init__(self, private_key: str) -> None:
         clean_key = private_key[2:] if private_key.startswith("0x") else private_key
         self._private_key = clean_key
-        self._address = self._derive_address(clean_key)
+        self._pk_bytes: bytes = bytes.fromhex(clean_key)
+        self._pk: Any = _PrivateKey(self._pk_bytes) if _PrivateKey is not None else None
+        if self._pk is not None:
+            self._address: str = self._pk.public_key.to_base58check_address()
+        else:
+            self._address = self._derive_address(clean_key)
         self._async_tron_clients: dict[str, Any] = {}
+        self._contract_cache: dict[tuple[str, str, str], Any] = {}
+        self._function_cache: dict[tuple[str, str, str, str], Any] = {}
 
     @classmethod
     def from_private_key(cls, private_key: str) -> "TronFacilitatorSigner":
@@ -32,23 +126,58 @@ class TronFacilitatorSigner(FacilitatorSigner):
         """
         if network not in self._async_tron_clients:
             try:
-                from bankofai.x402.utils.tron_client import create_async_tron_client
+                from bankofai.x402.utils.tron_client import get_async_tron_client
 
-                self._async_tron_clients[network] = create_async_tron_client(network)
+                self._async_tron_clients[network] = get_async_tron_client(network)
             except ImportError:
                 return None
         return self._async_tron_clients[network]
 
+    async def _get_contract_function(
+        self, client: Any, contract_address: str, abi: Any, method: str, network: str
+    ) -> Any:
+        """Get a contract method object, reusing parsed ABIs and fetched contracts.
+
+        Contracts are cached per (network, address, ABI string) and method
+        objects per method name on top of that, so repeated settlements skip
+        the ABI JSON parse and the getcontract RPC. ABIs passed as parsed lists
+        are not cached. The ABI is parsed with orjson when it is installed.
+
+        Args:
+            client: AsyncTron client for the network
+            contract_address: Normalized Base58 contract address
+            abi: Contract ABI as a JSON string or parsed list
+            method: Contract method name
+            network: Network identifier
+
+        Returns:
+            tronpy AsyncContractMethod
+        """
+        if not isinstance(abi, str):
+            contract = await client.get_contract(contract_address)
+            contract.abi = abi
+            return getattr(contract.functions, method)
+
+        func_key = (network, contract_address, abi, method)
+        func = self._function_cache.get(func_key)
+        if func is None:
+            contract_key = (network, contract_address, abi)
+            contract = self._contract_cache.get(contract_key)
+            if contract is None:
+                contract = await client.get_contract(contract_address)
+                contract.abi = _orjson.loads(abi) if _orjson is not None else json.loads(abi)
+                self._contract_cache[contract_key] = contract
+            func = getattr(contract.functions, method)
+            self._function_cache[func_key] = func
+        return func
+
     @staticmethod
     def _derive_address(private_key: str) -> str:
         """Derive TRON address from private key"""
-        try:
-            from tronpy.keys import PrivateKey
-
-            pk = PrivateKey(bytes.fromhex(private_key))
-            return pk.public_key.to_base58check_address()
-        except ImportError:
+        if _PrivateKey is None:
             return f"T{private_key[:33]}"
+        pk = _PrivateKey(bytes.fromhex(private_key))
+        return pk.public_key.to_base58check_address()
 
     def get_address(self) -> str:
         return self._address
@@ -63,15 +192,6 @@ class TronFacilitatorSigner(FacilitatorSigner):
     ) -> bool:
         """Verify EIP-712 signature"""
         try:
-            import logging
-
-            logger = logging.getLogger(__name__)
-
-            from eth_account import Account
-            from eth_account.messages import encode_typed_data
-
-            from bankofai.x402.utils.address import tron_address_to_evm
-
             # Note: PaymentPermit contract uses EIP712Domain WITHOUT version field
             # Contract:
             # keccak256("EIP712Domain(string name,uint256 chainId,address verifyingContract)")
@@ -84,12 +204,7 @@ class TronFacilitatorSigner(FacilitatorSigner):
 
             # Convert paymentId from hex string to bytes for eth_account compatibility
             # TronWeb signs with hex strings, but eth_account expects bytes for bytes16
-            message_copy = dict(message)
-            if "meta" in message_copy and "paymentId" in message_copy["meta"]:
-                payment_id = message_copy["meta"]["paymentId"]
-                if isinstance(payment_id, str) and payment_id.startswith("0x"):
-                    message_copy["meta"] = dict(message_copy["meta"])
-                    message_copy["meta"]["paymentId"] = bytes.fromhex(payment_id[2:])
+            message_copy = _payment_id_hex_to_bytes(message)
 
             typed_data = {
                 "types": full_types,
@@ -98,53 +213,77 @@ class TronFacilitatorSigner(FacilitatorSigner):
                 "message": message_copy,
             }
 
-            signable = encode_typed_data(full_message=typed_data)
+            # Fast path for the fixed PaymentPermit layout; generic encoder otherwise
+            signable = encode_payment_permit(domain, types, message_copy)
+            if signable is None:
+                signable = _encode_typed_data(full_message=typed_data)
 
             sig_bytes = bytes.fromhex(signature[2:] if signature.startswith("0x") else signature)
-            recovered = Account.recover_message(signable, signature=sig_bytes)
+            recovered = _Account.recover_message(signable, signature=sig_bytes)
 
-            # Convert expected TRON address to EVM format for comparison
-            expected_evm = tron_address_to_evm(address)
+            # Compare in EVM byte space; no Base58 encoding on this path
+            expected_evm = _expected_signer_bytes(address)
 
             logger.info(
-                "Signature verification: expected_tron=%s, expected_evm=%s, recovered=%s",
+                "Signature verification: expected_tron=%s, expected_evm=0x%s, recovered=%s",
                 address,
-                expected_evm,
+                expected_evm.hex(),
                 recovered,
             )
 
-            return recovered.lower() == expected_evm.lower()
+            return bytes.fromhex(recovered[2:]) == expected_evm
         except Exception as e:
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.error(f"Signature verification error: {e}", exc_info=True)
             return False
 
+    async def verify_typed_data_batch(
+        self,
+        items: list[tuple[str, dict[str, Any], dict[str, Any], dict[str, Any], str]],
+    ) -> list[bool]:
+        """Verify a batch of EIP-712 signatures with shared domain hashing"""
+        # Same constraints as verify_typed_data: PaymentPermit domain fields
+        # and PaymentPermitDetails as primary type
+        domain_fields = {field["name"] for field in EIP712_DOMAIN_TYPE}
+        prepared = [
+            (domain, types, _payment_id_hex_to_bytes(message), signature)
+            for _, domain, types, message, signature in items
+        ]
+        recovered = await recover_typed_data_batch_async(prepared)
+
+        results: list[bool] = []
+        for signer, (address, domain, types, _, _) in zip(recovered, items):
+            if (
+                signer is None
+                or set(domain) != domain_fields
+                or PAYMENT_PERMIT_PRIMARY_TYPE not in types
+            ):
+                results.append(False)
+                continue
+            results.append(bytes.fromhex(signer[2:]) == _expected_signer_bytes(address))
+        return results
+
     def _evm_to_tron_address(self, evm_address: str) -> str:
         """Convert EVM address to TRON address"""
-        try:
-            from tronpy.keys import to_base58check_address
-
-            hex_addr = "41" + evm_address[2:].lower()
-            return to_base58check_address(hex_addr)
-        except ImportError:
+        if _to_base58check_address is None:
             return evm_address
+        return _evm_to_tron_cached(evm_address.lower())
 
-    def _normalize_tron_address(self, address: str) -> str:
-        """Normalize TRON address to valid Base58Check format"""
-        try:
-            from tronpy.keys import to_base58check_address
-
-            # If it's a hex address (0x...), convert to TRON address
-            if address.startswith("0x") and len(address) == 42:
-                hex_addr = "41" + address[2:].lower()
-                return to_base58check_address(hex_addr)
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _normalize_tron_address(address: str) -> str:
+        """Normalize TRON address to valid Base58Check format.
 
+        Cached, since contract addresses are fixed per network deployment.
+        """
+        try:
             # If it starts with T, assume it's already a valid TRON address
             if address.startswith("T"):
                 return address
 
+            # If it's a hex address (0x...), convert to TRON address
+            if address.startswith("0x") and len(address) == 42:
+                return _evm_to_tron_cached(address.lower())
+
             # Otherwise return as-is
             return address
         except Exception:
@@ -162,13 +301,6 @@ class TronFacilitatorSigner(FacilitatorSigner):
 
         Uses AsyncTron for non-blocking operations.
         """
-        import json as json_module
-        import logging
-
-        from tronpy.keys import PrivateKey
-
-        logger = logging.getLogger(__name__)
-
         client = self._ensure_async_tron_client(network)
         if client is None:
             raise RuntimeError("AsyncTron client required for contract calls")
@@ -176,45 +308,26 @@ class TronFacilitatorSigner(FacilitatorSigner):
         try:
             # Normalize contract address to ensure valid Base58Check format
             normalized_address = self._normalize_tron_address(contract_address)
-            logger.info(f"Normalized contract address: {contract_address} -> {normalized_address}")
+            logger.info(
+                "Normalized contract address: %s -> %s", contract_address, normalized_address
+            )
 
-            # Log account resources before transaction
-            try:
-                account_info = await client.get_account(self._address)
-                account_resource = await client.get_account_resource(self._address)
-                logger.info(f"Account address: {self._address}")
-                logger.info(
-                    f"Account balance: {account_info.get('balance', 0) / 1_000_000:.6f} TRX"
-                )
-                logger.info("Account resources:")
-                logger.info(f"  - freeNetLimit: {account_resource.get('freeNetLimit', 0)}")
-                logger.info(f"  - freeNetUsed: {account_resource.get('freeNetUsed', 0)}")
-                logger.info(f"  - NetLimit: {account_resource.get('NetLimit', 0)}")
-                logger.info(f"  - NetUsed: {account_resource.get('NetUsed', 0)}")
-                logger.info(f"  - EnergyLimit: {account_resource.get('EnergyLimit', 0)}")
-                logger.info(f"  - EnergyUsed: {account_resource.get('EnergyUsed', 0)}")
-                logger.info(f"  - TotalEnergyLimit: {account_resource.get('TotalEnergyLimit', 0)}")
-                logger.info(
-                    f"  - TotalEnergyWeight: {account_resource.get('TotalEnergyWeight', 0)}"
-                )
-            except Exception as resource_err:
-                logger.warning(f"Failed to fetch account resources: {resource_err}")
+            # Log account resources before transaction (two extra RPCs, so only
+            # when INFO logging is on)
+            await self._log_account_resources(client)
 
             # Log contract call parameters in detail
             self._log_contract_parameters(method, args, logger)
 
             # Use AsyncTron standard approach - let tronpy calculate Method ID
-            abi_list = json_module.loads(abi) if isinstance(abi, str) else abi
-            contract = await client.get_contract(normalized_address)
-            contract.abi = abi_list
-
-            # Get function object
-            func = getattr(contract.functions, method)
+            func = await self._get_contract_function(
+                client, normalized_address, abi, method, network
+            )
 
             # Log tronpy calculated Method ID
-            logger.info(f"Function: {method}")
-            logger.info(f"  Signature: {func.function_signature}")
-            logger.info(f"  Method ID: {func.function_signature_hash}")
+            logger.info("Function: %s", method)
+            logger.info("  Signature: %s", func.function_signature)
+            logger.info("  Method ID: %s", func.function_signature_hash)
 
             # Build and sign transaction
             logger.info("Building transaction with fee_limit=1,000,000,000 SUN (1000 TRX)")
@@ -222,19 +335,10 @@ class TronFacilitatorSigner(FacilitatorSigner):
             txn_builder = await func(*args)
             txn_builder = txn_builder.with_owner(self._address).fee_limit(1_000_000_000)
             txn = await txn_builder.build()
-            txn = txn.sign(PrivateKey(bytes.fromhex(self._private_key)))
+            txn = txn.sign(self._pk)
 
             # Log transaction details before broadcast
-            try:
-                txn_dict = txn.to_json()
-                logger.info("Transaction built successfully:")
-                logger.info(f"  - txID: {txn_dict.get('txID', 'N/A')}")
-                logger.info(f"  - raw_data_hex length: {len(txn_dict.get('raw_data_hex', ''))}")
-                logger.info(
-                    f"  - fee_limit: {txn_dict.get('raw_data', {}).get('fee_limit', 'N/A')}"
-                )
-            except Exception as log_err:
-                logger.warning(f"Failed to log transaction details: {log_err}")
+            self._log_transaction_details(txn)
 
             logger.info("Broadcasting transaction...")
             result = await txn.broadcast()
@@ -273,32 +377,53 @@ class TronFacilitatorSigner(FacilitatorSigner):
             logger.error("Full exception details:", exc_info=True)
             return None
 
+    async def _log_account_resources(self, client: Any) -> None:
+        """Log the facilitator account's TRX balance and bandwidth/energy resources"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        try:
+            account_info = await client.get_account(self._address)
+            account_resource = await client.get_account_resource(self._address)
+            logger.info("Account address: %s", self._address)
+            logger.info("Account balance: %.6f TRX", account_info.get("balance", 0) / 1_000_000)
+            logger.info("Account resources:")
+            for key in (
+                "freeNetLimit",
+                "freeNetUsed",
+                "NetLimit",
+                "NetUsed",
+                "EnergyLimit",
+                "EnergyUsed",
+                "TotalEnergyLimit",
+                "TotalEnergyWeight",
+            ):
+                logger.info("  - %s: %s", key, account_resource.get(key, 0))
+        except Exception as resource_err:
+            logger.warning(f"Failed to fetch account resources: {resource_err}")
+
+    def _log_transaction_details(self, txn: Any) -> None:
+        """Log the built transaction's id, size and fee limit"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        try:
+            txn_dict = txn.to_json()
+            logger.info("Transaction built successfully:")
+            logger.info("  - txID: %s", txn_dict.get("txID", "N/A"))
+            logger.info("  - raw_data_hex length: %d", len(txn_dict.get("raw_data_hex", "")))
+            logger.info("  - fee_limit: %s", txn_dict.get("raw_data", {}).get("fee_limit", "N/A"))
+        except Exception as log_err:
+            logger.warning(f"Failed to log transaction details: {log_err}")
+
     def _log_contract_parameters(self, method: str, args: list[Any], logger: Any) -> None:
         """Log contract call parameters as a complete JSON"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
         try:
-            import json
-
-            # Convert arguments to JSON-serializable format
-            def serialize_value(value: Any) -> Any:
-                """Recursively convert values to JSON-serializable format"""
-                if isinstance(value, bytes):
-                    return f"0x{value.hex()}"
-                elif isinstance(value, (tuple, list)):
-                    return [serialize_value(item) for item in value]
-                elif isinstance(value, dict):
-                    return {k: serialize_value(v) for k, v in value.items()}
-                elif isinstance(value, int):
-                    return {"decimal": value, "hex": f"0x{value:x}"}
-                elif isinstance(value, str):
-                    return value
-                else:
-                    return str(value)
-
-            # Build the complete parameter structure
-            contract_call = {"method": method, "arguments": [serialize_value(arg) for arg in args]}
-
-            # Output as formatted JSON
-            json_output = json.dumps(contract_call, indent=2, ensure_ascii=False)
+            contract_call = {"method": method, "arguments": _serialize_contract_args(args)}
+
+            # Pretty-print only when debugging; indentation multiplies the output size
+            indent = 2 if logger.isEnabledFor(logging.DEBUG) else None
+            json_output = json.dumps(contract_call, indent=indent, ensure_ascii=False)
             logger.info(
                 f"\n{'=' * 80}\nContract Call Parameters:\n{'=' * 80}\n{json_output}\n{'=' * 80}"
             )
@@ -311,13 +436,21 @@ class TronFacilitatorSigner(FacilitatorSigner):
         timeout: int = 60,
         network: str = "",
     ) -> dict[str, Any]:
-        """Wait for TRON transaction confirmation (async with 60s default timeout)"""
+        """Wait for TRON transaction confirmation (async with 60s default timeout)
+
+        Polls with exponential backoff (0.5s, 1s, 2s, then every 3s) so fast
+        confirmations are picked up quickly without hammering the node. The
+        deadline uses the event loop's monotonic clock, and the last sleep is
+        trimmed so a final poll happens right at the timeout.
+        """
         client = self._ensure_async_tron_client(network)
         if client is None:
             raise RuntimeError("AsyncTron client required")
 
-        start = time.time()
-        while time.time() - start < timeout:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = RECEIPT_POLL_INITIAL_DELAY
+        while True:
             try:
                 # Use AsyncTron's get_transaction_info
                 info = await client.get_transaction_info(tx_hash)
@@ -331,6 +464,10 @@ class TronFacilitatorSigner(FacilitatorSigner):
                     }
             except Exception:
                 pass
-            await asyncio.sleep(3)
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, RECEIPT_POLL_MAX_DELAY)
 
         raise TimeoutError(f"Transaction {tx_hash} not confirmed within {timeout}s")
@@ -2,10 +2,52 @@
 Signer utility functions
 """
 
+import asyncio
+import atexit
+import functools
+import json
+import os
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
+from bankofai.x402.abi import EIP712_DOMAIN_TYPE, get_payment_permit_eip712_types
 from bankofai.x402.config import NetworkConfig
 
+try:
+    from eth_abi.abi import encode as _abi_encode
+    from eth_account.messages import SignableMessage as _SignableMessage
+    from eth_utils.crypto import keccak as _keccak
+except ImportError:
+    _abi_encode = None  # type: ignore[assignment]
+    _SignableMessage = None  # type: ignore[assignment,misc]
+    _keccak = None  # type: ignore[assignment]
+
+# Shared web3 AsyncHTTPProvider per endpoint URI. web3 caches one aiohttp
+# session per provider, so sharing the provider lets every signer reuse the
+# same connection pool instead of opening a fresh one per instance.
+_async_web3_providers: dict[str, Any] = {}
+
+# Shared AsyncWeb3 clients per endpoint URI, handed out to every signer
+_async_web3_clients: dict[str, Any] = {}
+
+# Guards the shared web3 caches; they are process-wide and may be populated
+# from several threads (each running its own event loop) at once
+_async_web3_lock = threading.RLock()
+
+# Connection limit for the keep-alive aiohttp session behind each shared provider
+WEB3_POOL_MAX_CONNECTIONS = 32
+
+# Signature batches at least this large are split across worker processes;
+# smaller ones are not worth the pickling round-trip
+PARALLEL_VERIFY_MIN_BATCH = 64
+
+# Lazily created pool for CPU-bound signature recovery
+_verify_pool: ProcessPoolExecutor | None = None
+_verify_pool_workers = os.cpu_count() or 1
+_verify_pool_lock = threading.Lock()
+
 # Canonical EIP-712 domain field order and types
 _EIP712_DOMAIN_FIELDS: list[tuple[str, str]] = [
     ("name", "string"),
@@ -16,6 +58,160 @@ _EIP712_DOMAIN_FIELDS: list[tuple[str, str]] = [
 ]
 
 
+# EIP-712 encodeType strings for PaymentPermitDetails. Referenced struct
+# types are appended in alphabetical order, as the spec requires.
+_EIP712_DOMAIN_TYPE_STRING = "EIP712Domain(string name,uint256 chainId,address verifyingContract)"
+_PERMIT_META_TYPE_STRING = (
+    "PermitMeta(uint8 kind,bytes16 paymentId,uint256 nonce,uint256 validAfter,uint256 validBefore)"
+)
+_PAYMENT_TYPE_STRING = "Payment(address payToken,uint256 payAmount,address payTo)"
+_FEE_TYPE_STRING = "Fee(address feeTo,uint256 feeAmount)"
+_PAYMENT_PERMIT_DETAILS_TYPE_STRING = (
+    "PaymentPermitDetails(PermitMeta meta,address buyer,address caller,Payment payment,Fee fee)"
+    + _FEE_TYPE_STRING
+    + _PAYMENT_TYPE_STRING
+    + _PERMIT_META_TYPE_STRING
+)
+
+# Private snapshot of the PaymentPermit layout the hard-coded typehashes above
+# were derived from; callers' types are compared against it
+_PAYMENT_PERMIT_TYPES = get_payment_permit_eip712_types()
+_PAYMENT_PERMIT_DOMAIN_FIELDS = frozenset(field["name"] for field in EIP712_DOMAIN_TYPE)
+
+if _keccak is not None:
+    _EIP712_DOMAIN_TYPEHASH = _keccak(text=_EIP712_DOMAIN_TYPE_STRING)
+    _PERMIT_META_TYPEHASH = _keccak(text=_PERMIT_META_TYPE_STRING)
+    _PAYMENT_TYPEHASH = _keccak(text=_PAYMENT_TYPE_STRING)
+    _FEE_TYPEHASH = _keccak(text=_FEE_TYPE_STRING)
+    _PAYMENT_PERMIT_DETAILS_TYPEHASH = _keccak(text=_PAYMENT_PERMIT_DETAILS_TYPE_STRING)
+
+
+def _to_bytes(value: Any) -> bytes:
+    """Convert a bytes value or (0x-prefixed) hex string to bytes"""
+    if isinstance(value, bytes):
+        return value
+    return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+
+
+def hash_payment_permit_domain(domain: dict[str, Any]) -> bytes:
+    """Hash a PaymentPermit EIP-712 domain (name, chainId, verifyingContract).
+
+    The separator only depends on the deployment, so it is memoized.
+    """
+    return _payment_permit_domain_separator(
+        domain["name"],
+        int(domain["chainId"]),
+        _to_bytes(domain["verifyingContract"]),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _payment_permit_domain_separator(name: str, chain_id: int, verifying_contract: bytes) -> bytes:
+    return _keccak(
+        _abi_encode(
+            ["bytes32", "bytes32", "uint256", "address"],
+            [_EIP712_DOMAIN_TYPEHASH, _keccak(text=name), chain_id, verifying_contract],
+        )
+    )
+
+
+def hash_payment_permit_details(message: dict[str, Any]) -> bytes:
+    """Compute the EIP-712 hashStruct of a PaymentPermitDetails message.
+
+    Specialized for the fixed PaymentPermit layout, so the type definitions
+    are not walked on every call. Equivalent to eth_account's generic
+    ``hash_eip712_message`` for the same message.
+    """
+    meta = message["meta"]
+    payment = message["payment"]
+    fee = message["fee"]
+
+    meta_hash = _keccak(
+        _abi_encode(
+            ["bytes32", "uint8", "bytes16", "uint256", "uint256", "uint256"],
+            [
+                _PERMIT_META_TYPEHASH,
+                int(meta["kind"]),
+                _to_bytes(meta["paymentId"]),
+                int(meta["nonce"]),
+                int(meta["validAfter"]),
+                int(meta["validBefore"]),
+            ],
+        )
+    )
+    payment_hash = _payment_struct_hash(
+        _to_bytes(payment["payToken"]),
+        int(payment["payAmount"]),
+        _to_bytes(payment["payTo"]),
+    )
+    fee_hash = _fee_struct_hash(_to_bytes(fee["feeTo"]), int(fee["feeAmount"]))
+    return _keccak(
+        _abi_encode(
+            ["bytes32", "bytes32", "address", "address", "bytes32", "bytes32"],
+            [
+                _PAYMENT_PERMIT_DETAILS_TYPEHASH,
+                meta_hash,
+                _to_bytes(message["buyer"]),
+                _to_bytes(message["caller"]),
+                payment_hash,
+                fee_hash,
+            ],
+        )
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _payment_struct_hash(pay_token: bytes, pay_amount: int, pay_to: bytes) -> bytes:
+    # Repeat payments to the same resource share the token, price and payee
+    return _keccak(
+        _abi_encode(
+            ["bytes32", "address", "uint256", "address"],
+            [_PAYMENT_TYPEHASH, pay_token, pay_amount, pay_to],
+        )
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _fee_struct_hash(fee_to: bytes, fee_amount: int) -> bytes:
+    return _keccak(
+        _abi_encode(["bytes32", "address", "uint256"], [_FEE_TYPEHASH, fee_to, fee_amount])
+    )
+
+
+def encode_payment_permit(
+    domain: dict[str, Any],
+    types: dict[str, Any],
+    message: dict[str, Any],
+) -> Any:
+    """Build the signable EIP-712 message for a PaymentPermitDetails payload.
+
+    Uses the specialized hashing above instead of ``encode_typed_data``.
+
+    Args:
+        domain: EIP-712 domain
+        types: EIP-712 types (without EIP712Domain)
+        message: PaymentPermitDetails message
+
+    Returns:
+        eth_account SignableMessage, or None when the payload is not the
+        canonical PaymentPermit layout and the generic encoder must be used
+    """
+    if (
+        _keccak is None
+        or types != _PAYMENT_PERMIT_TYPES
+        or domain.keys() != _PAYMENT_PERMIT_DOMAIN_FIELDS
+    ):
+        return None
+    try:
+        return _SignableMessage(
+            b"\x01",
+            hash_payment_permit_domain(domain),
+            hash_payment_permit_details(message),
+        )
+    except Exception:
+        return None
+
+
 def _eip712_domain_type_from_keys(domain: dict[str, Any]) -> list[dict[str, str]]:
     """Build an EIP712Domain type array from the keys present in *domain*.
 
@@ -41,3 +237,217 @@ def resolve_provider_uri(network: str) -> str | None:
     if network.startswith(("http://", "https://", "ws://", "wss://")):
         return network
     return NetworkConfig.get_rpc_url(network)
+
+
+@functools.cache
+def _pooled_async_http_provider_class() -> type:
+    """Build the keep-alive AsyncHTTPProvider subclass on first use.
+
+    web3 is imported lazily, so the subclass is created here rather than at
+    module import time.
+    """
+    from aiohttp import ClientSession, TCPConnector
+    from web3 import AsyncHTTPProvider
+
+    class PooledAsyncHTTPProvider(AsyncHTTPProvider):
+        """AsyncHTTPProvider that keeps its connections alive between RPCs.
+
+        web3's default aiohttp session uses ``force_close=True``, which opens a
+        new TCP/TLS connection for every call. This provider registers a pooled
+        keep-alive session for each event loop before its first request.
+        """
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            self._pooled_loops: weakref.WeakSet[asyncio.AbstractEventLoop] = weakref.WeakSet()
+
+        async def _ensure_pooled_session(self) -> None:
+            loop = asyncio.get_running_loop()
+            if loop in self._pooled_loops:
+                return
+            session = ClientSession(
+                raise_for_status=True,
+                connector=TCPConnector(limit=WEB3_POOL_MAX_CONNECTIONS),
+            )
+            cached = await self.cache_async_session(session)
+            if cached is not session:
+                # Another coroutine registered a session for this loop first
+                await session.close()
+            self._pooled_loops.add(loop)
+
+        async def _make_request(self, method: Any, request_data: bytes) -> bytes:
+            await self._ensure_pooled_session()
+            return await super()._make_request(method, request_data)
+
+        async def make_batch_request(self, batch_requests: Any) -> Any:
+            await self._ensure_pooled_session()
+            return await super().make_batch_request(batch_requests)
+
+    return PooledAsyncHTTPProvider
+
+
+def create_async_web3_client(network: str) -> Any:
+    """Create an AsyncWeb3 client for the given network.
+
+    The underlying HTTP provider is shared across all clients that resolve to
+    the same endpoint, so their RPCs go through one keep-alive connection pool.
+
+    Args:
+        network: Network identifier (e.g., "eip155:97") or direct URL
+
+    Returns:
+        web3.AsyncWeb3 instance with the POA extra-data middleware injected
+    """
+    from web3 import AsyncWeb3
+    from web3.middleware import ExtraDataToPOAMiddleware
+
+    provider_uri = resolve_provider_uri(network)
+    cache_key = provider_uri or ""
+    provider = _async_web3_providers.get(cache_key)
+    if provider is None:
+        with _async_web3_lock:
+            provider = _async_web3_providers.get(cache_key)
+            if provider is None:
+                provider = _pooled_async_http_provider_class()(provider_uri)
+                _async_web3_providers[cache_key] = provider
+
+    w3 = AsyncWeb3(provider)
+    w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+    return w3
+
+
+def get_async_web3_client(network: str) -> Any:
+    """Get the shared AsyncWeb3 client for the given network.
+
+    Signers targeting the same endpoint share one client instead of each
+    building their own.
+
+    Args:
+        network: Network identifier (e.g., "eip155:97") or direct URL
+
+    Returns:
+        web3.AsyncWeb3 instance with the POA extra-data middleware injected
+    """
+    cache_key = resolve_provider_uri(network) or ""
+    w3 = _async_web3_clients.get(cache_key)
+    if w3 is None:
+        with _async_web3_lock:
+            w3 = _async_web3_clients.get(cache_key)
+            if w3 is None:
+                w3 = create_async_web3_client(network)
+                _async_web3_clients[cache_key] = w3
+    return w3
+
+
+def _payment_id_hex_to_bytes(message: dict[str, Any]) -> dict[str, Any]:
+    """Return *message* with a hex ``meta.paymentId`` converted to bytes.
+
+    TronWeb signs bytes16 fields as hex strings, but eth_account expects bytes.
+    The input message is not modified.
+    """
+    message_copy = dict(message)
+    if "meta" in message_copy and "paymentId" in message_copy["meta"]:
+        payment_id = message_copy["meta"]["paymentId"]
+        if isinstance(payment_id, str) and payment_id.startswith("0x"):
+            message_copy["meta"] = dict(message_copy["meta"])
+            message_copy["meta"]["paymentId"] = bytes.fromhex(payment_id[2:])
+    return message_copy
+
+
+def recover_typed_data_batch(
+    items: list[tuple[dict[str, Any], dict[str, Any], dict[str, Any], str]],
+) -> list[str | None]:
+    """Recover the signer of each EIP-712 ``(domain, types, message, signature)`` item.
+
+    All digests are built up front, hashing each distinct domain only once,
+    then recovered in a single loop. CPU-bound; run it via ``asyncio.to_thread``.
+
+    Args:
+        items: Typed data items, each with a hex signature
+
+    Returns:
+        Recovered EVM address per item, or None where encoding/recovery failed
+    """
+    from eth_account import Account
+    from eth_account._utils.encode_typed_data.encoding_and_hashing import (
+        hash_domain,
+        hash_eip712_message,
+    )
+    from eth_account.messages import SignableMessage
+
+    domain_hashes: dict[str, bytes] = {}
+    results: list[str | None] = []
+    for domain, types, message, signature in items:
+        try:
+            sig_bytes = bytes.fromhex(signature[2:] if signature.startswith("0x") else signature)
+            permit_signable = encode_payment_permit(domain, types, message)
+            if permit_signable is not None:
+                results.append(Account.recover_message(permit_signable, signature=sig_bytes))
+                continue
+
+            domain_key = json.dumps(domain, sort_keys=True, default=str)
+            domain_hash = domain_hashes.get(domain_key)
+            if domain_hash is None:
+                domain_hash = hash_domain(domain)
+                domain_hashes[domain_key] = domain_hash
+
+            signable = SignableMessage(b"\x01", domain_hash, hash_eip712_message(types, message))
+            results.append(Account.recover_message(signable, signature=sig_bytes))
+        except Exception:
+            results.append(None)
+    return results
+
+
+def _get_verify_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool for signature recovery, creating it on first use"""
+    global _verify_pool
+    if _verify_pool is None:
+        with _verify_pool_lock:
+            if _verify_pool is None:
+                _verify_pool = ProcessPoolExecutor(max_workers=_verify_pool_workers)
+                atexit.register(shutdown_verify_pool)
+    return _verify_pool
+
+
+def shutdown_verify_pool() -> None:
+    """Shut down the signature recovery process pool, if it was started.
+
+    Called automatically at interpreter exit. Applications embedding the SDK
+    can call it earlier; the pool is recreated on the next large batch.
+    """
+    global _verify_pool
+    with _verify_pool_lock:
+        pool, _verify_pool = _verify_pool, None
+    if pool is not None:
+        atexit.unregister(shutdown_verify_pool)
+        pool.shutdown()
+
+
+async def recover_typed_data_batch_async(
+    items: list[tuple[dict[str, Any], dict[str, Any], dict[str, Any], str]],
+) -> list[str | None]:
+    """Run :func:`recover_typed_data_batch` off the event loop.
+
+    Large batches are split into one chunk per CPU and recovered in parallel
+    in a process pool, since ECDSA recovery is CPU-bound and holds the GIL.
+    Smaller batches run in a worker thread.
+
+    Args:
+        items: Typed data items, each with a hex signature
+
+    Returns:
+        Recovered EVM address per item (in order), or None where recovery failed
+    """
+    if len(items) < PARALLEL_VERIFY_MIN_BATCH or _verify_pool_workers < 2:
+        return await asyncio.to_thread(recover_typed_data_batch, items)
+
+    loop = asyncio.get_running_loop()
+    pool = _get_verify_pool()
+    chunk_size = -(-len(items) // _verify_pool_workers)
+    chunks = await asyncio.gather(
+        *(
+            loop.run_in_executor(pool, recover_typed_data_batch, items[i : i + chunk_size])
+            for i in range(0, len(items), chunk_size)
+        )
+    )
+    return [address for chunk in chunks for address in chunk]
@@ -2,7 +2,8 @@
 Token registry - Centralized management of token configurations for all networks
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from decimal import Decimal, InvalidOperation
 from typing import Any
 
 from bankofai.x402.address.converter import TronAddressConverter
@@ -10,8 +11,11 @@ from bankofai.x402.exceptions import UnknownTokenError
 
 _converter = TronAddressConverter()
 
+# 10**decimals for the token precisions in use
+_SCALE = {d: 10**d for d in (6, 8, 18)}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TokenInfo:
     """Token information"""
 
@@ -107,6 +111,10 @@ class TokenRegistry:
         },
     }
 
+    # Lazily built address -> TokenInfo index per network (lowercase for EVM),
+    # stamped with the network's token count when it was built
+    _tokens_by_addr: dict[str, tuple[int, dict[str, TokenInfo]]] = {}
+
     @classmethod
     def register_token(cls, network: str, token: TokenInfo) -> None:
         """Register a custom token for specified network
@@ -119,8 +127,12 @@ class TokenRegistry:
             cls._tokens[network] = {}
         # Only normalize TRON addresses; EVM addresses stay as-is
         if not network.startswith("eip155:"):
-            token.address = _converter.normalize(token.address)
-        cls._tokens[network][token.symbol.upper()] = token
+            address = _converter.normalize(token.address)
+            if address != token.address:
+                token = replace(token, address=address)
+        symbol = token.symbol.upper()
+        cls._tokens[network][symbol] = token
+        cls._tokens_by_addr.pop(network, None)
 
     @classmethod
     def get_token(cls, network: str, symbol: str) -> TokenInfo:
@@ -130,27 +142,52 @@ class TokenRegistry:
             UnknownTokenError: If token does not exist
         """
         tokens = cls._tokens.get(network, {})
-        token = tokens.get(symbol.upper())
+        token = tokens.get(symbol)
+        if token is None:
+            token = tokens.get(symbol.upper())
         if token is None:
             raise UnknownTokenError(f"Unknown token {symbol} on network {network}")
         return token
 
     @classmethod
     def find_by_address(cls, network: str, address: str) -> TokenInfo | None:
-        """Find token information by address"""
+        """Find token information by address.
+
+        Looks up a per-network address index built on first use.
+        register_token drops the index, so a miss is final unless tokens were
+        added to get_network_tokens directly; a hit is checked against the
+        registry. The index is only rebuilt when it is stale.
+        """
         tokens = cls._tokens.get(network, {})
         # Use case-insensitive comparison for EVM addresses
         if network.startswith("eip155:"):
-            lower = address.lower()
-            for info in tokens.values():
-                if info.address.lower() == lower:
-                    return info
-            return None
-        normalized = _converter.normalize(address)
-        for info in tokens.values():
-            if info.address == normalized:
+            key = address.lower()
+        else:
+            key = _converter.normalize(address)
+
+        cached = cls._tokens_by_addr.get(network)
+        if cached is not None:
+            size, index = cached
+            info = index.get(key)
+            if info is None:
+                if size == len(tokens):
+                    return None
+            elif (
+                tokens.get(info.symbol.upper()) is info
+                and cls._address_key(network, info.address) == key
+            ):
                 return info
-        return None
+
+        index = {}
+        for info in tokens.values():
+            index.setdefault(cls._address_key(network, info.address), info)
+        cls._tokens_by_addr[network] = (len(tokens), index)
+        return index.get(key)
+
+    @staticmethod
+    def _address_key(network: str, address: str) -> str:
+        """Index key for a registered token address"""
+        return address.lower() if network.startswith("eip155:") else address
 
     @classmethod
     def get_network_tokens(cls, network: str) -> dict[str, TokenInfo]:
@@ -208,10 +245,15 @@ class TokenRegistry:
             raise ValueError(f"Invalid price format: {price}")
 
         amount_str, symbol = parts
-        amount = float(amount_str)
+        try:
+            # Decimal keeps money exact; float("0.1") * 10**6 can round down
+            amount = Decimal(amount_str)
+        except InvalidOperation:
+            raise ValueError(f"Invalid price amount: {amount_str}") from None
 
         token = cls.get_token(network, symbol)
-        amount_smallest = int(amount * (10**token.decimals))
+        scale = _SCALE.get(token.decimals) or 10**token.decimals
+        amount_smallest = int(amount * scale)
 
         return {
             "amount": amount_smallest,
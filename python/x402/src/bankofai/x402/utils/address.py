@@ -2,6 +2,8 @@
 Address utility functions for TRON and EVM address conversion
 """
 
+import functools
+import hashlib
 import logging
 
 import base58
@@ -12,23 +14,21 @@ logger = logging.getLogger(__name__)
 def _hex_to_base58check(hex_addr: str) -> str:
     """Convert a 42-char TRON hex address (41...) to Base58Check.
 
-    Uses tronpy if available, otherwise falls back to manual encoding.
+    Encodes directly with hashlib and base58, so importing this module does
+    not pull in tronpy.
     """
-    try:
-        from tronpy.keys import to_base58check_address
-
-        return to_base58check_address(hex_addr)
-    except ImportError:
-        import hashlib
-
-        addr_bytes = bytes.fromhex(hex_addr)
-        checksum = hashlib.sha256(hashlib.sha256(addr_bytes).digest()).digest()[:4]
-        return base58.b58encode(addr_bytes + checksum).decode()
+    addr_bytes = bytes.fromhex(hex_addr)
+    checksum = hashlib.sha256(hashlib.sha256(addr_bytes).digest()).digest()[:4]
+    return base58.b58encode(addr_bytes + checksum).decode()
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_tron_address(tron_addr: str) -> str:
     """Normalize TRON address to Base58Check format.
 
+    Memoized: the conversion is pure and the same few addresses (pay_to,
+    fee_to, buyer, token contract) recur on every payment.
+
     Handles:
         - Base58Check (T...): returned as-is
         - EVM hex (0x...): converted to Base58Check
@@ -61,22 +61,29 @@ def normalize_tron_address(tron_addr: str) -> str:
     return tron_addr
 
 
+@functools.lru_cache(maxsize=4096)
 def tron_address_to_evm(tron_addr: str) -> str:
     """Convert TRON Base58Check address to EVM hex format (0x...)
 
+    Memoized like normalize_tron_address.
+
     Args:
         tron_addr: TRON address in Base58 format or hex format
 
     Returns:
         EVM address in hex format (0x...)
     """
-    # Normalize address first
-    tron_addr = normalize_tron_address(tron_addr)
-
-    # If already in EVM format, return as-is
+    # Already EVM format: lowercase it directly instead of round-tripping
+    # through Base58Check; malformed 0x strings are returned as-is
     if tron_addr.startswith("0x"):
+        hex_body = tron_addr[2:]
+        if len(hex_body) == 40 and all(c in "0123456789abcdefABCDEF" for c in hex_body):
+            return "0x" + hex_body.lower()
         return tron_addr
 
+    # Normalize address first
+    tron_addr = normalize_tron_address(tron_addr)
+
     # If it's a hex string (with or without 0x prefix), normalize to 0x format
     # Check if it looks like a hex address (40 or 42 chars of hex digits, possibly with
     # 0x or 41 prefix)
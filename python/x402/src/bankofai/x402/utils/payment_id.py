@@ -5,7 +5,7 @@ Payment IDs are 16-byte identifiers used to track payments.
 They are represented as hex strings with '0x' prefix for consistency.
 """
 
-import secrets
+import os
 
 
 def generate_payment_id() -> str:
@@ -16,4 +16,4 @@ def generate_payment_id() -> str:
         A 16-byte payment ID as a hex string with '0x' prefix.
         Example: "0x1234567890abcdef1234567890abcdef"
     """
-    return "0x" + secrets.token_hex(16)
+    return "0x" + os.urandom(16).hex()
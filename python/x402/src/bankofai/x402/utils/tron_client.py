@@ -2,23 +2,73 @@
 Shared AsyncTron client factory.
 
 Centralizes tronpy AsyncTron initialization with TronGrid API key support.
+Clients from get_async_tron_client are shared per network, so signers and
+verifiers targeting the same network reuse one AsyncTron instance and one
+pooled HTTP client.
 """
 
+import asyncio
 import logging
 import os
+import weakref
 from typing import Any
 
+import httpx
 from tronpy import AsyncTron
 from tronpy.defaults import conf_for_name
-from tronpy.providers.async_http import AsyncHTTPProvider
+from tronpy.providers.async_http import DEFAULT_TIMEOUT, AsyncHTTPProvider
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for the shared HTTP client
+HTTP_POOL_MAX_CONNECTIONS = 50
+HTTP_POOL_MAX_KEEPALIVE = 50
+
+# One pooled HTTP client per event loop, shared by every AsyncTron instance
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Shared AsyncTron clients, per event loop and network
+_async_tron_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_http_client() -> httpx.AsyncClient | None:
+    """Get the pooled keep-alive HTTP client for the running event loop.
+
+    httpx connections are bound to the loop that opened them, so the pool is
+    kept per loop. Outside a running loop, returns None and tronpy falls back
+    to its own client.
+
+    Returns:
+        Shared httpx.AsyncClient, or None if no event loop is running
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(DEFAULT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_POOL_MAX_KEEPALIVE,
+            ),
+        )
+        _http_clients[loop] = client
+    return client
+
 
 def create_async_tron_client(network: str) -> Any:
     """Create an AsyncTron client for the given network.
 
     Automatically uses TronGrid API key from TRON_GRID_API_KEY env var if set.
+    The client owns its HTTP connections, so closing it (e.g. via
+    ``async with``) does not affect the shared clients.
 
     Args:
         network: TRON network name (e.g. "nile", "mainnet") or full identifier (e.g. "tron:nile")
@@ -26,6 +76,14 @@ def create_async_tron_client(network: str) -> Any:
     Returns:
         tronpy.AsyncTron instance
     """
+    return _build_async_tron_client(network, None)
+
+
+def _build_async_tron_client(network: str, http_client: httpx.AsyncClient | None) -> Any:
+    """Build an AsyncTron client, optionally on a given HTTP client.
+
+    With http_client None, tronpy creates its own HTTP client.
+    """
     # Strip "tron:" prefix if present (e.g. "tron:nile" -> "nile")
     if network.startswith("tron:"):
         network = network[len("tron:") :]
@@ -38,7 +96,12 @@ def create_async_tron_client(network: str) -> Any:
         )
 
         logger.info("Creating AsyncTron client for network=%s", network)
-        return AsyncTron(network=network)
+        provider = AsyncHTTPProvider(
+            conf_for_name(network),
+            DEFAULT_TIMEOUT,
+            client=http_client,
+        )
+        return AsyncTron(provider=provider, network=network)
 
     conf = conf_for_name(network)
     if not conf:
@@ -47,10 +110,41 @@ def create_async_tron_client(network: str) -> Any:
         )
 
     endpoint_uri = conf["fullnode"]
-    provider = AsyncHTTPProvider(endpoint_uri=endpoint_uri, api_key=api_key)
+    provider = AsyncHTTPProvider(
+        endpoint_uri=endpoint_uri,
+        api_key=api_key,
+        client=http_client,
+    )
     logger.info(
         "Creating AsyncTron client with TronGrid API key for network=%s (%s)",
         network,
         endpoint_uri,
     )
     return AsyncTron(provider=provider, network=network)
+
+
+def get_async_tron_client(network: str) -> Any:
+    """Get the shared AsyncTron client for the given network.
+
+    Clients are cached per running event loop and share that loop's pooled
+    HTTP client, so repeated RPCs reuse open TCP/TLS connections. Callers must
+    not close them. Outside a running loop, a new client is created on each call.
+
+    Args:
+        network: TRON network name (e.g. "nile", "mainnet") or full identifier (e.g. "tron:nile")
+
+    Returns:
+        tronpy.AsyncTron instance
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return create_async_tron_client(network)
+
+    clients = _async_tron_clients.setdefault(loop, {})
+    name = network[len("tron:") :] if network.startswith("tron:") else network
+    client = clients.get(name)
+    if client is None or client.provider.client.is_closed:
+        client = _build_async_tron_client(network, get_shared_http_client())
+        clients[name] = client
+    return client
@@ -4,10 +4,37 @@ TRON Transaction Verification
 Provides TRON-specific transaction verification functionality.
 """
 
-from typing import Any
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, AsyncIterator
 
+import base58
+
+from bankofai.x402.utils.address import normalize_tron_address
 from bankofai.x402.utils.tx_verification import BaseTransactionVerifier, TransferEvent
 
+# TRC20 Transfer event topic
+# keccak256("Transfer(address,address,uint256)")
+_TRANSFER_TOPIC = "ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+
+# Transaction info of confirmed (or failed) transactions, keyed by
+# (network, tx_hash). Once a transaction is in a block its info no longer
+# changes, so repeated verifications skip the RPC. Pending lookups are not cached.
+TX_INFO_CACHE_SIZE = 2048
+_tx_info_cache: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+_tx_info_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=8192)
+def _hex_to_base58(address_hex: str) -> str:
+    """Convert a 20-byte lowercase hex address to TRON Base58Check.
+
+    Memoized: verifiers keep seeing the same token, payer and payee addresses.
+    """
+    return normalize_tron_address("41" + address_hex)
+
 
 class TronTransactionVerifier(BaseTransactionVerifier):
     """TRON-specific transaction verification implementation"""
@@ -20,19 +47,33 @@ class TronTransactionVerifier(BaseTransactionVerifier):
     def _ensure_async_client(self) -> Any:
         """Lazy initialize async tronpy client"""
         if self._async_client is None:
-            from bankofai.x402.utils.tron_client import create_async_tron_client
+            from bankofai.x402.utils.tron_client import get_async_tron_client
 
-            self._async_client = create_async_tron_client(self._network)
+            self._async_client = get_async_tron_client(self._network)
         return self._async_client
 
+    async def _fetch_transaction_info(self, tx_hash: str) -> dict[str, Any]:
+        """Fetch raw transaction info, serving confirmed transactions from cache"""
+        key = (self._network, tx_hash)
+        with _tx_info_cache_lock:
+            info = _tx_info_cache.get(key)
+            if info is not None:
+                _tx_info_cache.move_to_end(key)
+                return info
+
+        fetched: dict[str, Any] = await self._ensure_async_client().get_transaction_info(tx_hash)
+        if fetched and fetched.get("blockNumber"):
+            with _tx_info_cache_lock:
+                _tx_info_cache[key] = fetched
+                if len(_tx_info_cache) > TX_INFO_CACHE_SIZE:
+                    _tx_info_cache.popitem(last=False)
+        return fetched
+
     def normalize_address(self, address: str) -> str:
         """Normalize address to TRON Base58 format"""
         try:
-            from tronpy.keys import to_base58check_address
-
             if address.startswith("0x") and len(address) == 42:
-                hex_addr = "41" + address[2:].lower()
-                return to_base58check_address(hex_addr)
+                return normalize_tron_address(address)
 
             if address.startswith("T"):
                 return address
@@ -43,10 +84,8 @@ class TronTransactionVerifier(BaseTransactionVerifier):
 
     async def get_transaction_info(self, tx_hash: str) -> dict[str, Any]:
         """Get TRON transaction information"""
-        client = self._ensure_async_client()
-
         try:
-            info = await client.get_transaction_info(tx_hash)
+            info = await self._fetch_transaction_info(tx_hash)
             if info:
                 receipt = info.get("receipt", {})
                 status = "confirmed" if receipt.get("result") == "SUCCESS" else "failed"
@@ -62,82 +101,84 @@ class TronTransactionVerifier(BaseTransactionVerifier):
             self._logger.error(f"Failed to get transaction info: {e}")
             raise
 
-    async def get_transaction_transfers(
+    async def iter_transfers(
         self,
         tx_hash: str,
         token_address: str,
-    ) -> list[TransferEvent]:
+    ) -> AsyncIterator[TransferEvent]:
         """
-        Get TRC20 token transfer events from a TRON transaction.
+        Yield TRC20 token transfer events from a TRON transaction.
 
-        Parses the transaction logs for Transfer(address,address,uint256) events.
+        Parses the transaction logs for Transfer(address,address,uint256) events
+        lazily, so callers looking for one matching transfer can stop early.
+        RPC errors propagate to the caller.
         """
-        client = self._ensure_async_client()
-        transfers: list[TransferEvent] = []
-
-        try:
-            info = await client.get_transaction_info(tx_hash)
-            if not info:
-                return transfers
+        info = await self._fetch_transaction_info(tx_hash)
+        if not info:
+            return
 
-            logs = info.get("log", [])
+        logs = info.get("log", [])
 
-            # TRC20 Transfer event topic
-            # keccak256("Transfer(address,address,uint256)")
-            transfer_topic = "ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+        # Normalize the expected token once, not per log
+        normalized_token = self._normalize_to_hex(token_address).lower()
 
-            normalized_token = self._normalize_to_hex(token_address)
+        for log in logs:
+            log_address = log.get("address", "")
+            topics = log.get("topics", [])
+            data = log.get("data", "")
 
-            for log in logs:
-                log_address = log.get("address", "")
-                topics = log.get("topics", [])
-                data = log.get("data", "")
+            # Check if this is a Transfer event (cheap checks first)
+            if len(topics) < 3 or topics[0] != _TRANSFER_TOPIC:
+                continue
 
-                # Check if this is a Transfer event from the expected token
-                if not topics or topics[0] != transfer_topic:
-                    continue
-
-                # Normalize log address for comparison
+            # Node logs carry bare lowercase hex; only normalize other formats
+            if log_address.lower() != normalized_token:
                 normalized_log_address = self._normalize_to_hex(log_address)
-                if normalized_log_address.lower() != normalized_token.lower():
-                    continue
-
-                if len(topics) < 3:
+                if normalized_log_address.lower() != normalized_token:
                     continue
 
-                # Parse Transfer event
-                # topics[1] = from address (padded to 32 bytes)
-                # topics[2] = to address (padded to 32 bytes)
-                # data = amount (uint256)
-                from_addr = self._parse_address_from_topic(topics[1])
-                to_addr = self._parse_address_from_topic(topics[2])
-                amount = int(data, 16) if data else 0
+            # Parse Transfer event
+            # topics[1] = from address (padded to 32 bytes)
+            # topics[2] = to address (padded to 32 bytes)
+            # data = amount (uint256)
+            from_addr = self._parse_address_from_topic(topics[1])
+            to_addr = self._parse_address_from_topic(topics[2])
+            amount = int(data, 16) if data else 0
 
-                transfers.append(
-                    TransferEvent(
-                        token=self.normalize_address(log_address),
-                        from_addr=from_addr,
-                        to_addr=to_addr,
-                        amount=amount,
-                    )
-                )
+            self._logger.debug("Found transfer: %s from %s to %s", amount, from_addr, to_addr)
 
-                self._logger.debug(f"Found transfer: {amount} from {from_addr} to {to_addr}")
+            yield TransferEvent(
+                token=self.normalize_address(log_address),
+                from_addr=from_addr,
+                to_addr=to_addr,
+                amount=amount,
+            )
 
-            return transfers
+    async def get_transaction_transfers(
+        self,
+        tx_hash: str,
+        token_address: str,
+    ) -> list[TransferEvent]:
+        """
+        Get TRC20 token transfer events from a TRON transaction.
 
+        Collects iter_transfers into a list; on error, returns the transfers
+        parsed so far.
+        """
+        transfers: list[TransferEvent] = []
+        try:
+            async for transfer in self.iter_transfers(tx_hash, token_address):
+                transfers.append(transfer)
         except Exception as e:
             self._logger.error(f"Failed to parse transfer events: {e}", exc_info=True)
-            return transfers
+        return transfers
 
     def _normalize_to_hex(self, address: str) -> str:
         """Normalize address to hex format (without 0x prefix)"""
         try:
-            from tronpy.keys import to_hex_address
-
             if address.startswith("T"):
                 # Convert TRON base58 to hex
-                hex_addr = to_hex_address(address)
+                hex_addr = base58.b58decode_check(address).hex()
                 return hex_addr[2:] if hex_addr.startswith("41") else hex_addr
 
             if address.startswith("0x"):
@@ -150,13 +191,10 @@ class TronTransactionVerifier(BaseTransactionVerifier):
     def _parse_address_from_topic(self, topic: str) -> str:
         """Parse address from 32-byte padded topic"""
         try:
-            from tronpy.keys import to_base58check_address
-
             # Topic is 32 bytes hex, address is last 20 bytes
             # For TRON, we need to add 41 prefix
             if len(topic) >= 40:
-                addr_hex = "41" + topic[-40:]
-                return to_base58check_address(addr_hex)
+                return _hex_to_base58(topic[-40:].lower())
             return topic
         except Exception:
             return topic
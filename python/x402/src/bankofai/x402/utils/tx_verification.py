@@ -5,6 +5,7 @@ Provides generic functionality to verify blockchain transaction results,
 ensuring contract transfers and deliveries match expected parameters.
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -12,8 +13,14 @@ from typing import Any, Protocol
 
 from bankofai.x402.types import PaymentPayload, PaymentRequirements
 
+# Banner framing each verification in the INFO log
+_SEP = "=" * 60
 
-@dataclass
+# Transaction status values that mean the transaction failed on-chain
+_FAILED_STATUSES = frozenset({"failed", "0", 0})
+
+
+@dataclass(frozen=True, slots=True)
 class TransferEvent:
     """Represents a token transfer event from a transaction"""
 
@@ -23,9 +30,9 @@ class TransferEvent:
     amount: int  # Transfer amount
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TransactionVerificationResult:
-    """Result of transaction verification"""
+    """Result of transaction verification (immutable, safe to share)"""
 
     success: bool
     tx_hash: str
@@ -83,6 +90,20 @@ class BaseTransactionVerifier(ABC):
         """Get transaction information from blockchain"""
         pass
 
+    async def get_many_transaction_infos(self, tx_hashes: list[str]) -> list[dict[str, Any]]:
+        """Get information for several transactions concurrently.
+
+        Lookups run in parallel over the shared RPC connection pool, so N
+        transactions cost roughly one round-trip instead of N sequential ones.
+
+        Args:
+            tx_hashes: Transaction hashes to look up
+
+        Returns:
+            Transaction information, in the same order as ``tx_hashes``
+        """
+        return list(await asyncio.gather(*(self.get_transaction_info(h) for h in tx_hashes)))
+
     @abstractmethod
     async def get_transaction_transfers(
         self,
@@ -119,49 +140,20 @@ class BaseTransactionVerifier(ABC):
         Returns:
             TransactionVerificationResult with detailed verification status
         """
-        permit = payload.payload.payment_permit
-
-        self._logger.info("=" * 60)
-        self._logger.info(f"Verifying transaction: {tx_hash}")
-
-        # Log expected transfers from payload and requirements
-        expected_from = self.normalize_address(permit.buyer)
-        expected_pay_to = self.normalize_address(requirements.pay_to)
-        expected_amount = int(requirements.amount)
-        token_address = requirements.asset
-        fee_amount = 0
-        expected_fee_to = None
-
-        if requirements.extra and requirements.extra.fee:
-            fee_amount = int(requirements.extra.fee.fee_amount)
-            expected_fee_to = self.normalize_address(requirements.extra.fee.fee_to)
-
-        self._logger.info(
-            "[EXPECTED] Payment: %s → %s | %s %s",
-            expected_from,
-            expected_pay_to,
-            expected_amount,
-            token_address,
-        )
-        if fee_amount > 0 and expected_fee_to:
-            self._logger.info(
-                "[EXPECTED] Fee: %s → %s | %s %s",
-                expected_from,
-                expected_fee_to,
-                fee_amount,
-                token_address,
-            )
-        else:
-            self._logger.info("[EXPECTED] Fee: None")
+        if self._logger.isEnabledFor(logging.INFO):
+            self._log_expected_transfers(tx_hash, payload, requirements)
 
         try:
             # Only verify transaction status
             tx_info = await self.get_transaction_info(tx_hash)
 
-            status = tx_info.get("status", "").lower()
-            if status == "failed" or status == "0" or status == 0:
-                self._logger.error(f"[FAILED] Transaction failed on-chain: {tx_hash}")
-                self._logger.info("=" * 60)
+            status = tx_info.get("status", "")
+            # Exact match first; lowercase only when the raw value misses
+            if status in _FAILED_STATUSES or (
+                isinstance(status, str) and status.lower() in _FAILED_STATUSES
+            ):
+                self._logger.error("[FAILED] Transaction failed on-chain: %s", tx_hash)
+                self._logger.info(_SEP)
                 return TransactionVerificationResult(
                     success=False,
                     tx_hash=tx_hash,
@@ -170,9 +162,9 @@ class BaseTransactionVerifier(ABC):
                     status_verified=False,
                 )
 
-            self._logger.info(f"[OK] Transaction status: {status}")
-            self._logger.info(f"[SUCCESS] Transaction verification passed: {tx_hash}")
-            self._logger.info("=" * 60)
+            self._logger.info("[OK] Transaction status: %s", status)
+            self._logger.info("[SUCCESS] Transaction verification passed: %s", tx_hash)
+            self._logger.info(_SEP)
             return TransactionVerificationResult(
                 success=True,
                 tx_hash=tx_hash,
@@ -188,6 +180,41 @@ class BaseTransactionVerifier(ABC):
                 error_reason=f"verification_error: {str(e)}",
             )
 
+    def _log_expected_transfers(
+        self,
+        tx_hash: str,
+        payload: PaymentPayload,
+        requirements: PaymentRequirements,
+    ) -> None:
+        """Log the payment and fee transfers the transaction is expected to contain"""
+        permit = payload.payload.payment_permit
+
+        self._logger.info(_SEP)
+        self._logger.info("Verifying transaction: %s", tx_hash)
+
+        expected_from = self.normalize_address(permit.buyer)
+        token_address = requirements.asset
+        self._logger.info(
+            "[EXPECTED] Payment: %s → %s | %s %s",
+            expected_from,
+            self.normalize_address(requirements.pay_to),
+            int(requirements.amount),
+            token_address,
+        )
+
+        fee = requirements.extra.fee if requirements.extra else None
+        fee_amount = int(fee.fee_amount) if fee else 0
+        if fee is not None and fee_amount > 0 and fee.fee_to:
+            self._logger.info(
+                "[EXPECTED] Fee: %s → %s | %s %s",
+                expected_from,
+                self.normalize_address(fee.fee_to),
+                fee_amount,
+                token_address,
+            )
+        else:
+            self._logger.info("[EXPECTED] Fee: None")
+
 
 def get_verifier_for_network(network: str, rpc_url: str | None = None) -> BaseTransactionVerifier:
     """
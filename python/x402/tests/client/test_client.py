@@ -33,6 +33,97 @@ def test_client_register_mechanism():
     assert result is client  # 应该返回 self 以支持链式调用
 
 
+def test_client_register_indexes_exact_and_wildcard_patterns():
+    """测试注册后精确网络按 (network, scheme) 索引，通配符保持注册顺序"""
+    client = X402Client()
+    first_nile = MockClientMechanism()
+    client.register("tron:*", MockClientMechanism())
+    client.register("tron:nile", first_nile)
+    client.register("eip155:*", MockClientMechanism())
+    client.register("tron:shasta", MockClientMechanism())
+    client.register("tron:nile", MockClientMechanism())
+
+    assert list(client._exact_mechanisms) == [
+        ("tron:nile", "exact_permit"),
+        ("tron:shasta", "exact_permit"),
+    ]
+    assert client._exact_mechanisms[("tron:nile", "exact_permit")] is first_nile
+    assert [entry.pattern for entry in client._prefix_mechanisms] == ["tron:*", "eip155:*"]
+
+
+def test_client_find_mechanism_prefers_exact_pattern():
+    """测试精确网络匹配优先于通配符，并按 scheme 过滤"""
+
+    class OtherScheme(MockClientMechanism):
+        def scheme(self) -> str:
+            return "other"
+
+    client = X402Client()
+    wildcard, exact, other = MockClientMechanism(), MockClientMechanism(), OtherScheme()
+    client.register("tron:*", wildcard)
+    client.register("tron:nile", other)
+    client.register("tron:nile", exact)
+
+    assert client._find_mechanism("exact_permit", "tron:nile") is exact
+    assert client._find_mechanism("other", "tron:nile") is other
+    assert client._find_mechanism("exact_permit", "tron:shasta") is wildcard
+    assert client._find_mechanism("other", "tron:shasta") is None
+    assert client._find_mechanism("exact_permit", "eip155:97") is None
+
+    assert client._is_supported("exact_permit", "tron:shasta")
+    assert client._is_supported("other", "tron:nile")
+    assert not client._is_supported("other", "tron:shasta")
+    assert not client._is_supported("exact_permit", "eip155:97")
+
+
+@pytest.mark.asyncio
+async def test_client_select_skips_debug_dump_when_disabled():
+    """测试未开启 DEBUG 日志时不序列化候选支付要求"""
+    from unittest.mock import patch
+
+    from bankofai.x402.clients import x402_client
+
+    client = X402Client()
+    client.register("tron:shasta", MockClientMechanism())
+    accepts = [
+        PaymentRequirements(
+            scheme="exact_permit",
+            network="tron:shasta",
+            amount="1000000",
+            asset="TTestUSDT",
+            payTo="TTestMerchant",
+        )
+    ]
+
+    with (
+        patch.object(x402_client.logger, "isEnabledFor", return_value=False),
+        patch.object(PaymentRequirements, "model_dump") as model_dump,
+    ):
+        await client.select_payment_requirements(accepts)
+
+    model_dump.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_client_select_single_candidate_skips_strategy():
+    """测试只剩一个候选时不调用代币选择策略"""
+    from unittest.mock import AsyncMock
+
+    strategy = AsyncMock()
+    client = X402Client(token_strategy=strategy)
+    client.register("tron:shasta", MockClientMechanism())
+    only = PaymentRequirements(
+        scheme="exact_permit",
+        network="tron:shasta",
+        amount="1000000",
+        asset="TTestUSDT",
+        payTo="TTestMerchant",
+    )
+
+    assert await client.select_payment_requirements([only]) is only
+    strategy.select.assert_not_awaited()
+
+
 @pytest.mark.anyio
 async def test_client_select_payment_requirements():
     """测试从多个网络中选择支付要求"""
@@ -141,3 +232,156 @@ async def test_client_create_payment_payload():
 
     payload = await client.create_payment_payload(requirements, "https://example.com/resource")
     assert payload == {"mock": "payload"}
+
+
+def test_clients_package_imports_lazily():
+    """Importing the package defers the client modules and tronpy until first use"""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, bankofai.x402.clients as c\n"
+        "assert 'bankofai.x402.clients.x402_http_client' not in sys.modules\n"
+        "assert 'tronpy' not in sys.modules\n"
+        "assert c.X402HttpClient.__name__ == 'X402HttpClient'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.asyncio
+async def test_sufficient_balance_policy_checks_balances_concurrently():
+    """余额查询并发执行，且保留原有的过滤语义与顺序"""
+    import asyncio
+
+    from bankofai.x402.clients import SufficientBalancePolicy
+
+    started = 0
+    both_started = asyncio.Event()
+    timed_out = False
+
+    class Signer:
+        def __init__(self, balance):
+            self._balance = balance
+
+        async def check_balance(self, asset, network):
+            nonlocal started, timed_out
+            started += 1
+            if started == 2:
+                both_started.set()
+            try:
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+            except asyncio.TimeoutError:
+                timed_out = True
+                raise
+            if self._balance is None:
+                raise RuntimeError("rpc down")
+            return self._balance
+
+    signers = {"tron:nile": Signer(10), "tron:shasta": Signer(None), "tron:mainnet": Signer(5)}
+
+    class Client:
+        def resolve_signer(self, scheme, network):
+            return signers.get(network)
+
+    def req(network):
+        return PaymentRequirements(
+            scheme="exact_permit", network=network, amount="6", asset="TToken", payTo="TPayee"
+        )
+
+    requirements = [req("tron:nile"), req("eip155:1"), req("tron:shasta"), req("tron:mainnet")]
+    result = await SufficientBalancePolicy(Client()).apply(requirements)
+
+    assert not timed_out
+    assert [r.network for r in result] == ["tron:nile", "eip155:1", "tron:shasta"]
+
+
+@pytest.mark.asyncio
+async def test_sufficient_balance_policy_reuses_recent_balances():
+    """相同代币只查询一次余额，短时间内的重复调用复用结果"""
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from bankofai.x402.clients import SufficientBalancePolicy
+
+    signer = MagicMock()
+    signer.check_balance = AsyncMock(return_value=10)
+    client = MagicMock()
+    client.resolve_signer.return_value = signer
+
+    requirements = [
+        PaymentRequirements(
+            scheme=scheme, network="tron:nile", amount="6", asset="TToken", payTo="TPayee"
+        )
+        for scheme in ("exact_permit", "exact")
+    ]
+    policy = SufficientBalancePolicy(client)
+
+    assert await policy.apply(requirements) == requirements
+    assert await policy.apply(requirements) == requirements
+    assert signer.check_balance.await_count == 1
+
+    with patch("bankofai.x402.clients.policies.time.monotonic", return_value=1e12):
+        await policy.apply(requirements)
+    assert signer.check_balance.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_sufficient_balance_policy_includes_fee():
+    """所需余额包含手续费；没有 extra 或 fee 时只计算金额"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from bankofai.x402.clients import SufficientBalancePolicy
+    from bankofai.x402.types import FeeInfo, PaymentRequirementsExtra
+
+    signer = MagicMock()
+    signer.check_balance = AsyncMock(return_value=10)
+    client = MagicMock()
+    client.resolve_signer.return_value = signer
+
+    def req(asset, extra=None):
+        return PaymentRequirements(
+            scheme="exact_permit",
+            network="tron:nile",
+            amount="8",
+            asset=asset,
+            payTo="TPayee",
+            extra=extra,
+        )
+
+    with_fee = req("TA", PaymentRequirementsExtra(fee=FeeInfo(feeTo="TFee", feeAmount="3")))
+    no_fee = req("TB", PaymentRequirementsExtra())
+    no_extra = req("TC")
+
+    result = await SufficientBalancePolicy(client).apply([with_fee, no_fee, no_extra])
+
+    assert result == [no_fee, no_extra]
+
+
+@pytest.mark.asyncio
+async def test_cheapest_token_selection_normalizes_decimals():
+    """按精度归一化后选择最便宜的选项，并列时保留第一个"""
+    from bankofai.x402.clients import CheapestTokenSelectionStrategy
+    from bankofai.x402.tokens import TokenRegistry
+
+    usdt = TokenRegistry.get_token("tron:nile", "USDT")
+    usdd = TokenRegistry.get_token("tron:nile", "USDD")
+
+    def req(token, amount):
+        return PaymentRequirements(
+            scheme="exact_permit",
+            network="tron:nile",
+            amount=str(amount),
+            asset=token.address,
+            payTo="TPayee",
+        )
+
+    strategy = CheapestTokenSelectionStrategy()
+    usdd_req = req(usdd, 10**18)
+    assert await strategy.select([req(usdt, 2 * 10**6), usdd_req]) is usdd_req
+
+    first = req(usdt, 10**6)
+    assert await strategy.select([first, usdd_req]) is first
+
+    # 同精度时直接比较原始金额
+    cheap = req(usdt, 999_999)
+    assert await strategy.select([first, cheap, req(usdt, 10**6)]) is cheap
+    assert await strategy.select([first, req(usdt, 10**6)]) is first
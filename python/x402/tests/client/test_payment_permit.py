@@ -84,3 +84,90 @@ class TestClientAuthorization:
         call_args = mock_signer.ensure_allowance.call_args
         expected_total = int(nile_requirements.amount) + 10000
         assert call_args[0][1] == expected_total
+
+
+class TestBuildPermit:
+    """构建 PaymentPermit 测试"""
+
+    def test_fee_fields_from_requirements(self, mock_signer, nile_requirements, permit_context):
+        """测试有手续费时使用 requirements 中的 fee 信息，caller 缺省为零地址"""
+        mechanism = ExactPermitTronClientMechanism(mock_signer)
+        zero_address = mechanism._address_converter.get_zero_address()
+
+        permit = mechanism._build_permit(nile_requirements, permit_context["paymentPermitContext"])
+
+        assert permit.fee.fee_to == "TTestFacilitator"
+        assert permit.fee.fee_amount == "10000"
+        assert permit.caller == zero_address
+
+    def test_no_fee_defaults_to_zero(self, mock_signer, nile_requirements, permit_context):
+        """测试没有 extra 或 fee 时手续费为零、地址为零地址"""
+        mechanism = ExactPermitTronClientMechanism(mock_signer)
+        zero_address = mechanism._address_converter.get_zero_address()
+        context = permit_context["paymentPermitContext"]
+
+        for extra in (None, PaymentRequirementsExtra()):
+            requirements = nile_requirements.model_copy(update={"extra": extra})
+            permit = mechanism._build_permit(requirements, context)
+
+            assert permit.fee.fee_to == zero_address
+            assert permit.fee.fee_amount == "0"
+            assert permit.caller == zero_address
+
+
+class TestClientSigning:
+    """客户端签名测试"""
+
+    @pytest.mark.anyio
+    async def test_domain_built_once_per_network(
+        self, mock_signer, nile_requirements, permit_context
+    ):
+        """测试 EIP-712 domain 按网络只构建一次"""
+        from unittest.mock import patch
+
+        from bankofai.x402.config import NetworkConfig
+
+        mechanism = ExactPermitTronClientMechanism(mock_signer)
+
+        with patch.object(
+            NetworkConfig, "get_chain_id", wraps=NetworkConfig.get_chain_id
+        ) as get_chain_id:
+            for _ in range(2):
+                await mechanism.create_payment_payload(
+                    nile_requirements,
+                    "https://api.example.com/resource",
+                    extensions=permit_context,
+                )
+
+        assert get_chain_id.call_count == 1
+        domains = [call.kwargs["domain"] for call in mock_signer.sign_typed_data.call_args_list]
+        assert domains[0] is domains[1]
+        assert domains[0] == {
+            "name": "PaymentPermit",
+            "chainId": NetworkConfig.get_chain_id("tron:nile"),
+            "verifyingContract": mechanism._address_converter.to_evm_format(
+                NetworkConfig.get_payment_permit_address("tron:nile")
+            ),
+        }
+
+    @pytest.mark.anyio
+    async def test_payment_details_not_logged_below_info(
+        self, mock_signer, nile_requirements, permit_context
+    ):
+        """测试 INFO 日志关闭时不格式化支付明细"""
+        from unittest.mock import patch
+
+        mechanism = ExactPermitTronClientMechanism(mock_signer)
+
+        with (
+            patch.object(mechanism._logger, "isEnabledFor", return_value=False),
+            patch.object(mechanism, "_log_payment_details") as log_payment_details,
+        ):
+            await mechanism.create_payment_payload(
+                nile_requirements,
+                "https://api.example.com/resource",
+                extensions=permit_context,
+            )
+
+        log_payment_details.assert_not_called()
+        mock_signer.sign_typed_data.assert_awaited_once()
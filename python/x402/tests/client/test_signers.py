@@ -111,3 +111,194 @@ async def test_evm_signer_check_balance():
 
     balance = await signer.check_balance("0xTestToken", "eip155:1")
     assert balance == 0
+
+
+@pytest.mark.asyncio
+async def test_tron_signer_caches_token_contract():
+    """Test TRON signer fetches the token contract once per network"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    private_key = "0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef"
+    signer = TronClientSigner.from_private_key(private_key)
+
+    contract = MagicMock()
+    contract.functions.balanceOf = AsyncMock(return_value=7)
+    client = MagicMock()
+    client.get_contract = AsyncMock(return_value=contract)
+    signer._async_tron_clients["tron:nile"] = client
+
+    assert await signer.check_balance("TTestToken", "tron:nile") == 7
+    assert await signer.check_balance("TTestToken", "tron:nile") == 7
+
+    client.get_contract.assert_awaited_once_with("TTestToken")
+
+
+@pytest.mark.asyncio
+async def test_tron_signer_check_allowance_uses_precomputed_selector():
+    """Test TRON allowance check issues a constant call without fetching the ABI"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    private_key = "0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef"
+    signer = TronClientSigner.from_private_key(private_key)
+    token = "TXYZopYRdj2D9XRtbG411XZZ3kM5VkAeBf"
+
+    client = MagicMock()
+    client.get_contract = AsyncMock()
+    client.trigger_const_smart_contract_function = AsyncMock(return_value=f"{5:064x}")
+    signer._async_tron_clients["tron:nile"] = client
+
+    assert await signer.check_allowance(token, 1, "tron:nile") == 5
+
+    owner, contract_address, selector, parameter = (
+        client.trigger_const_smart_contract_function.await_args.args
+    )
+    assert (owner, contract_address) == (signer.get_address(), token)
+    assert selector == "allowance(address,address)"
+    assert len(parameter) == 128
+    client.get_contract.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_tron_signer_ensure_allowance_builds_raw_approve():
+    """Test TRON approval sends precomputed approve calldata without fetching the ABI"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from tronpy.keys import to_hex_address
+
+    from bankofai.x402.config import NetworkConfig
+    from bankofai.x402.utils.address import tron_address_to_evm
+
+    private_key = "0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef"
+    signer = TronClientSigner.from_private_key(private_key)
+    signer.check_allowance = AsyncMock(return_value=0)
+    token = "TXYZopYRdj2D9XRtbG411XZZ3kM5VkAeBf"
+    spender = NetworkConfig.get_payment_permit_address("tron:nile")
+
+    broadcast = MagicMock()
+    broadcast.wait = AsyncMock(return_value={"id": "tx", "receipt": {"result": "SUCCESS"}})
+    signed = MagicMock()
+    signed.broadcast = AsyncMock(return_value=broadcast)
+    txn = MagicMock()
+    txn.sign.return_value = signed
+    builder = MagicMock()
+    builder.fee_limit.return_value = builder
+    builder.build = AsyncMock(return_value=txn)
+    client = MagicMock()
+    client.get_contract = AsyncMock()
+    client.trx._build_transaction.return_value = builder
+    signer._async_tron_clients["tron:nile"] = client
+
+    assert await signer.ensure_allowance(token, 10, "tron:nile")
+
+    contract_type, value = client.trx._build_transaction.call_args.args
+    assert contract_type == "TriggerSmartContract"
+    assert value["owner_address"] == to_hex_address(signer.get_address())
+    assert value["contract_address"] == to_hex_address(token)
+    assert value["data"] == (
+        "095ea7b3" + tron_address_to_evm(spender)[2:].rjust(64, "0") + f"{(2**160) - 1:064x}"
+    )
+    builder.fee_limit.assert_called_once_with(100_000_000)
+    txn.sign.assert_called_once_with(signer._pk)
+    signed.broadcast.assert_awaited_once()
+    broadcast.wait.assert_awaited_once()
+    client.get_contract.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_ensure_allowance_reuses_recent_allowance():
+    """Test a recently observed allowance skips the RPC until it is used up or stale"""
+    from unittest.mock import AsyncMock, patch
+
+    private_key = "0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef"
+    signer = TronClientSigner.from_private_key(private_key)
+    signer.check_allowance = AsyncMock(return_value=100)
+
+    assert await signer.ensure_allowance("TTestToken", 60, "tron:nile")
+    assert signer.check_allowance.await_count == 1
+
+    # 40 left after reserving 60: covers 30, but not another 30
+    assert await signer.ensure_allowance("TTestToken", 30, "tron:nile")
+    assert signer.check_allowance.await_count == 1
+    assert await signer.ensure_allowance("TTestToken", 30, "tron:nile")
+    assert signer.check_allowance.await_count == 2
+
+    with patch("bankofai.x402.signers.client.base.time.monotonic", return_value=1e12):
+        assert await signer.ensure_allowance("TTestToken", 1, "tron:nile")
+    assert signer.check_allowance.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_evm_signer_approve_uses_configured_chain_id():
+    """Test the approval transaction takes its chain id from the network, not an RPC"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    private_key = "0x0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef"
+    signer = EvmClientSigner.from_private_key(private_key)
+    signer.check_allowance = AsyncMock(return_value=0)
+
+    w3 = MagicMock()
+    w3.eth.get_transaction_count = AsyncMock(return_value=7)
+    w3.eth.send_raw_transaction = AsyncMock(return_value=b"\x01")
+    w3.eth.wait_for_transaction_receipt = AsyncMock(return_value=MagicMock(status=1))
+    build_transaction = AsyncMock(return_value={})
+    w3.eth.contract.return_value.functions.approve.return_value.build_transaction = (
+        build_transaction
+    )
+    signer._async_web3_clients["eip155:8453"] = w3
+
+    assert await signer.ensure_allowance("0xTestToken", 100, "eip155:8453")
+
+    tx_params = build_transaction.await_args.args[0]
+    assert tx_params["chainId"] == 8453
+    assert tx_params["nonce"] == 7
+
+
+@pytest.mark.parametrize(
+    "module, class_name",
+    [("client", "TronClientSigner"), ("facilitator", "TronFacilitatorSigner")],
+)
+def test_tron_signer_parses_private_key_once(module, class_name):
+    """Test the TRON signers derive their address from the PrivateKey they keep"""
+    import importlib
+    from unittest.mock import patch
+
+    signer_module = importlib.import_module(f"bankofai.x402.signers.{module}.tron_signer")
+    signer_cls = getattr(signer_module, class_name)
+    private_key = "0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef"
+
+    with patch.object(
+        signer_module, "_PrivateKey", wraps=signer_module._PrivateKey
+    ) as private_key_cls:
+        signer = signer_cls.from_private_key(private_key)
+
+    assert private_key_cls.call_count == 1
+    assert signer.get_address() == signer_cls._derive_address(private_key)
+
+
+def test_client_signer_base_initializes_allowance_cache():
+    """Test the allowance helpers work for any ClientSigner subclass"""
+    from bankofai.x402.signers.client.base import ClientSigner
+
+    class MinimalSigner(ClientSigner):
+        def get_address(self):
+            return "addr"
+
+        async def sign_message(self, message):
+            return ""
+
+        async def sign_typed_data(self, domain, types, message):
+            return ""
+
+        async def check_balance(self, token, network):
+            return 0
+
+        async def check_allowance(self, token, amount, network):
+            return 0
+
+        async def ensure_allowance(self, token, amount, network, mode="auto"):
+            return True
+
+    signer = MinimalSigner()
+    assert not signer._reserve_cached_allowance("token", 1, "tron:nile")
+    signer._remember_allowance("token", 5, "tron:nile")
+    assert signer._reserve_cached_allowance("token", 5, "tron:nile")
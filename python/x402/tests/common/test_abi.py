@@ -0,0 +1,65 @@
+"""Tests for ABI signature and method ID helpers"""
+
+import copy
+
+import pytest
+
+from bankofai.x402.abi import (
+    ERC20_ABI,
+    PAYMENT_PERMIT_ABI,
+    calculate_method_id,
+    get_abi_json,
+    get_all_method_ids,
+    get_function_signature,
+)
+
+
+def test_precomputed_tables_match_dynamic_computation():
+    """Module ABIs resolve from import-time tables to the same values"""
+    for abi in (ERC20_ABI, PAYMENT_PERMIT_ABI):
+        other = copy.deepcopy(abi)
+        assert get_all_method_ids(abi) == get_all_method_ids(other)
+        for name in get_all_method_ids(abi):
+            assert get_function_signature(abi, name) == get_function_signature(other, name)
+            assert calculate_method_id(abi, name) == calculate_method_id(other, name)
+
+    assert calculate_method_id(ERC20_ABI, "approve") == "095ea7b3"
+
+
+def test_unknown_function_raises():
+    """Missing functions still raise, precomputed ABI or not"""
+    with pytest.raises(ValueError):
+        get_function_signature(ERC20_ABI, "transfer")
+    with pytest.raises(ValueError):
+        calculate_method_id(copy.deepcopy(ERC20_ABI), "transfer")
+
+
+def test_abi_json_is_serialized_once():
+    """Module ABIs return the same JSON string object on every call"""
+    assert get_abi_json(PAYMENT_PERMIT_ABI) is get_abi_json(PAYMENT_PERMIT_ABI)
+    assert get_abi_json(copy.deepcopy(ERC20_ABI)) == get_abi_json(ERC20_ABI)
+
+
+def test_payment_permit_types_are_private_copies():
+    """Each call returns its own copy; changing one leaves other callers untouched"""
+    from bankofai.x402.abi import get_payment_permit_eip712_types
+
+    first = get_payment_permit_eip712_types()
+    second = get_payment_permit_eip712_types()
+
+    assert first == second and first is not second
+    first["Fee"].append({"name": "extra", "type": "uint256"})
+    first["Payment"][0]["type"] = "uint256"
+    assert len(get_payment_permit_eip712_types()["Fee"]) == 2
+    assert get_payment_permit_eip712_types()["Payment"][0]["type"] == "address"
+
+
+def test_get_all_method_ids_for_custom_abi():
+    """Custom ABIs are indexed in one pass; malformed entries are skipped"""
+    abi = [
+        {"type": "function", "name": "approve", "inputs": ERC20_ABI[2]["inputs"]},
+        {"type": "function", "name": "broken", "inputs": [{"name": "x"}]},
+        {"type": "event", "name": "Transfer", "inputs": []},
+    ]
+
+    assert get_all_method_ids(abi) == {"approve": "095ea7b3"}
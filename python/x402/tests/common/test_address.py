@@ -0,0 +1,65 @@
+"""Tests for TRON/EVM address conversion helpers"""
+
+from bankofai.x402.address import TronAddressConverter
+from bankofai.x402.utils.address import normalize_tron_address, tron_address_to_evm
+
+USDT_NILE = "TXYZopYRdj2D9XRtbG411XZZ3kM5VkAeBf"
+
+
+def test_address_conversions_round_trip():
+    """EVM and TRON hex forms normalize back to the Base58 address"""
+    evm = tron_address_to_evm(USDT_NILE)
+
+    assert evm.startswith("0x") and len(evm) == 42
+    assert normalize_tron_address(evm) == USDT_NILE
+    assert normalize_tron_address("41" + evm[2:]) == USDT_NILE
+    assert normalize_tron_address("T000000000000") == TronAddressConverter.ZERO_ADDRESS
+
+
+def test_converter_reuses_memoized_conversions():
+    """Repeated conversions of the same address are served from the cache"""
+    converter = TronAddressConverter()
+    tron_address_to_evm.cache_clear()
+
+    first = converter.to_evm_format(USDT_NILE)
+    second = converter.to_evm_format(USDT_NILE)
+
+    assert first == second
+    assert tron_address_to_evm.cache_info().hits == 1
+
+
+def test_tron_address_to_evm_passes_through_evm_hex():
+    """EVM hex input is lowercased without a Base58 round-trip"""
+    evm = "0x" + "AB" * 20
+
+    assert tron_address_to_evm(evm) == evm.lower()
+    assert tron_address_to_evm("0xnothex") == "0xnothex"
+
+
+def test_convert_message_addresses():
+    """All five permit addresses are converted to EVM form"""
+    message = {
+        "buyer": USDT_NILE,
+        "caller": TronAddressConverter.ZERO_ADDRESS,
+        "payment": {"payToken": USDT_NILE, "payAmount": 1, "payTo": USDT_NILE},
+        "fee": {"feeTo": "0x" + "CD" * 20, "feeAmount": 0},
+    }
+
+    converted = TronAddressConverter().convert_message_addresses(message)
+
+    evm = tron_address_to_evm(USDT_NILE)
+    assert converted["buyer"] == converted["payment"]["payToken"] == evm
+    assert converted["payment"]["payTo"] == evm
+    assert converted["caller"] == "0x" + "00" * 20
+    assert converted["fee"]["feeTo"] == "0x" + "cd" * 20
+
+
+def test_converter_noop_flags():
+    """Only the EVM converter advertises a no-op message conversion"""
+    from bankofai.x402.address import EvmAddressConverter
+
+    message = {"buyer": "0x" + "11" * 20}
+
+    assert EvmAddressConverter.IS_NOOP
+    assert EvmAddressConverter().convert_message_addresses(message) is message
+    assert not TronAddressConverter.IS_NOOP
@@ -0,0 +1,23 @@
+"""Tests for NetworkConfig lookups"""
+
+import pytest
+
+from bankofai.x402.config import NetworkConfig
+from bankofai.x402.exceptions import UnsupportedNetworkError
+
+
+def test_chain_id_lookup():
+    """TRON chain IDs come from the table; EVM IDs are parsed from the identifier"""
+    assert NetworkConfig.get_chain_id("tron:nile") == 3448148188
+    assert NetworkConfig.get_chain_id("eip155:8453") == 8453
+    with pytest.raises(UnsupportedNetworkError):
+        NetworkConfig.get_chain_id("tron:unknown")
+
+
+def test_network_tables_are_read_only():
+    """Shared chain ID and PaymentPermit tables cannot be mutated"""
+    with pytest.raises(TypeError):
+        NetworkConfig.CHAIN_IDS["tron:nile"] = 1
+    with pytest.raises(TypeError):
+        NetworkConfig.PAYMENT_PERMIT_ADDRESSES["tron:nile"] = "T0"
+    assert NetworkConfig.get_payment_permit_address("tron:nile").startswith("T")
@@ -0,0 +1,96 @@
+"""Tests for the specialized PaymentPermit EIP-712 encoding"""
+
+from eth_account.messages import encode_typed_data
+
+from bankofai.x402.abi import (
+    EIP712_DOMAIN_TYPE,
+    PAYMENT_PERMIT_PRIMARY_TYPE,
+    get_payment_permit_eip712_types,
+)
+from bankofai.x402.signers.utils import encode_payment_permit
+
+DOMAIN = {
+    "name": "PaymentPermit",
+    "chainId": 3448148188,
+    "verifyingContract": "0x" + "33" * 20,
+}
+
+
+def _permit_message(payment_id):
+    return {
+        "meta": {
+            "kind": 1,
+            "paymentId": payment_id,
+            "nonce": 42,
+            "validAfter": 1700000000,
+            "validBefore": 1700003600,
+        },
+        "buyer": "0x" + "11" * 20,
+        "caller": "0x0000000000000000000000000000000000000000",
+        "payment": {"payToken": "0x" + "22" * 20, "payAmount": 1000000, "payTo": "0x" + "44" * 20},
+        "fee": {"feeTo": "0x" + "55" * 20, "feeAmount": 10000},
+    }
+
+
+def test_encode_payment_permit_matches_generic_encoder():
+    """Specialized hashing produces the same digest as eth_account"""
+    types = get_payment_permit_eip712_types()
+    message = _permit_message(b"\x12" * 16)
+
+    expected = encode_typed_data(
+        full_message={
+            "types": {"EIP712Domain": EIP712_DOMAIN_TYPE, **types},
+            "primaryType": PAYMENT_PERMIT_PRIMARY_TYPE,
+            "domain": DOMAIN,
+            "message": message,
+        }
+    )
+
+    assert encode_payment_permit(DOMAIN, types, message) == expected
+    assert encode_payment_permit(DOMAIN, types, _permit_message("0x" + "12" * 16)) == expected
+
+
+def test_encode_payment_permit_falls_back_for_other_layouts():
+    """Non-PaymentPermit types or domains are left to the generic encoder"""
+    types = get_payment_permit_eip712_types()
+    message = _permit_message(b"\x12" * 16)
+
+    assert encode_payment_permit({**DOMAIN, "version": "1"}, types, message) is None
+    assert encode_payment_permit(DOMAIN, {"Test": [{"name": "a", "type": "uint256"}]}, {}) is None
+
+    types["Fee"].append({"name": "extra", "type": "uint256"})
+    assert encode_payment_permit(DOMAIN, types, message) is None
+    assert encode_payment_permit(DOMAIN, get_payment_permit_eip712_types(), message) is not None
+
+
+def test_payment_permit_domain_separator_is_memoized():
+    """Domain separator is hashed once per deployment"""
+    from bankofai.x402.signers.utils import (
+        _payment_permit_domain_separator,
+        hash_payment_permit_domain,
+    )
+
+    _payment_permit_domain_separator.cache_clear()
+    first = hash_payment_permit_domain(DOMAIN)
+    second = hash_payment_permit_domain({**DOMAIN, "chainId": str(DOMAIN["chainId"])})
+
+    assert first == second
+    assert _payment_permit_domain_separator.cache_info().hits == 1
+
+
+def test_payment_and_fee_struct_hashes_are_memoized():
+    """Repeat payments reuse the Payment and Fee struct hashes; meta still varies"""
+    from bankofai.x402.signers.utils import (
+        _fee_struct_hash,
+        _payment_struct_hash,
+        hash_payment_permit_details,
+    )
+
+    _payment_struct_hash.cache_clear()
+    _fee_struct_hash.cache_clear()
+    first = _permit_message(b"\x12" * 16)
+    second = _permit_message(b"\x34" * 16)
+
+    assert hash_payment_permit_details(first) != hash_payment_permit_details(second)
+    assert _payment_struct_hash.cache_info().hits == 1
+    assert _fee_struct_hash.cache_info().hits == 1
@@ -0,0 +1,22 @@
+"""Tests for setup_logging"""
+
+import logging
+
+from bankofai.x402.logging_config import setup_logging
+
+
+def test_setup_logging_is_idempotent():
+    """Repeated calls keep one handler and only update the level"""
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    try:
+        setup_logging(logging.INFO)
+        handler = root.handlers[0]
+        setup_logging(logging.DEBUG)
+
+        assert root.handlers == [handler]
+        assert handler.level == logging.DEBUG
+        assert root.level == logging.DEBUG
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
@@ -0,0 +1,94 @@
+"""Tests for shared RPC client factories"""
+
+import pytest
+
+from bankofai.x402.signers.client import EvmClientSigner, TronClientSigner
+from bankofai.x402.signers.utils import create_async_web3_client, get_async_web3_client
+from bankofai.x402.utils.tron_client import create_async_tron_client, get_async_tron_client
+
+
+@pytest.mark.asyncio
+async def test_tron_clients_share_http_pool():
+    """Shared AsyncTron clients on the same loop reuse one pooled HTTP client"""
+    nile = get_async_tron_client("tron:nile")
+    mainnet = get_async_tron_client("mainnet")
+
+    assert nile.provider.client is mainnet.provider.client
+
+
+@pytest.mark.asyncio
+async def test_closing_created_tron_client_keeps_shared_pool():
+    """Closing a client from the public factory leaves the shared pool open"""
+    shared = get_async_tron_client("tron:nile")
+
+    async with create_async_tron_client("tron:nile") as own:
+        assert own.provider.client is not shared.provider.client
+
+    assert own.provider.client.is_closed
+    assert not shared.provider.client.is_closed
+    assert get_async_tron_client("tron:nile") is shared
+
+
+def test_tron_client_without_loop_uses_own_http_client():
+    """Outside an event loop, tronpy keeps its own HTTP client"""
+    first = create_async_tron_client("tron:nile")
+    second = create_async_tron_client("tron:nile")
+
+    assert first.provider.client is not second.provider.client
+
+
+def test_web3_clients_share_provider():
+    """AsyncWeb3 clients for the same endpoint share one provider"""
+    first = create_async_web3_client("eip155:97")
+    second = create_async_web3_client("eip155:97")
+
+    assert first is not second
+    assert first.provider is second.provider
+
+
+@pytest.mark.asyncio
+async def test_tron_client_shared_across_signers(mock_tron_private_key):
+    """Signers on the same network reuse one AsyncTron client"""
+    first = TronClientSigner.from_private_key(mock_tron_private_key)
+    second = TronClientSigner.from_private_key(mock_tron_private_key)
+
+    client = first._ensure_async_tron_client("tron:nile")
+    assert second._ensure_async_tron_client("tron:nile") is client
+    assert get_async_tron_client("nile") is client
+    assert get_async_tron_client("tron:mainnet") is not client
+
+
+def test_web3_client_shared_across_signers(mock_evm_private_key):
+    """Signers on the same endpoint reuse one AsyncWeb3 client"""
+    first = EvmClientSigner.from_private_key(mock_evm_private_key)
+    second = EvmClientSigner.from_private_key(mock_evm_private_key)
+
+    w3 = first._ensure_async_web3_client("eip155:97")
+    assert second._ensure_async_web3_client("eip155:97") is w3
+    assert get_async_web3_client("eip155:97") is w3
+
+
+def test_web3_client_registry_is_thread_safe():
+    """Concurrent first use from several threads builds a single client"""
+    from concurrent.futures import ThreadPoolExecutor
+    from unittest.mock import patch
+
+    from bankofai.x402.signers import utils
+
+    with patch.dict(utils._async_web3_clients, clear=True):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(get_async_web3_client, ["eip155:56"] * 32))
+
+    assert all(client is clients[0] for client in clients)
+
+
+@pytest.mark.asyncio
+async def test_web3_provider_uses_keep_alive_session():
+    """The shared web3 provider pools connections instead of closing them per call"""
+    provider = create_async_web3_client("eip155:97").provider
+
+    await provider._ensure_pooled_session()
+    session = await provider.cache_async_session(None)
+
+    assert not session.connector.force_close
+    await provider.disconnect()
@@ -0,0 +1,78 @@
+"""Tests for TokenRegistry address lookups"""
+
+from bankofai.x402.tokens import TokenInfo, TokenRegistry
+
+
+def test_find_by_address_evm_is_case_insensitive():
+    """EVM token lookup ignores address casing"""
+    usdt = TokenRegistry.get_token("eip155:97", "USDT")
+
+    assert TokenRegistry.find_by_address("eip155:97", usdt.address.lower()) is usdt
+    assert TokenRegistry.find_by_address("eip155:97", "0x" + usdt.address[2:].upper()) is usdt
+
+
+def test_find_by_address_tron():
+    """TRON token lookup matches the Base58 address"""
+    usdt = TokenRegistry.get_token("tron:nile", "USDT")
+
+    assert TokenRegistry.find_by_address("tron:nile", usdt.address) is usdt
+    assert TokenRegistry.find_by_address("tron:nile", "T9yD14Nj9j7xAB4dbGeiX9h8unkKHxuWwb") is None
+
+
+def test_find_by_address_tracks_registry_changes():
+    """Lookups reflect tokens registered or removed after the index was built"""
+    address = "0x00000000000000000000000000000000000000aa"
+    assert TokenRegistry.find_by_address("eip155:8453", address) is None
+
+    token = TokenInfo(address=address, decimals=6, name="Test", symbol="TST")
+    TokenRegistry.register_token("eip155:8453", token)
+    try:
+        assert TokenRegistry.find_by_address("eip155:8453", "0x" + address[2:].upper()) is token
+    finally:
+        TokenRegistry._tokens["eip155:8453"].pop("TST", None)
+
+    assert TokenRegistry.find_by_address("eip155:8453", address) is None
+
+
+def test_find_by_address_miss_keeps_index():
+    """Unknown addresses are answered from the index without rebuilding it"""
+    unknown = "0x00000000000000000000000000000000000000cc"
+    assert TokenRegistry.find_by_address("eip155:97", unknown) is None
+    index = TokenRegistry._tokens_by_addr["eip155:97"]
+
+    assert TokenRegistry.find_by_address("eip155:97", unknown) is None
+    assert TokenRegistry._tokens_by_addr["eip155:97"] is index
+
+
+def test_parse_price_is_exact():
+    """Decimal prices convert to smallest units without float round-off"""
+    assert TokenRegistry.parse_price("0.1 USDT", "tron:nile")["amount"] == 100000
+    assert TokenRegistry.parse_price("1.13 USDD", "tron:nile")["amount"] == 1130000000000000000
+    assert TokenRegistry.parse_price("0.57 USDT", "tron:nile")["amount"] == 570000
+
+
+def test_get_token_tracks_registered_tokens():
+    """get_token resolves built-in and newly registered tokens by symbol"""
+    assert TokenRegistry.get_token("tron:nile", "usdt").symbol == "USDT"
+
+    address = "TXYZopYRdj2D9XRtbG411XZZ3kM5VkAeBf"
+    token = TokenInfo(address=address, decimals=6, name="Test", symbol="TT")
+    TokenRegistry.register_token("tron:nile", token)
+    try:
+        assert TokenRegistry.get_token("tron:nile", "tt") is token
+    finally:
+        TokenRegistry._tokens["tron:nile"].pop("TT", None)
+
+
+def test_get_token_tracks_network_token_edits():
+    """get_token sees tokens added or removed through get_network_tokens"""
+    address = "0x00000000000000000000000000000000000000bb"
+    token = TokenInfo(address=address, decimals=6, name="Test", symbol="TST")
+    tokens = TokenRegistry.get_network_tokens("eip155:97")
+    tokens["TST"] = token
+    try:
+        assert TokenRegistry.get_token("eip155:97", "tst") is token
+        assert TokenRegistry.find_by_address("eip155:97", address) is token
+    finally:
+        tokens.pop("TST", None)
+    assert TokenRegistry.find_by_address("eip155:97", address) is None
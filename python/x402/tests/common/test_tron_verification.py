@@ -0,0 +1,184 @@
+"""Tests for TRON transaction transfer parsing"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from bankofai.x402.utils.tron_verification import TronTransactionVerifier
+
+TRANSFER_TOPIC = "ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+TOKEN = "TXYZopYRdj2D9XRtbG411XZZ3kM5VkAeBf"
+
+
+@pytest.fixture(autouse=True)
+def _clear_tx_info_cache():
+    from bankofai.x402.utils.tron_verification import _tx_info_cache
+
+    _tx_info_cache.clear()
+    yield
+    _tx_info_cache.clear()
+
+
+def _topic(address_hex: str) -> str:
+    return "0" * 24 + address_hex
+
+
+@pytest.mark.asyncio
+async def test_get_transaction_transfers_filters_logs():
+    """Only Transfer events emitted by the requested token are returned"""
+    verifier = TronTransactionVerifier("nile")
+    token_hex = verifier._normalize_to_hex(TOKEN)
+    sender, receiver = "11" * 20, "22" * 20
+
+    transfer = {
+        "address": token_hex,
+        "topics": [TRANSFER_TOPIC, _topic(sender), _topic(receiver)],
+        "data": f"{1500:064x}",
+    }
+    client = MagicMock()
+    client.get_transaction_info = AsyncMock(
+        return_value={
+            "log": [
+                transfer,
+                {**transfer, "address": "33" * 20},
+                {**transfer, "topics": ["00" * 32, *transfer["topics"][1:]]},
+                {**transfer, "topics": transfer["topics"][:2]},
+            ]
+        }
+    )
+    verifier._async_client = client
+
+    transfers = await verifier.get_transaction_transfers("txid", TOKEN)
+
+    assert len(transfers) == 1
+    assert transfers[0].amount == 1500
+    assert transfers[0].from_addr == verifier._parse_address_from_topic(_topic(sender))
+    assert transfers[0].to_addr == verifier._parse_address_from_topic(_topic(receiver))
+
+
+def test_parse_address_from_topic_is_memoized():
+    """Repeated topic addresses are converted to Base58 only once"""
+    from bankofai.x402.utils.tron_verification import _hex_to_base58
+
+    verifier = TronTransactionVerifier("nile")
+    _hex_to_base58.cache_clear()
+
+    first = verifier._parse_address_from_topic(_topic("ab" * 20))
+    second = verifier._parse_address_from_topic(_topic("AB" * 20))
+
+    assert first == second
+    assert first.startswith("T")
+    assert _hex_to_base58.cache_info().hits == 1
+
+
+def test_transfer_event_is_slotted_and_immutable():
+    """TransferEvent instances carry no per-instance __dict__ and cannot be mutated"""
+    from dataclasses import FrozenInstanceError
+
+    from bankofai.x402.utils.tx_verification import TransferEvent
+
+    event = TransferEvent(token=TOKEN, from_addr="a", to_addr="b", amount=1)
+
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        event.amount = 2
+
+
+@pytest.mark.asyncio
+async def test_get_many_transaction_infos_preserves_order():
+    """Batched lookups return one result per hash, in request order"""
+    verifier = TronTransactionVerifier("nile")
+
+    async def get_info(tx_hash):
+        if tx_hash == "pending":
+            return {}
+        result = "SUCCESS" if tx_hash == "ok" else "REVERT"
+        return {"blockNumber": 1, "receipt": {"result": result}}
+
+    client = MagicMock()
+    client.get_transaction_info = AsyncMock(side_effect=get_info)
+    verifier._async_client = client
+
+    infos = await verifier.get_many_transaction_infos(["ok", "bad", "pending"])
+
+    assert [info["hash"] for info in infos] == ["ok", "bad", "pending"]
+    assert [info["status"] for info in infos] == ["confirmed", "failed", "pending"]
+
+
+@pytest.mark.asyncio
+async def test_iter_transfers_stops_early():
+    """Callers can stop after the first matching transfer"""
+    verifier = TronTransactionVerifier("nile")
+    token_hex = verifier._normalize_to_hex(TOKEN)
+    transfer = {
+        "address": token_hex,
+        "topics": [TRANSFER_TOPIC, _topic("11" * 20), _topic("22" * 20)],
+        "data": f"{1:064x}",
+    }
+    client = MagicMock()
+    client.get_transaction_info = AsyncMock(return_value={"log": [transfer, transfer]})
+    verifier._async_client = client
+
+    parse_topic = verifier._parse_address_from_topic
+    with patch.object(verifier, "_parse_address_from_topic", wraps=parse_topic) as parse:
+        async for event in verifier.iter_transfers("txid", TOKEN):
+            assert event.amount == 1
+            break
+
+    assert parse.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_verify_transaction_skips_expected_log_when_info_disabled():
+    """Expected-transfer logging does no address work unless INFO is enabled"""
+    verifier = TronTransactionVerifier("nile")
+    verifier.get_transaction_info = AsyncMock(return_value={"status": "confirmed"})
+
+    with (
+        patch.object(verifier._logger, "isEnabledFor", return_value=False),
+        patch.object(verifier, "normalize_address") as normalize,
+    ):
+        result = await verifier.verify_transaction("txid", MagicMock(), MagicMock())
+
+    assert result.success
+    normalize.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_confirmed_transaction_info_is_cached():
+    """Confirmed transactions are fetched once; pending ones are re-polled"""
+    client = MagicMock()
+    client.get_transaction_info = AsyncMock(
+        side_effect=lambda h: {} if h == "pending" else {"blockNumber": 7, "receipt": {}}
+    )
+
+    first = TronTransactionVerifier("nile")
+    first._async_client = client
+    await first.get_transaction_info("done")
+    await first.get_transaction_transfers("done", TOKEN)
+
+    second = TronTransactionVerifier("nile")
+    second._async_client = client
+    assert (await second.get_transaction_info("done"))["blockNumber"] == "7"
+    assert client.get_transaction_info.await_count == 1
+
+    await first.get_transaction_info("pending")
+    await first.get_transaction_info("pending")
+    assert client.get_transaction_info.await_count == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("status", "success"),
+    [("confirmed", True), ("FAILED", False), ("0", False), (0, False), (1, True)],
+)
+async def test_verify_transaction_status(status, success):
+    """String and integer failure statuses are both recognized"""
+    verifier = TronTransactionVerifier("nile")
+    verifier.get_transaction_info = AsyncMock(return_value={"status": status})
+
+    result = await verifier.verify_transaction("txid", MagicMock(), MagicMock())
+
+    assert result.success is success
+    with pytest.raises(AttributeError):
+        result.success = not success
@@ -72,3 +72,20 @@ def test_payment_permit_serialization():
     assert "buyer" in data
     assert "payment" in data
     assert data["payment"]["payAmount"] == "1000000"
+
+
+def test_payment_payload_header_round_trip():
+    """测试模型经 base64 头部编码后可按别名校验还原"""
+    from bankofai.x402.encoding import decode_payment_payload, encode_payment_payload
+
+    requirements = PaymentRequirements(
+        scheme="exact_permit",
+        network="tron:nile",
+        amount="1000000",
+        asset="TTestTokenAddress",
+        payTo="TTestPayToAddress",
+    )
+    encoded = encode_payment_payload(requirements)
+
+    assert decode_payment_payload(encoded, PaymentRequirements) == requirements
+    assert decode_payment_payload(encoded)["payTo"] == "TTestPayToAddress"
@@ -2,17 +2,21 @@
 Tests for exact types and helpers.
 """
 
+import json
 import time
 
 from bankofai.x402.mechanisms._exact_base.types import (
     SCHEME_EXACT,
     TRANSFER_AUTH_EIP712_TYPES,
     TRANSFER_AUTH_PRIMARY_TYPE,
+    TRANSFER_WITH_AUTHORIZATION_ABI,
     TransferAuthorization,
     build_eip712_domain,
     build_eip712_message,
     create_nonce,
+    create_nonces,
     create_validity_window,
+    get_transfer_with_authorization_abi_json,
 )
 
 
@@ -52,6 +56,41 @@ class TestTransferAuthorization:
         assert "validBefore" in dumped
         assert "from_address" not in dumped
 
+    def test_constructed_matches_validated(self):
+        fields = {
+            "from_address": "TFrom",
+            "to": "TTo",
+            "value": "100",
+            "valid_after": "0",
+            "valid_before": "999",
+            "nonce": "0x" + "00" * 32,
+        }
+        constructed = TransferAuthorization.model_construct(**fields)
+        validated = TransferAuthorization(**fields)
+        assert constructed.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+
+    def test_decoded_fields(self):
+        auth = TransferAuthorization(
+            **{
+                "from": "TFrom",
+                "to": "TTo",
+                "value": "100",
+                "validAfter": "5",
+                "validBefore": "999",
+                "nonce": "0x" + "ab" * 32,
+            }
+        )
+        assert auth.nonce_bytes == b"\xab" * 32
+        assert (auth.value_int, auth.valid_after_int, auth.valid_before_int) == (100, 5, 999)
+        assert build_eip712_message(auth)["nonce"] == auth.nonce_bytes
+        assert "nonce_bytes" not in auth.model_dump()
+
+        # Decoded values follow the string fields after copies and assignment
+        assert auth.model_copy(update={"value": "99"}).value_int == 99
+        auth.value = "7"
+        auth.valid_before = "1000"
+        assert (auth.value_int, auth.valid_before_int) == (7, 1000)
+
 
 class TestCreateNonce:
     def test_nonce_format(self):
@@ -63,6 +102,13 @@ class TestCreateNonce:
         nonces = {create_nonce() for _ in range(100)}
         assert len(nonces) == 100
 
+    def test_create_nonces_batch(self):
+        nonces = create_nonces(50)
+        assert len(nonces) == 50
+        assert len(set(nonces)) == 50
+        assert all(n.startswith("0x") and len(n) == 66 for n in nonces)
+        assert create_nonces(0) == []
+
 
 class TestCreateValidityWindow:
     def test_default_window(self):
@@ -127,3 +173,8 @@ class TestConstants:
         assert "validAfter" in field_names
         assert "validBefore" in field_names
         assert "nonce" in field_names
+
+    def test_abi_json_is_shared_constant(self):
+        abi_json = get_transfer_with_authorization_abi_json()
+        assert abi_json is get_transfer_with_authorization_abi_json()
+        assert json.loads(abi_json) == TRANSFER_WITH_AUTHORIZATION_ABI
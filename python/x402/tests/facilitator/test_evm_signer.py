@@ -55,3 +55,57 @@ async def test_evm_verify_typed_data_invalid(mock_evm_private_key):
 
     valid = await signer.verify_typed_data(signer.get_address(), domain, types, message, signature)
     assert valid is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parallel", [False, True])
+async def test_evm_verify_typed_data_batch(mock_evm_private_key, monkeypatch, parallel):
+    """Test batch verification matches per-item verification, in-process or in the pool"""
+    if parallel:
+        from bankofai.x402.signers import utils
+
+        monkeypatch.setattr(utils, "PARALLEL_VERIFY_MIN_BATCH", 2)
+        monkeypatch.setattr(utils, "_verify_pool_workers", 2)
+
+    signer = EvmFacilitatorSigner.from_private_key(mock_evm_private_key)
+
+    domain = {
+        "name": "PaymentPermit",
+        "chainId": 1,
+        "verifyingContract": "0x0000000000000000000000000000000000000000",
+    }
+    types = {"Test": [{"name": "content", "type": "string"}]}
+
+    from eth_account import Account
+    from eth_account.messages import encode_typed_data
+
+    from bankofai.x402.abi import EIP712_DOMAIN_TYPE
+
+    def sign(content):
+        typed_data = {
+            "types": {"EIP712Domain": EIP712_DOMAIN_TYPE, **types},
+            "primaryType": "Test",
+            "domain": domain,
+            "message": {"content": content},
+        }
+        encoded = encode_typed_data(full_message=typed_data)
+        return Account.sign_message(encoded, private_key=mock_evm_private_key).signature.hex()
+
+    address = signer.get_address()
+    other = "0x0000000000000000000000000000000000000001"
+    items = [
+        (address, domain, types, {"content": "a"}, sign("a")),
+        (address, domain, types, {"content": "b"}, sign("b")),
+        (address, domain, types, {"content": "c"}, sign("tampered")),
+        (other, domain, types, {"content": "a"}, sign("a")),
+        (address, domain, types, {"content": "a"}, "0x" + "00" * 65),
+    ]
+
+    try:
+        results = await signer.verify_typed_data_batch(items)
+    finally:
+        if parallel:
+            utils.shutdown_verify_pool()
+    assert results == [True, True, False, False, False]
+    if parallel:
+        assert utils._verify_pool is None
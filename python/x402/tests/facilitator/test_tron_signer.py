@@ -0,0 +1,224 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from bankofai.x402.signers.facilitator import TronFacilitatorSigner
+
+
+@pytest.fixture
+def tron_signer(mock_tron_private_key):
+    return TronFacilitatorSigner.from_private_key(mock_tron_private_key)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_receipt_backs_off_exponentially(tron_signer):
+    """Test receipt polling starts fast and backs off up to the cap"""
+    client = MagicMock()
+    client.get_transaction_info = AsyncMock(
+        side_effect=[{}, {}, {}, {}, {"blockNumber": 42, "receipt": {"result": "SUCCESS"}}]
+    )
+    tron_signer._async_tron_clients["tron:nile"] = client
+
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    with patch("asyncio.sleep", fake_sleep):
+        receipt = await tron_signer.wait_for_transaction_receipt("txid", network="tron:nile")
+
+    assert receipt == {"hash": "txid", "blockNumber": "42", "status": "confirmed"}
+    assert sleeps == [0.5, 1.0, 2.0, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_receipt_times_out_on_loop_clock(tron_signer):
+    """Test the last sleep is trimmed to the deadline before timing out"""
+    import asyncio
+
+    client = MagicMock()
+    client.get_transaction_info = AsyncMock(return_value={})
+    tron_signer._async_tron_clients["tron:nile"] = client
+
+    loop = asyncio.get_running_loop()
+    now = [loop.time()]
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        now[0] += delay
+
+    with (
+        patch.object(loop, "time", lambda: now[0]),
+        patch("asyncio.sleep", fake_sleep),
+        pytest.raises(TimeoutError),
+    ):
+        await tron_signer.wait_for_transaction_receipt("txid", timeout=5, network="tron:nile")
+
+    assert sleeps == [0.5, 1.0, 2.0, 1.5]
+    assert client.get_transaction_info.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_wait_for_receipt_reports_failed_tx(tron_signer):
+    """Test a mined but reverted transaction is reported as failed"""
+    client = MagicMock()
+    client.get_transaction_info = AsyncMock(
+        return_value={"blockNumber": 7, "receipt": {"result": "REVERT"}}
+    )
+    tron_signer._async_tron_clients["tron:nile"] = client
+
+    receipt = await tron_signer.wait_for_transaction_receipt("txid", network="tron:nile")
+
+    assert receipt["status"] == "failed"
+
+
+@pytest.mark.asyncio
+async def test_verify_typed_data_batch(tron_signer, mock_tron_private_key):
+    """Test batch verification of TRON-signed permits"""
+    from bankofai.x402.abi import get_payment_permit_eip712_types
+    from bankofai.x402.signers.client import TronClientSigner
+    from bankofai.x402.utils.address import tron_address_to_evm
+
+    client_signer = TronClientSigner.from_private_key(mock_tron_private_key)
+    address = client_signer.get_address()
+    zero = "0x0000000000000000000000000000000000000000"
+    domain = {"name": "PaymentPermit", "chainId": 3448148188, "verifyingContract": zero}
+    types = get_payment_permit_eip712_types()
+
+    def permit_message(amount):
+        return {
+            "meta": {
+                "kind": 0,
+                "paymentId": "0x" + "11" * 16,
+                "nonce": 1,
+                "validAfter": 0,
+                "validBefore": 2**32,
+            },
+            "buyer": tron_address_to_evm(address),
+            "caller": zero,
+            "payment": {"payToken": zero, "payAmount": amount, "payTo": zero},
+            "fee": {"feeTo": zero, "feeAmount": 0},
+        }
+
+    signed = permit_message(100)
+    signature = await client_signer.sign_typed_data(
+        domain, types, {**signed, "meta": {**signed["meta"], "paymentId": b"\x11" * 16}}
+    )
+
+    items = [
+        (address, domain, types, signed, signature),
+        (address, domain, types, permit_message(999), signature),
+        (address, {**domain, "version": "1"}, types, signed, signature),
+        (tron_address_to_evm(address), domain, types, signed, signature),
+        ("T0invalid", domain, types, signed, signature),
+    ]
+
+    results = await tron_signer.verify_typed_data_batch(items)
+    assert results == [True, False, False, True, False]
+    for item, result in zip(items, results):
+        assert await tron_signer.verify_typed_data(*item) is result
+
+
+def test_serialize_contract_args_nested():
+    """Test contract arguments are serialized through nested structures"""
+    from bankofai.x402.signers.facilitator.tron_signer import _serialize_contract_args
+
+    args = [(1, b"\x01\x02", ("TAddr", [2])), {"k": b"\xff"}, None]
+
+    assert _serialize_contract_args(args) == [
+        [{"decimal": 1, "hex": "0x1"}, "0x0102", ["TAddr", [{"decimal": 2, "hex": "0x2"}]]],
+        {"k": "0xff"},
+        "None",
+    ]
+
+
+def test_log_contract_parameters_skipped_when_info_disabled(tron_signer):
+    """Test argument serialization is skipped when INFO logging is off"""
+    logger = MagicMock()
+    logger.isEnabledFor.return_value = False
+
+    with patch(
+        "bankofai.x402.signers.facilitator.tron_signer._serialize_contract_args"
+    ) as serialize:
+        tron_signer._log_contract_parameters("permitTransferFrom", [1, 2], logger)
+
+    serialize.assert_not_called()
+    logger.info.assert_not_called()
+
+
+def test_normalize_tron_address_is_cached(tron_signer):
+    """Test contract address normalization is computed once per address"""
+    evm_address = "0x" + "ab" * 20
+    tron_signer._normalize_tron_address.cache_clear()
+
+    first = tron_signer._normalize_tron_address(evm_address)
+    second = tron_signer._normalize_tron_address(evm_address)
+
+    assert first == second
+    assert first.startswith("T")
+    assert tron_signer._normalize_tron_address("TAlreadyBase58") == "TAlreadyBase58"
+    assert tron_signer._normalize_tron_address.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_account_resources_not_fetched_when_info_disabled(tron_signer):
+    """Test the resource-logging RPCs are skipped unless INFO logging is on"""
+    from bankofai.x402.signers.facilitator import tron_signer as module
+
+    client = MagicMock()
+    client.get_account = AsyncMock(return_value={"balance": 1_000_000})
+    client.get_account_resource = AsyncMock(return_value={})
+
+    with patch.object(module.logger, "isEnabledFor", return_value=False):
+        await tron_signer._log_account_resources(client)
+    client.get_account.assert_not_awaited()
+
+    with patch.object(module.logger, "isEnabledFor", return_value=True):
+        await tron_signer._log_account_resources(client)
+    client.get_account.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_contract_function_is_cached(tron_signer):
+    """Test the contract and method object are built once per ABI"""
+    abi = '[{"type": "function", "name": "transfer", "inputs": []}]'
+    contract = MagicMock()
+    client = MagicMock()
+    client.get_contract = AsyncMock(return_value=contract)
+
+    first = await tron_signer._get_contract_function(client, "TAddr", abi, "transfer", "tron:nile")
+    second = await tron_signer._get_contract_function(client, "TAddr", abi, "transfer", "tron:nile")
+
+    assert first is second is contract.functions.transfer
+    assert contract.abi == [{"type": "function", "name": "transfer", "inputs": []}]
+    client.get_contract.assert_awaited_once_with("TAddr")
+
+
+def test_evm_to_tron_conversion_is_shared(tron_signer):
+    """Test both address helpers reuse one memoized Base58Check conversion"""
+    from bankofai.x402.signers.facilitator.tron_signer import _evm_to_tron_cached
+
+    evm_address = "0x" + "cd" * 20
+    tron_signer._normalize_tron_address.cache_clear()
+    _evm_to_tron_cached.cache_clear()
+
+    converted = tron_signer._evm_to_tron_address(evm_address.upper().replace("0X", "0x"))
+
+    assert tron_signer._normalize_tron_address(evm_address) == converted
+    assert _evm_to_tron_cached.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_contract_abi_parsed_without_orjson(tron_signer):
+    """Test the stdlib json fallback is used when orjson is unavailable"""
+    from bankofai.x402.signers.facilitator import tron_signer as module
+
+    contract = MagicMock()
+    client = MagicMock()
+    client.get_contract = AsyncMock(return_value=contract)
+
+    with patch.object(module, "_orjson", None):
+        await tron_signer._get_contract_function(client, "TAddr", '[{"a": 1}]', "m", "tron:nile")
+
+    assert contract.abi == [{"a": 1}]
@@ -0,0 +1,23 @@
+"""Tests for X402Facilitator mechanism registry"""
+
+from bankofai.x402.facilitator import X402Facilitator
+
+
+class _Mechanism:
+    def __init__(self, scheme: str):
+        self._scheme = scheme
+
+    def scheme(self) -> str:
+        return self._scheme
+
+
+def test_register_and_find_mechanism():
+    """Mechanisms are looked up by (network, scheme)"""
+    permit, other = _Mechanism("exact_permit"), _Mechanism("exact")
+    facilitator = X402Facilitator()
+    facilitator.register(["tron:nile", "tron:shasta"], permit).register(["tron:nile"], other)
+
+    assert facilitator._find_mechanism("tron:nile", "exact_permit") is permit
+    assert facilitator._find_mechanism("tron:nile", "exact") is other
+    assert facilitator._find_mechanism("tron:shasta", "exact") is None
+    assert facilitator._find_mechanism("eip155:97", "exact_permit") is None
@@ -126,3 +126,57 @@ class TestEnhancePaymentRequirements:
         assert enhanced.extra is not None
         assert enhanced.extra.name == "USD Coin"
         assert enhanced.extra.version == "1"
+
+
+class TestVerifySignature:
+    @pytest.mark.asyncio
+    async def test_recovers_signer_off_the_event_loop(self, mechanism):
+        import asyncio
+        from unittest.mock import patch
+
+        from eth_account import Account
+        from eth_account.messages import encode_typed_data
+
+        from bankofai.x402.abi import (
+            EIP712_DOMAIN_TYPE,
+            PAYMENT_PERMIT_PRIMARY_TYPE,
+            get_payment_permit_eip712_types,
+        )
+        from bankofai.x402.config import NetworkConfig
+        from bankofai.x402.types import Fee, Payment, PaymentPermit, PermitMeta
+
+        account = Account.create()
+        network = "eip155:97"
+        permit = PaymentPermit(
+            meta=PermitMeta(
+                kind="PAYMENT_ONLY",
+                paymentId="0x" + "12" * 16,
+                nonce="1",
+                validAfter=0,
+                validBefore=2000000000,
+            ),
+            buyer=account.address,
+            caller="0x0000000000000000000000000000000000000000",
+            payment=Payment(payToken=USDC_ADDRESS, payAmount="100", payTo="0x" + "44" * 20),
+            fee=Fee(feeTo="0x" + "55" * 20, feeAmount="0"),
+        )
+        signable = encode_typed_data(
+            full_message={
+                "types": {"EIP712Domain": EIP712_DOMAIN_TYPE, **get_payment_permit_eip712_types()},
+                "primaryType": PAYMENT_PERMIT_PRIMARY_TYPE,
+                "domain": {
+                    "name": "PaymentPermit",
+                    "chainId": 97,
+                    "verifyingContract": NetworkConfig.get_payment_permit_address(network),
+                },
+                "message": mechanism._convert_permit_to_message(permit),
+            }
+        )
+        signature = "0x" + account.sign_message(signable).signature.hex().removeprefix("0x")
+
+        with patch.object(asyncio, "to_thread", wraps=asyncio.to_thread) as to_thread:
+            assert await mechanism.verify_signature(permit, signature, network) is True
+        to_thread.assert_called_once()
+
+        other = permit.model_copy(update={"buyer": "0x" + "66" * 20})
+        assert await mechanism.verify_signature(other, signature, network) is False
@@ -0,0 +1,292 @@
+"""
+Tests for X402Middleware payment header decoding
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from bankofai.x402.encoding import encode_payment_payload
+from bankofai.x402.fastapi import middleware
+from bankofai.x402.types import (
+    Fee,
+    Payment,
+    PaymentPayload,
+    PaymentPayloadData,
+    PaymentPermit,
+    PaymentRequirements,
+    PermitMeta,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_payload_cache():
+    middleware._payload_cache.clear()
+    yield
+    middleware._payload_cache.clear()
+
+
+def _encoded_payload(nonce: str) -> str:
+    payload = PaymentPayload(
+        x402Version=2,
+        payload=PaymentPayloadData(
+            paymentPermit=PaymentPermit(
+                meta=PermitMeta(
+                    kind="PAYMENT_ONLY",
+                    paymentId="0x12345678901234567890123456789012",
+                    nonce=nonce,
+                    validAfter=1000000000,
+                    validBefore=2000000000,
+                ),
+                buyer="TTestBuyerAddress1111111111111111",
+                caller="TTestCallerAddress111111111111111",
+                payment=Payment(
+                    payToken="TG3XXyExBkPp9nzdajDZsozEu4BkaSJozs",
+                    payAmount="1000000",
+                    payTo="TTestPayToAddress1111111111111111",
+                ),
+                fee=Fee(feeTo="TTestFeeToAddress1111111111111111", feeAmount="0"),
+            ),
+            signature="0x" + "ab" * 65,
+        ),
+        accepted=PaymentRequirements(
+            scheme="exact_permit",
+            network="tron:shasta",
+            amount="1000000",
+            asset="TG3XXyExBkPp9nzdajDZsozEu4BkaSJozs",
+            payTo="TTestPayToAddress1111111111111111",
+        ),
+    )
+    return encode_payment_payload(payload)
+
+
+def test_decode_payment_payload_cached_reuses_decoded_header():
+    """Identical headers are decoded once; distinct headers are decoded separately"""
+    header = _encoded_payload("1")
+    decode = middleware.decode_payment_payload
+
+    with patch.object(middleware, "decode_payment_payload", wraps=decode) as spy:
+        first = middleware._decode_payment_payload_cached(header)
+        second = middleware._decode_payment_payload_cached(header)
+        other = middleware._decode_payment_payload_cached(_encoded_payload("2"))
+
+    assert first is second
+    assert other.payload.payment_permit.meta.nonce == "2"
+    assert spy.call_count == 2
+
+
+def test_decode_payment_payload_cached_does_not_cache_failures():
+    """Malformed headers raise every time and are not stored"""
+    with pytest.raises(Exception):
+        middleware._decode_payment_payload_cached("not-base64!")
+    assert len(middleware._payload_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_build_requirements_reuses_recent_builds():
+    """Requirements are built once per config until the TTL expires; failures are retried"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from bankofai.x402.server import ResourceConfig
+
+    server = MagicMock()
+    server.build_payment_requirements_with_expiry = AsyncMock(
+        side_effect=[RuntimeError("facilitator down"), (["nile"], None), (["nile-refreshed"], None)]
+    )
+    mw = middleware.X402Middleware(server)
+    config = ResourceConfig(scheme="exact_permit", network="tron:nile", price="1 USDT", pay_to="T")
+    cache: dict = {}
+
+    with pytest.raises(RuntimeError):
+        await mw._build_requirements([config], cache)
+    assert await mw._build_requirements([config], cache) == ["nile"]
+    assert await mw._build_requirements([config], cache) == ["nile"]
+    assert server.build_payment_requirements_with_expiry.await_count == 2
+
+    with patch.object(middleware.time, "monotonic", return_value=1e12):
+        assert await mw._build_requirements([config], cache) == ["nile-refreshed"]
+
+
+@pytest.mark.asyncio
+async def test_build_requirements_rebuilds_on_quote_expiry():
+    """Requirements are rebuilt once their fee quote expires, even within the TTL"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from bankofai.x402.server import ResourceConfig
+
+    now = int(time.time())
+    server = MagicMock()
+    server.build_payment_requirements_with_expiry = AsyncMock(
+        side_effect=[(["first"], now + 30), (["second"], now + 300)]
+    )
+    mw = middleware.X402Middleware(server)
+    config = ResourceConfig(scheme="exact_permit", network="tron:nile", price="1 USDT", pay_to="T")
+    cache: dict = {}
+
+    assert await mw._build_requirements([config], cache) == ["first"]
+    assert await mw._build_requirements([config], cache) == ["first"]
+
+    with patch.object(middleware.time, "time", return_value=now + 30):
+        assert await mw._build_requirements([config], cache) == ["second"]
+        assert await mw._build_requirements([config], cache) == ["second"]
+    assert server.build_payment_requirements_with_expiry.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_verify_transaction_on_chain_caches_successes():
+    """Successful verifications are reused per tx hash until the TTL expires; failures are not"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from bankofai.x402.utils.tx_verification import TransactionVerificationResult
+
+    failed = TransactionVerificationResult(success=False, tx_hash="0xabc", error_reason="rpc down")
+    ok = TransactionVerificationResult(success=True, tx_hash="0xabc", status_verified=True)
+    verifier = MagicMock()
+    verifier.verify_transaction = AsyncMock(side_effect=[failed, ok, ok])
+    mw = middleware.X402Middleware(MagicMock())
+
+    with patch.object(middleware, "get_verifier_for_network", return_value=verifier):
+        assert await mw._verify_transaction_on_chain("0xabc", None, None, "tron:nile") is failed
+        assert await mw._verify_transaction_on_chain("0xabc", None, None, "tron:nile") is ok
+        assert await mw._verify_transaction_on_chain("0xabc", None, None, "tron:nile") is ok
+        assert verifier.verify_transaction.await_count == 2
+
+        with patch.object(middleware.time, "monotonic", return_value=1e12):
+            await mw._verify_transaction_on_chain("0xabc", None, None, "tron:nile")
+        assert verifier.verify_transaction.await_count == 3
+
+
+def test_index_configs_matches_asset_case_insensitively():
+    """Configs are indexed by network and token address, first config winning"""
+    from bankofai.x402.server import ResourceConfig
+    from bankofai.x402.tokens import TokenRegistry
+
+    usdt = TokenRegistry.get_token("tron:mainnet", "USDT")
+    first, second, usdd = (
+        ResourceConfig(scheme="exact_permit", network="tron:mainnet", price=price, pay_to="T")
+        for price in ("1 USDT", "2 USDT", "1 USDD")
+    )
+    configs = [first, second, usdd]
+
+    index = middleware.X402Middleware._index_configs(configs)
+
+    assert index[("tron:mainnet", usdt.address.lower())] is first
+    assert middleware.X402Middleware._match_config(configs, "tron:mainnet", usdt.address) is first
+    assert middleware.X402Middleware._match_config(configs, "tron:shasta", usdt.address) is None
+
+
+@pytest.mark.parametrize("raw_response", [False, True])
+def test_protected_endpoint_sets_payment_response_header(raw_response):
+    """Settled requests get a PAYMENT-RESPONSE header for dict and Response results"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from fastapi import FastAPI, Request
+    from fastapi.responses import JSONResponse
+    from fastapi.testclient import TestClient
+
+    from bankofai.x402.encoding import decode_payment_payload
+    from bankofai.x402.types import SettleResponse
+
+    server = MagicMock()
+    server.build_payment_requirements_with_expiry = AsyncMock(
+        side_effect=lambda configs: (["req"], None)
+    )
+    server.settle_payment = AsyncMock(
+        return_value=SettleResponse(success=True, network="tron:shasta")
+    )
+    mw = middleware.X402Middleware(server)
+    app = FastAPI()
+
+    @app.get("/paid")
+    @mw.protect(prices=["1 USDT"], schemes=["exact_permit"], network="tron:shasta", pay_to="TPayTo")
+    async def paid(request: Request):
+        return JSONResponse({"ok": True}) if raw_response else {"ok": True}
+
+    response = TestClient(app).get(
+        "/paid", headers={middleware.PAYMENT_SIGNATURE_HEADER: _encoded_payload("1")}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+    header = decode_payment_payload(response.headers[middleware.PAYMENT_RESPONSE_HEADER])
+    assert header["success"] is True
+    assert header["network"] == "tron:shasta"
+
+
+def test_payment_required_response_body_and_header_agree():
+    """The 402 body is valid JSON matching the PAYMENT-REQUIRED header"""
+    from unittest.mock import AsyncMock
+
+    from fastapi import FastAPI, Request
+    from fastapi.testclient import TestClient
+
+    from bankofai.x402.encoding import decode_payment_payload
+    from bankofai.x402.server import X402Server
+
+    requirement = PaymentRequirements(
+        scheme="exact_permit",
+        network="tron:shasta",
+        amount="1000000",
+        asset="TG3XXyExBkPp9nzdajDZsozEu4BkaSJozs",
+        payTo="TPayTo",
+    )
+    server = X402Server(auto_register_tron=False)
+    server.build_payment_requirements_with_expiry = AsyncMock(return_value=([requirement], None))
+    mw = middleware.X402Middleware(server)
+    app = FastAPI()
+
+    @app.get("/paid")
+    @mw.protect(prices=["1 USDT"], schemes=["exact_permit"], network="tron:shasta", pay_to="TPayTo")
+    async def paid(request: Request):
+        return {"ok": True}
+
+    client = TestClient(app)
+    response = client.get("/paid")
+
+    assert response.status_code == 402
+    body = response.json()
+    assert body["accepts"][0]["payTo"] == "TPayTo"
+    assert decode_payment_payload(response.headers[middleware.PAYMENT_REQUIRED_HEADER]) == body
+
+    # Each 402 carries its own payment id and nonce
+    context = body["extensions"]["paymentPermitContext"]["meta"]
+    again = client.get("/paid").json()["extensions"]["paymentPermitContext"]["meta"]
+    assert again["paymentId"] != context["paymentId"]
+    assert again["nonce"] != context["nonce"]
+
+
+@pytest.mark.asyncio
+async def test_server_reports_earliest_fee_quote_expiry():
+    """build_payment_requirements_with_expiry returns the earliest quote expiry"""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from bankofai.x402.server import ResourceConfig, X402Server
+    from bankofai.x402.types import FeeInfo, FeeQuoteResponse
+
+    async def fee_quote(requirements):
+        return [
+            FeeQuoteResponse(
+                fee=FeeInfo(feeTo="TFee", feeAmount="1"),
+                pricing="per_accepts",
+                scheme=req.scheme,
+                network=req.network,
+                asset=req.asset,
+                expiresAt=expires_at,
+            )
+            for req, expires_at in zip(requirements, (2000, 1000))
+        ]
+
+    facilitator = MagicMock(facilitator_id="f1")
+    facilitator.fee_quote = AsyncMock(side_effect=fee_quote)
+    server = X402Server().set_facilitator(facilitator)
+    configs = [
+        ResourceConfig(scheme="exact_permit", network="tron:mainnet", price=price, pay_to="T")
+        for price in ("1 USDT", "1 USDD")
+    ]
+
+    requirements, expires_at = await server.build_payment_requirements_with_expiry(configs)
+
+    assert len(requirements) == 2
+    assert expires_at == 1000
+    assert await server.build_payment_requirements(configs) == requirements
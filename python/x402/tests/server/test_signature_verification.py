@@ -196,3 +196,78 @@ async def test_verify_payment_payload_mismatch(mock_server, sample_permit, sampl
 
     # Signature verification should not be called
     mock_mechanism.verify_signature.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_verify_payment_caches_valid_signature(
+    mock_server, sample_permit, sample_requirements
+):
+    """Test that a verified signature is not re-checked, but facilitator verify still runs"""
+    mock_mechanism = MagicMock()
+    mock_mechanism.scheme.return_value = "exact_permit"
+    mock_mechanism.verify_signature = AsyncMock(side_effect=[True, False])
+    mock_server.register("tron:shasta", mock_mechanism)
+
+    mock_facilitator = MagicMock()
+    mock_facilitator.facilitator_id = "test_facilitator"
+    mock_facilitator.verify = AsyncMock(return_value=VerifyResponse(isValid=True))
+    mock_server.set_facilitator(mock_facilitator)
+
+    def payload_for(permit, signature):
+        return PaymentPayload(
+            x402Version=2,
+            payload=PaymentPayloadData(paymentPermit=permit, signature=signature),
+            accepted=sample_requirements,
+        )
+
+    payload = payload_for(sample_permit, "0xvalidsignature")
+    assert (await mock_server.verify_payment(payload, sample_requirements)).is_valid
+    assert (await mock_server.verify_payment(payload, sample_requirements)).is_valid
+    assert mock_mechanism.verify_signature.await_count == 1
+    assert mock_facilitator.verify.await_count == 2
+
+    # A different signature over the same permit is verified again
+    forged = payload_for(sample_permit, "0xforgedsignature")
+    result = await mock_server.verify_payment(forged, sample_requirements)
+    assert result.invalid_reason == "invalid_signature_server"
+    assert mock_mechanism.verify_signature.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_verify_payments_runs_concurrently(mock_server, sample_permit, sample_requirements):
+    """Test that batch verification checks every payload concurrently, preserving order"""
+    import asyncio
+
+    started = 0
+    all_started = asyncio.Event()
+
+    async def verify_signature(permit, signature, network):
+        nonlocal started
+        started += 1
+        if started == 2:
+            all_started.set()
+        await asyncio.wait_for(all_started.wait(), timeout=1)
+        return signature == "0xgood"
+
+    mock_mechanism = MagicMock()
+    mock_mechanism.scheme.return_value = "exact_permit"
+    mock_mechanism.verify_signature = verify_signature
+    mock_server.register("tron:shasta", mock_mechanism)
+
+    mock_facilitator = MagicMock()
+    mock_facilitator.facilitator_id = "test_facilitator"
+    mock_facilitator.verify = AsyncMock(return_value=VerifyResponse(isValid=True))
+    mock_server.set_facilitator(mock_facilitator)
+
+    def payload_for(signature):
+        return PaymentPayload(
+            x402Version=2,
+            payload=PaymentPayloadData(paymentPermit=sample_permit, signature=signature),
+            accepted=sample_requirements,
+        )
+
+    results = await mock_server.verify_payments(
+        [(payload_for("0xgood"), sample_requirements), (payload_for("0xbad"), sample_requirements)]
+    )
+
+    assert [r.is_valid for r in results] == [True, False]